@@ -0,0 +1,32 @@
+"""Rutas API de administración (requieren X-Admin-Token = ADMIN_TOKEN)"""
+import hmac
+
+from fastapi import APIRouter, Depends, Header
+
+from app.domain import error_messages as msg
+from app.domain.exceptions import PermisosDenegadosException
+from app.domain.schemas.partidos import PartidoEliminacionLoteSchema, PartidoEliminacionLoteResponseSchema
+from app.domain.services.service_delegator import get_service_delegator
+from app.infra.database.database import database_client
+from app.utils.config import settings
+
+
+def verificar_token_admin(x_admin_token: str = Header(...)) -> None:
+    """Valida el header X-Admin-Token contra ADMIN_TOKEN (sin ADMIN_TOKEN no acepta ninguno)"""
+    if not settings.ADMIN_TOKEN or not hmac.compare_digest(
+        x_admin_token.encode(), settings.ADMIN_TOKEN.encode()
+    ):
+        raise PermisosDenegadosException(msg.PERMISO_ADMIN_INVALIDO)
+
+
+router = APIRouter(prefix="/admin", tags=["Admin"], dependencies=[Depends(verificar_token_admin)])
+
+# Obtener delegador de servicios
+service_delegator = get_service_delegator(database_client)
+
+
+@router.post("/partidos/purgar", response_model=PartidoEliminacionLoteResponseSchema)
+def purgar_partidos(eliminacion: PartidoEliminacionLoteSchema):
+    """Elimina varios partidos sin validar organizador ni anticipación (p.ej. spam)"""
+    service = service_delegator.get_partido_service()
+    return service.purgar(eliminacion.partido_ids)
@@ -1,7 +1,10 @@
 """Router para health checks"""
 from fastapi import APIRouter
+from fastapi.responses import JSONResponse
 
-from app.domain.schemas.check import HealthCheckResponse
+from app.domain.schemas.check import HealthCheckResponse, ReadinessResponse
+from app.infra.database.database import database_client
+from app.infra.database.diagnostico import verificar_datasource
 from app.utils.config import settings
 
 router = APIRouter(tags=["Health Check"])
@@ -14,4 +17,33 @@ def health_check():
         "status": "ok",
         "service": "me-falta-uno-api",
         "version": settings.API_VERSION
-    }
\ No newline at end of file
+    }
+
+
+@router.get("/health/live", response_model=HealthCheckResponse)
+def liveness_check():
+    """Liveness: el proceso responde (no consulta dependencias)"""
+    return health_check()
+
+
+@router.get(
+    "/health/ready",
+    response_model=ReadinessResponse,
+    responses={503: {"model": ReadinessResponse}},
+)
+def readiness_check():
+    """
+    Readiness: estado del pool y SELECT 1 cronometrado por datasource.
+    Responde 503 si algún datasource no responde o tiene el pool saturado,
+    para que el balanceador deje de enviarle tráfico a la instancia.
+    """
+    datasources = {
+        key: verificar_datasource(database_client, key)
+        for key in database_client.get_keys()
+    }
+    listo = all(estado["ok"] for estado in datasources.values())
+
+    contenido = {"status": "ok" if listo else "degradado", "datasources": datasources}
+    if not listo:
+        return JSONResponse(status_code=503, content=contenido)
+    return contenido
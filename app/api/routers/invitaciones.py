@@ -1,10 +1,12 @@
 """Rutas API para Invitaciones"""
-from fastapi import APIRouter, Query
-from typing import List
+from fastapi import APIRouter, Query, Response
+from typing import List, Optional
 
 from app.domain.schemas.invitaciones import InvitacionResponseSchema, EstadoInvitacion
 from app.domain.services.service_delegator import get_service_delegator
 from app.infra.database.database import database_client
+from app.utils.constants import LIMITE_PAGINA_DEFECTO, LIMITE_PAGINA_MAXIMO
+from app.utils.paginacion import HEADER_SIGUIENTE_CURSOR
 
 router = APIRouter(prefix="/invitaciones", tags=["Invitaciones"])
 
@@ -13,10 +15,23 @@ service_delegator = get_service_delegator(database_client)
 
 
 @router.get("/usuarios/{usuario_id}", response_model=List[InvitacionResponseSchema])
-def obtener_invitaciones(usuario_id: int):
-    """Obtiene las invitaciones pendientes de un usuario"""
+def obtener_invitaciones(
+    usuario_id: int,
+    response: Response,
+    cursor: Optional[str] = Query(None),
+    limit: int = Query(LIMITE_PAGINA_DEFECTO, ge=1, le=LIMITE_PAGINA_MAXIMO),
+):
+    """
+    Obtiene las invitaciones pendientes de un usuario, las más recientes primero.
+    Si hay más resultados, el header X-Next-Cursor trae el cursor de la página siguiente.
+    """
     service = service_delegator.get_invitacion_service()
-    return service.obtener_por_usuario(usuario_id, EstadoInvitacion.PENDIENTE)
+    invitaciones, siguiente_cursor = service.obtener_por_usuario(
+        usuario_id, EstadoInvitacion.PENDIENTE, cursor=cursor, limite=limit
+    )
+    if siguiente_cursor:
+        response.headers[HEADER_SIGUIENTE_CURSOR] = siguiente_cursor
+    return invitaciones
 
 
 @router.post("/{invitacion_id}/responder")
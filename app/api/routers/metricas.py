@@ -0,0 +1,49 @@
+"""Router y middleware de métricas (formato de texto de Prometheus)"""
+import time
+
+from fastapi import APIRouter, Request
+from fastapi.responses import PlainTextResponse
+from starlette.routing import Match
+
+from app.infra.metrics.metrics import duracion_requests, registro
+
+router = APIRouter(tags=["Métricas"])
+
+CONTENT_TYPE_PROMETHEUS = "text/plain; version=0.0.4"
+
+
+@router.get("/metrics", response_class=PlainTextResponse, include_in_schema=False)
+def metricas():
+    """Expone las métricas de la aplicación para Prometheus"""
+    return PlainTextResponse(registro.exponer(), media_type=CONTENT_TYPE_PROMETHEUS)
+
+
+def configurar_metricas(app):
+    """
+    Registra un middleware que mide la latencia de cada request.
+    Se etiqueta con el path de la ruta (p.ej. /partidos/{partido_id}) y no con
+    la URL, para no generar una serie por cada ID.
+    """
+
+    def ruta_de(request: Request) -> str:
+        for ruta in app.router.routes:
+            coincidencia, _ = ruta.matches(request.scope)
+            if coincidencia == Match.FULL:
+                return ruta.path
+        return "sin_ruta"
+
+    @app.middleware("http")
+    async def medir_latencia(request: Request, call_next):
+        inicio = time.perf_counter()
+        status = 500
+        try:
+            response = await call_next(request)
+            status = response.status_code
+            return response
+        finally:
+            duracion_requests.observar(
+                time.perf_counter() - inicio,
+                method=request.method,
+                route=ruta_de(request),
+                status=str(status),
+            )
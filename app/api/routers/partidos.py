@@ -1,18 +1,24 @@
 """Rutas API para Partidos"""
-from fastapi import APIRouter, Query
+from fastapi import APIRouter, Header, Query, Response
 from typing import List, Optional
 from datetime import datetime
 
+from app.domain.schemas.invitaciones import InvitacionLoteSchema, InvitacionLoteResponseSchema
 from app.domain.schemas.partidos import (
     PartidoCreateSchema,
     PartidoUpdateSchema,
     PartidoResponseSchema,
     PartidoBusquedaResponseSchema,
     PartidoDetalleResponseSchema,
+    PartidoEliminacionLoteSchema,
+    PartidoEliminacionLoteResponseSchema,
     TipoFutbol,
 )
 from app.domain.services.service_delegator import get_service_delegator
 from app.infra.database.database import database_client
+from app.utils.constants import LIMITE_PAGINA_DEFECTO, LIMITE_PAGINA_MAXIMO
+from app.utils.etag import HEADER_ETAG, etag_coincide, generar_etag
+from app.utils.paginacion import HEADER_SIGUIENTE_CURSOR
 
 router = APIRouter(prefix="/partidos", tags=["Partidos"])
 
@@ -71,8 +77,16 @@ def eliminar_partido(partido_id: int, organizador_id: int = Query(...)):
     return service.eliminar(partido_id, organizador_id)
 
 
+@router.post("/eliminar-lote", response_model=PartidoEliminacionLoteResponseSchema)
+def eliminar_partidos(eliminacion: PartidoEliminacionLoteSchema, organizador_id: int = Query(...)):
+    """Elimina varios partidos del organizador; informa las filas borradas por tabla"""
+    service = service_delegator.get_partido_service()
+    return service.eliminar_lote(eliminacion.partido_ids, organizador_id)
+
+
 @router.get("/buscar", response_model=List[PartidoBusquedaResponseSchema])
 def buscar_partidos(
+    response: Response,
     usuario_id: int = Query(...),
     titulo: Optional[str] = Query(None),
     fecha_desde: Optional[datetime] = Query(None),
@@ -80,10 +94,15 @@ def buscar_partidos(
     distancia_maxima_km: float = Query(5.0, ge=0.1, le=50),
     tipo_futbol: Optional[TipoFutbol] = Query(None),
     edad_minima: Optional[int] = Query(None, ge=16, le=99),
+    cursor: Optional[str] = Query(None),
+    limit: int = Query(LIMITE_PAGINA_DEFECTO, ge=1, le=LIMITE_PAGINA_MAXIMO),
 ):
-    """Busca partidos disponibles"""
+    """
+    Busca partidos disponibles ordenados por distancia.
+    Si hay más resultados, el header X-Next-Cursor trae el cursor de la página siguiente.
+    """
     service = service_delegator.get_partido_service()
-    return service.buscar(
+    partidos, siguiente_cursor = service.buscar(
         usuario_id=usuario_id,
         titulo=titulo,
         fecha_desde=fecha_desde,
@@ -91,14 +110,36 @@ def buscar_partidos(
         distancia_maxima_km=distancia_maxima_km,
         tipo_futbol=tipo_futbol,
         edad_minima=edad_minima,
+        cursor=cursor,
+        limite=limit,
     )
+    if siguiente_cursor:
+        response.headers[HEADER_SIGUIENTE_CURSOR] = siguiente_cursor
+    return partidos
 
 
 @router.get("/{partido_id}", response_model=PartidoDetalleResponseSchema)
-def ver_detalle_partido(partido_id: int, usuario_id: int = Query(...)):
-    """Obtiene el detalle completo de un partido"""
+def ver_detalle_partido(
+    partido_id: int,
+    response: Response,
+    usuario_id: int = Query(...),
+    if_none_match: Optional[str] = Header(None),
+):
+    """
+    Obtiene el detalle completo de un partido.
+    Devuelve un ETag; con If-None-Match y sin cambios responde 304 sin cuerpo.
+    """
     service = service_delegator.get_partido_service()
-    return service.obtener_detalle(partido_id, usuario_id)
+    if if_none_match:
+        etag = generar_etag("partido", partido_id, *service.obtener_version_detalle(partido_id, usuario_id))
+        if etag_coincide(if_none_match, etag):
+            return Response(status_code=304, headers={HEADER_ETAG: etag})
+
+    partido = service.obtener_detalle(partido_id, usuario_id)
+    response.headers[HEADER_ETAG] = generar_etag(
+        "partido", partido_id, partido["version"], partido["version_usuarios"]
+    )
+    return partido
 
 
 @router.post("/{partido_id}/postularse")
@@ -141,4 +182,15 @@ def invitar_jugador(
 ):
     """Invita un jugador a un partido"""
     service = service_delegator.get_partido_service()
-    return service.invitar_jugador(partido_id, jugador_id, organizador_id)
\ No newline at end of file
+    return service.invitar_jugador(partido_id, jugador_id, organizador_id)
+
+
+@router.post("/{partido_id}/invitar-lote", response_model=InvitacionLoteResponseSchema)
+def invitar_jugadores(
+    partido_id: int,
+    invitacion: InvitacionLoteSchema,
+    organizador_id: int = Query(...),
+):
+    """Invita varios jugadores a un partido; devuelve el resultado por jugador"""
+    service = service_delegator.get_partido_service()
+    return service.invitar_jugadores(partido_id, invitacion.jugador_ids, organizador_id)
@@ -0,0 +1,32 @@
+"""Middleware de unidad de trabajo por request"""
+from fastapi import Request
+from starlette.concurrency import run_in_threadpool
+
+from app.infra.database.database_service import DatabaseConnection
+from app.infra.database.unit_of_work import UnitOfWork
+
+
+def configurar_unidad_de_trabajo(app, database_client: DatabaseConnection):
+    """
+    Registra un middleware que abre una unidad de trabajo por request.
+    Todos los repositorios del request comparten la misma sesión; se confirma
+    una sola vez si la respuesta es exitosa y se revierte en caso de error.
+    """
+
+    @app.middleware("http")
+    async def unidad_de_trabajo_por_request(request: Request, call_next):
+        unidad = UnitOfWork(database_client)
+        try:
+            with unidad.activar():
+                response = await call_next(request)
+
+            if response.status_code < 400:
+                await run_in_threadpool(unidad.commit)
+            else:
+                await run_in_threadpool(unidad.rollback)
+            return response
+        except Exception:
+            await run_in_threadpool(unidad.rollback)
+            raise
+        finally:
+            await run_in_threadpool(unidad.close)
@@ -1,5 +1,5 @@
 """Rutas API para Usuarios"""
-from fastapi import APIRouter, Query
+from fastapi import APIRouter, Header, Query, Response
 from typing import List, Optional
 from datetime import datetime
 
@@ -10,9 +10,12 @@ from app.domain.schemas.usuarios import (
     Genero,
     Posicion,
 )
-from app.domain.schemas.partidos import PartidoCalendarioResponseSchema
+from app.domain.schemas.partidos import PartidoCalendarioResponseSchema, PartidoHistorialResponseSchema
 from app.domain.services.service_delegator import get_service_delegator
 from app.infra.database.database import database_client
+from app.utils.constants import LIMITE_PAGINA_DEFECTO, LIMITE_PAGINA_MAXIMO
+from app.utils.etag import HEADER_ETAG, etag_coincide, generar_etag
+from app.utils.paginacion import HEADER_SIGUIENTE_CURSOR
 
 router = APIRouter(prefix="/usuarios", tags=["Usuarios"])
 
@@ -26,24 +29,33 @@ service_delegator = get_service_delegator(database_client)
 
 @router.get("/buscar-disponibles", response_model=List[JugadorDisponibleResponseSchema])
 def buscar_jugadores_disponibles(
+    response: Response,
     organizador_id: int = Query(..., description="ID del organizador que busca jugadores"),
     genero: Optional[Genero] = Query(None, description="Filtrar por género"),
     posicion: Optional[Posicion] = Query(None, description="Filtrar por posición"),
     ubicacion_texto: Optional[str] = Query(None, description="Filtrar por texto de ubicación"),
     distancia_maxima_km: float = Query(10.0, ge=0.1, le=100, description="Distancia máxima en km"),
+    cursor: Optional[str] = Query(None, description="Cursor de la página siguiente (header X-Next-Cursor)"),
+    limit: int = Query(LIMITE_PAGINA_DEFECTO, ge=1, le=LIMITE_PAGINA_MAXIMO, description="Cantidad máxima de jugadores"),
 ):
     """
     Busca jugadores disponibles que estén postulados para ser invitados a partidos.
     Retorna lista de jugadores ordenados por distancia (más cercanos primero).
+    Si hay más resultados, el header X-Next-Cursor trae el cursor de la página siguiente.
     """
     service = service_delegator.get_usuario_service()
-    return service.buscar_jugadores_disponibles(
+    jugadores, siguiente_cursor = service.buscar_jugadores_disponibles(
         organizador_id=organizador_id,
         genero=genero,
         posicion=posicion,
         ubicacion_texto=ubicacion_texto,
         distancia_maxima_km=distancia_maxima_km,
+        cursor=cursor,
+        limite=limit,
     )
+    if siguiente_cursor:
+        response.headers[HEADER_SIGUIENTE_CURSOR] = siguiente_cursor
+    return jugadores
 
 
 # ============================================
@@ -51,10 +63,20 @@ def buscar_jugadores_disponibles(
 # ============================================
 
 @router.get("/{usuario_id}", response_model=UsuarioResponseSchema)
-def obtener_perfil(usuario_id: int):
-    """Obtiene el perfil completo de un usuario"""
+def obtener_perfil(usuario_id: int, response: Response, if_none_match: Optional[str] = Header(None)):
+    """
+    Obtiene el perfil completo de un usuario.
+    Devuelve un ETag; con If-None-Match y sin cambios responde 304 sin cuerpo.
+    """
     service = service_delegator.get_usuario_service()
-    return service.obtener_perfil(usuario_id)
+    if if_none_match:
+        etag = generar_etag("usuario", usuario_id, *service.obtener_version_perfil(usuario_id))
+        if etag_coincide(if_none_match, etag):
+            return Response(status_code=304, headers={HEADER_ETAG: etag})
+
+    usuario = service.obtener_perfil(usuario_id)
+    response.headers[HEADER_ETAG] = generar_etag("usuario", usuario_id, usuario["version"], usuario["edad"])
+    return usuario
 
 
 @router.put("/{usuario_id}", response_model=UsuarioResponseSchema)
@@ -89,6 +111,25 @@ def obtener_calendario(
     return service.obtener_calendario(usuario_id, fecha_desde, fecha_hasta)
 
 
+@router.get("/{usuario_id}/historial", response_model=List[PartidoHistorialResponseSchema])
+def obtener_historial(
+    usuario_id: int,
+    response: Response,
+    cursor: Optional[str] = Query(None),
+    limit: int = Query(LIMITE_PAGINA_DEFECTO, ge=1, le=LIMITE_PAGINA_MAXIMO),
+):
+    """
+    Obtiene los partidos jugados por un usuario, los más recientes primero
+    (incluye los archivados). Si hay más resultados, el header X-Next-Cursor
+    trae el cursor de la página siguiente.
+    """
+    service = service_delegator.get_usuario_service()
+    partidos, siguiente_cursor = service.obtener_historial(usuario_id, cursor=cursor, limite=limit)
+    if siguiente_cursor:
+        response.headers[HEADER_SIGUIENTE_CURSOR] = siguiente_cursor
+    return partidos
+
+
 @router.post("/{usuario_id}/postulacion")
 def actualizar_postulacion(
     usuario_id: int,
@@ -1,10 +1,21 @@
 """Entry point de la aplicación"""
+import asyncio
+
+from anyio import to_thread
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 
-from app.api.routers import check, partidos, usuarios, invitaciones
+from app.api.routers import admin, check, metricas, partidos, usuarios, invitaciones
 from app.api.routers.exception_handler import configurar_exception_handlers
+from app.api.routers.metricas import configurar_metricas
+from app.api.routers.unit_of_work import configurar_unidad_de_trabajo
+from app.infra.database.ciclo_partidos import CicloPartidos, ejecutar_periodicamente
+from app.infra.database.database import database_client
+from app.infra.database.diagnostico import reporte_dimensionamiento
+from app.infra.database.repositories.partidos import PartidoRepository
 from app.utils.config import settings
+from app.utils.etag import HEADER_ETAG
+from app.utils.paginacion import HEADER_SIGUIENTE_CURSOR
 
 # Crear aplicación
 app = FastAPI(
@@ -20,16 +31,55 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=[HEADER_SIGUIENTE_CURSOR, HEADER_ETAG],
 )
 
 # Configurar manejadores de excepciones
 configurar_exception_handlers(app)
 
+# Una sesión y una transacción por request
+configurar_unidad_de_trabajo(app, database_client)
+
+# Latencia por ruta (externo a la unidad de trabajo: incluye el commit)
+configurar_metricas(app)
+
 # Registrar routers
 app.include_router(check.router)
+app.include_router(metricas.router)
 app.include_router(partidos.router)
 app.include_router(usuarios.router)
 app.include_router(invitaciones.router)
+if settings.ADMIN_TOKEN:
+    app.include_router(admin.router)
+
+
+@app.on_event("startup")
+def dimensionar_threadpool():
+    """Ajusta el threadpool de endpoints síncronos y advierte si el pool no alcanza"""
+    to_thread.current_default_thread_limiter().total_tokens = settings.THREADPOOL_SIZE
+    reporte_dimensionamiento(
+        database_client,
+        workers=settings.WEB_CONCURRENCY,
+        hilos=settings.THREADPOOL_SIZE,
+        max_conexiones_servidor=settings.DB_MAX_CONEXIONES_SERVIDOR,
+    )
+
+
+@app.on_event("startup")
+async def iniciar_ciclo_partidos():
+    """Programa el ciclo de vida de partidos dentro del proceso, si está activado"""
+    if settings.CICLO_PARTIDOS_ACTIVO:
+        ciclo = CicloPartidos(PartidoRepository(database_client), lote=settings.CICLO_PARTIDOS_LOTE)
+        app.state.ciclo_partidos = asyncio.create_task(
+            ejecutar_periodicamente(ciclo, settings.CICLO_PARTIDOS_INTERVALO_SEGUNDOS)
+        )
+
+
+@app.on_event("shutdown")
+async def detener_ciclo_partidos():
+    tarea = getattr(app.state, "ciclo_partidos", None)
+    if tarea is not None:
+        tarea.cancel()
 
 
 @app.get("/")
@@ -43,6 +93,7 @@ def root():
             "usuarios": "/usuarios",
             "invitaciones": "/invitaciones",
             "health": "/health",
+            "metricas": "/metrics",
             "documentacion": "/docs",
         },
     }
@@ -41,18 +41,21 @@ INVITACION_YA_PENDIENTE = "El jugador ya tiene una invitación pendiente"
 INVITACION_YA_RESPONDIDA = "Esta invitación ya fue respondida"
 INVITACION_NO_AUTORIZADA = "No puedes responder esta invitación"
 INVITACION_NO_MISMO_JUGADOR = "No puedes invitarte a ti mismo"
+INVITACION_YA_RESPONDIO = "El jugador ya respondió una invitación a este partido"
 
 # ============================================
 # ERRORES DE PERMISOS
 # ============================================
 PERMISO_SOLO_ORGANIZADOR = "Solo el organizador puede realizar esta acción"
 PERMISO_DENEGADO = "No tienes permisos para realizar esta acción"
+PERMISO_ADMIN_INVALIDO = "Token de administración inválido"
 
 # ============================================
 # ERRORES DE VALIDACIÓN
 # ============================================
 CAPACIDAD_INVALIDA = "La capacidad no puede ser menor a los jugadores confirmados"
 ACCION_INVALIDA = "Acción inválida. Debe ser: aprobar, rechazar o expulsar"
+CURSOR_INVALIDO = "El cursor de paginación no es válido"
 
 # ============================================
 # MENSAJES DE ÉXITO
@@ -61,10 +64,12 @@ POSTULACION_ACTIVADA = "Te has postulado correctamente. Ahora aparecerás en las
 POSTULACION_DESACTIVADA = "Te has despostulado. Ya no aparecerás en las búsquedas de jugadores."
 POSTULACION_ENVIADA = "Postulación enviada. Esperando aprobación del organizador"
 INVITACION_ENVIADA = "Invitación enviada a {nombre}"
+INVITACIONES_ENVIADAS = "Invitaciones enviadas: {enviadas} de {total}"
 INVITACION_ACEPTADA = "Invitación aceptada. Te has unido al partido"
 INVITACION_RECHAZADA = "Invitación rechazada"
 PARTICIPACION_APROBADA = "{nombre} ha sido aprobado"
 PARTICIPACION_RECHAZADA = "{nombre} ha sido rechazado"
 PARTICIPACION_EXPULSADA = "{nombre} ha sido expulsado del partido"
 PARTIDO_ELIMINADO = "Partido eliminado correctamente"
+PARTIDOS_ELIMINADOS = "Partidos eliminados: {eliminados} de {total}"
 PARTIDO_SALIDA = "Has salido del partido (estabas {estado})"
\ No newline at end of file
@@ -1,6 +1,7 @@
 """Interface abstracta para repositorio de invitaciones"""
 from abc import ABC, abstractmethod
-from typing import List, Optional, Dict, Any
+from typing import List, Optional, Dict, Any, Tuple
+from datetime import datetime
 
 
 class InvitacionRepositoryInterface(ABC):
@@ -18,9 +19,13 @@ class InvitacionRepositoryInterface(ABC):
 
     @abstractmethod
     def obtener_por_jugador(
-            self, jugador_id: int, estado: Optional[str] = None
+            self,
+            jugador_id: int,
+            estado: Optional[str] = None,
+            cursor: Optional[Tuple[datetime, int]] = None,
+            limite: Optional[int] = None,
     ) -> List[Dict[str, Any]]:
-        """Obtiene todas las invitaciones de un jugador"""
+        """Obtiene las invitaciones de un jugador ordenadas por (fecha_invitacion, id) descendente"""
         pass
 
     @abstractmethod
@@ -29,11 +34,16 @@ class InvitacionRepositoryInterface(ABC):
         pass
 
     @abstractmethod
-    def actualizar(self, invitacion_id: int, invitacion_data: Dict[str, Any]) -> Dict[str, Any]:
-        """Actualiza una invitación"""
+    def obtener_estados_por_jugador(self, partido_id: int, jugador_ids: List[int]) -> Dict[int, str]:
+        """Obtiene el estado de la invitación al partido de cada jugador dado que ya tenga una"""
+        pass
+
+    @abstractmethod
+    def crear_lote(self, partido_id: int, jugador_ids: List[int], fecha_invitacion: datetime) -> Dict[int, int]:
+        """Crea invitaciones pendientes para varios jugadores; devuelve el ID de invitación por jugador"""
         pass
 
     @abstractmethod
-    def eliminar_por_partido(self, partido_id: int) -> int:
-        """Elimina todas las invitaciones de un partido"""
-        pass
\ No newline at end of file
+    def actualizar(self, invitacion_id: int, invitacion_data: Dict[str, Any]) -> Dict[str, Any]:
+        """Actualiza una invitación"""
+        pass
@@ -1,6 +1,6 @@
 """Interface abstracta para repositorio de participaciones"""
 from abc import ABC, abstractmethod
-from typing import List, Optional, Dict, Any
+from typing import List, Optional, Dict, Any, Set
 
 
 class ParticipacionRepositoryInterface(ABC):
@@ -39,11 +39,16 @@ class ParticipacionRepositoryInterface(ABC):
         pass
 
     @abstractmethod
-    def eliminar_por_partido(self, partido_id: int) -> int:
-        """Elimina todas las participaciones de un partido"""
+    def existe_participacion_activa(self, partido_id: int, jugador_id: int) -> bool:
+        """Verifica si existe una participación activa"""
         pass
 
     @abstractmethod
-    def existe_participacion_activa(self, partido_id: int, jugador_id: int) -> bool:
-        """Verifica si existe una participación activa"""
-        pass
\ No newline at end of file
+    def obtener_jugadores_activos(self, partido_id: int, jugador_ids: List[int]) -> Set[int]:
+        """Obtiene los jugadores, entre los dados, con participación activa en el partido"""
+        pass
+
+    @abstractmethod
+    def obtener_partidos_activos(self, jugador_id: int, partido_ids: List[int]) -> Set[int]:
+        """Obtiene los partidos, entre los dados, en los que el jugador tiene participación activa"""
+        pass
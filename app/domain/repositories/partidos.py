@@ -1,6 +1,6 @@
 """Interface abstracta para repositorio de partidos"""
 from abc import ABC, abstractmethod
-from typing import List, Optional, Dict, Any
+from typing import Iterable, List, Optional, Dict, Any, Tuple
 from datetime import datetime
 
 
@@ -17,6 +17,16 @@ class PartidoRepositoryInterface(ABC):
         """Obtiene un partido por ID"""
         pass
 
+    @abstractmethod
+    def obtener_detalle(self, partido_id: int) -> Optional[Dict[str, Any]]:
+        """Obtiene un partido con el nombre del organizador y sus participantes activos"""
+        pass
+
+    @abstractmethod
+    def obtener_version(self, partido_id: int) -> Optional[Dict[str, int]]:
+        """Obtiene la versión del partido y la de los usuarios que nombra su detalle"""
+        pass
+
     @abstractmethod
     def actualizar(self, partido_id: int, partido_data: Dict[str, Any]) -> Dict[str, Any]:
         """Actualiza un partido existente"""
@@ -24,17 +34,65 @@ class PartidoRepositoryInterface(ABC):
 
     @abstractmethod
     def eliminar(self, partido_id: int) -> bool:
-        """Elimina un partido"""
+        """Elimina un partido (participaciones, invitaciones y calificaciones caen en cascada)"""
+        pass
+
+    @abstractmethod
+    def eliminar_lote(
+            self,
+            partido_ids: List[int],
+            organizador_id: Optional[int] = None,
+            fecha_minima: Optional[datetime] = None,
+    ) -> Dict[str, Any]:
+        """Elimina varios partidos en una transacción y cuenta las filas borradas por tabla"""
+        pass
+
+    @abstractmethod
+    def obtener_por_celdas(self, celdas: Iterable[str]) -> List[Dict[str, Any]]:
+        """Obtiene los partidos futuros con cupo de las celdas de geohash dadas (snapshot cacheado)"""
+        pass
+
+    @abstractmethod
+    def obtener_calendario(
+            self,
+            usuario_id: int,
+            fecha_desde: datetime,
+            fecha_hasta: datetime,
+    ) -> List[Dict[str, Any]]:
+        """Obtiene los partidos futuros en los que el usuario está confirmado"""
         pass
 
     @abstractmethod
-    def buscar(
+    def obtener_historial(
             self,
-            titulo: Optional[str] = None,
-            fecha_desde: Optional[datetime] = None,
-            fecha_hasta: Optional[datetime] = None,
-            tipo_futbol: Optional[str] = None,
-            edad_minima: Optional[int] = None,
+            usuario_id: int,
+            cursor: Optional[Tuple[datetime, int]] = None,
+            limite: int = 20,
     ) -> List[Dict[str, Any]]:
-        """Busca partidos según criterios"""
-        pass
\ No newline at end of file
+        """Obtiene los partidos jugados por el usuario (calientes y archivados), los más recientes primero"""
+        pass
+
+    @abstractmethod
+    def finalizar_vencidos(self, hasta: datetime, lote: int = 500) -> int:
+        """Pasa a Finalizado un lote de partidos vencidos y devuelve cuántos cambió"""
+        pass
+
+    @abstractmethod
+    def archivar(self, antes_de: datetime, lote: int = 500) -> Dict[str, int]:
+        """Mueve un lote de partidos terminados a las tablas de archivo y devuelve las filas por tabla"""
+        pass
+
+    @abstractmethod
+    def obtener_rezago(self, hasta_finalizar: datetime, antes_de_archivar: datetime) -> Dict[str, Optional[datetime]]:
+        """Obtiene la fecha del partido más viejo pendiente de finalizar y de archivar"""
+        pass
+
+    @abstractmethod
+    def reconciliar_contadores(self, lote: int = 1000) -> int:
+        """Corrige los contadores confirmados/pendientes desalineados y devuelve cuántos partidos cambió"""
+        pass
+
+    @abstractmethod
+    def reindexar_titulos(self, lote: int = 500) -> int:
+        """Recalcula el título normalizado de todos los partidos"""
+        pass
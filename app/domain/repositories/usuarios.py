@@ -1,6 +1,6 @@
 """Interface abstracta para repositorio de usuarios"""
 from abc import ABC, abstractmethod
-from typing import Optional, Dict, Any
+from typing import List, Optional, Dict, Any
 
 
 class UsuarioRepositoryInterface(ABC):
@@ -11,6 +11,11 @@ class UsuarioRepositoryInterface(ABC):
         """Obtiene un usuario por ID"""
         pass
 
+    @abstractmethod
+    def obtener_version(self, usuario_id: int) -> Optional[Dict[str, int]]:
+        """Obtiene la versión del usuario y su edad, que identifican su perfil"""
+        pass
+
     @abstractmethod
     def actualizar(self, usuario_id: int, usuario_data: Dict[str, Any]) -> Dict[str, Any]:
         """Actualiza un usuario en la base de datos"""
@@ -19,4 +24,33 @@ class UsuarioRepositoryInterface(ABC):
     @abstractmethod
     def actualizar_postulacion(self, usuario_id: int, postulacion: bool) -> None:
         """Actualiza el estado de postulación de un usuario"""
-        pass
\ No newline at end of file
+        pass
+
+    @abstractmethod
+    def buscar_postulados_cercanos(
+            self, latitud: float, longitud: float, radio_km: float
+    ) -> Dict[int, float]:
+        """Obtiene los usuarios postulados dentro del radio con su distancia en km"""
+        pass
+
+
+    @abstractmethod
+    def buscar_postulados(
+            self,
+            ids: List[int],
+            genero: Optional[str] = None,
+            posicion: Optional[str] = None,
+            ubicacion_texto: Optional[str] = None,
+    ) -> List[Dict[str, Any]]:
+        """Obtiene los usuarios postulados entre los IDs dados que cumplen los filtros"""
+        pass
+
+    @abstractmethod
+    def obtener_nombres(self, ids: List[int]) -> Dict[int, str]:
+        """Obtiene el nombre de cada usuario existente entre los IDs dados"""
+        pass
+
+    @abstractmethod
+    def normalizar_ubicaciones(self, lote: int = 1000) -> int:
+        """Recalcula la ubicación normalizada de todos los usuarios"""
+        pass
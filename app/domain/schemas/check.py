@@ -1,4 +1,6 @@
 """Schemas para health checks"""
+from typing import Dict, Optional
+
 from pydantic import BaseModel
 
 
@@ -15,4 +17,23 @@ class HealthCheckResponse(BaseModel):
                 "service": "me-falta-uno-api",
                 "version": "2.0.0"
             }
-        }
\ No newline at end of file
+        }
+
+
+class DatasourceEstadoResponse(BaseModel):
+    """Estado de un datasource: pool de conexiones y latencia de SELECT 1"""
+    pool_size: int
+    max_overflow: int
+    checked_out: int
+    checked_in: int
+    overflow: int
+    saturado: bool
+    ok: bool
+    latencia_ms: Optional[float] = None
+    error: Optional[str] = None
+
+
+class ReadinessResponse(BaseModel):
+    """Schema de respuesta para el readiness check"""
+    status: str
+    datasources: Dict[str, DatasourceEstadoResponse]
@@ -1,7 +1,10 @@
 """Schemas Pydantic para Invitaciones"""
 from datetime import datetime
 from enum import Enum
-from pydantic import BaseModel
+from typing import List, Optional
+from pydantic import BaseModel, Field
+
+from app.utils.constants import MAX_INVITACIONES_LOTE
 
 
 # ============================================
@@ -14,6 +17,24 @@ class EstadoInvitacion(str, Enum):
     RECHAZADA = "Rechazada"
 
 
+class ResultadoInvitacion(str, Enum):
+    INVITADO = "Invitado"
+    JUGADOR_NO_ENCONTRADO = "JugadorNoEncontrado"
+    ES_ORGANIZADOR = "EsOrganizador"
+    YA_PARTICIPA = "YaParticipa"
+    YA_INVITADO = "YaInvitado"
+    YA_RESPONDIO = "YaRespondio"
+
+
+# ============================================
+# REQUEST SCHEMAS
+# ============================================
+
+class InvitacionLoteSchema(BaseModel):
+    """Schema para invitar varios jugadores a un partido"""
+    jugador_ids: List[int] = Field(..., min_items=1, max_items=MAX_INVITACIONES_LOTE)
+
+
 # ============================================
 # RESPONSE SCHEMAS
 # ============================================
@@ -30,4 +51,20 @@ class InvitacionResponseSchema(BaseModel):
     fecha_invitacion: datetime
 
     class Config:
-        from_attributes = True
\ No newline at end of file
+        from_attributes = True
+
+
+class ResultadoInvitacionSchema(BaseModel):
+    """Resultado de la invitación de un jugador dentro de un lote"""
+    jugador_id: int
+    resultado: ResultadoInvitacion
+    invitacion_id: Optional[int] = None
+    mensaje: str
+
+
+class InvitacionLoteResponseSchema(BaseModel):
+    """Schema de respuesta para la invitación en lote"""
+    mensaje: str
+    partido_id: int
+    invitados: int
+    resultados: List[ResultadoInvitacionSchema]
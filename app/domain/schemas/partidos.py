@@ -1,9 +1,11 @@
 """Schemas Pydantic para Partidos"""
-from typing import Optional, List
+from typing import Dict, Optional, List
 from datetime import datetime
 from enum import Enum
 from pydantic import BaseModel, Field
 
+from app.utils.constants import MAX_PARTIDOS_ELIMINACION_LOTE
+
 
 # ============================================
 # ENUMS
@@ -66,6 +68,11 @@ class PartidoUpdateSchema(BaseModel):
     contrasena: Optional[str] = None
 
 
+class PartidoEliminacionLoteSchema(BaseModel):
+    """Schema para eliminar varios partidos"""
+    partido_ids: List[int] = Field(..., min_items=1, max_items=MAX_PARTIDOS_ELIMINACION_LOTE)
+
+
 # ============================================
 # RESPONSE SCHEMAS
 # ============================================
@@ -162,4 +169,29 @@ class PartidoCalendarioResponseSchema(BaseModel):
     tipo_partido: TipoPartido
 
     class Config:
-        from_attributes = True
\ No newline at end of file
+        from_attributes = True
+
+
+class PartidoHistorialResponseSchema(BaseModel):
+    """Schema para partidos del historial de un usuario"""
+    id: int
+    titulo: str
+    fecha_hora: datetime
+    ubicacion_texto: str
+    estado: EstadoPartido
+    tipo_partido: TipoPartido
+    es_organizador: bool
+    jugadores_confirmados: int
+    capacidad_maxima: int
+    archivado: bool
+
+    class Config:
+        from_attributes = True
+
+
+class PartidoEliminacionLoteResponseSchema(BaseModel):
+    """Schema de respuesta para la eliminación en lote"""
+    mensaje: str
+    eliminados: List[int]
+    no_eliminados: List[int]
+    filas_por_tabla: Dict[str, int]
@@ -1,5 +1,5 @@
 """Servicio de dominio para Invitaciones"""
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Optional, Tuple
 from datetime import datetime
 
 from app.domain.repositories.invitaciones import InvitacionRepositoryInterface
@@ -14,6 +14,8 @@ from app.domain.exceptions import (
 from app.domain.schemas.invitaciones import EstadoInvitacion
 from app.domain.schemas.partidos import EstadoParticipacion
 from app.domain import error_messages as msg
+from app.utils.constants import LIMITE_PAGINA_DEFECTO
+from app.utils.paginacion import codificar_cursor, decodificar_cursor
 
 
 class InvitacionService:
@@ -38,17 +40,40 @@ class InvitacionService:
     def obtener_por_usuario(
             self,
             usuario_id: int,
-            estado: EstadoInvitacion = EstadoInvitacion.PENDIENTE
-    ) -> List[Dict[str, Any]]:
-        """Obtiene las invitaciones de un usuario"""
+            estado: EstadoInvitacion = EstadoInvitacion.PENDIENTE,
+            cursor: Optional[str] = None,
+            limite: int = LIMITE_PAGINA_DEFECTO,
+    ) -> Tuple[List[Dict[str, Any]], Optional[str]]:
+        """
+        Obtiene las invitaciones de un usuario, las más recientes primero
+
+        Returns:
+            Tuple: (invitaciones de la página, cursor de la página siguiente o None)
+        """
+        posicion = decodificar_cursor(cursor, 2)
+        if posicion:
+            try:
+                posicion = (datetime.fromisoformat(posicion[0]), int(posicion[1]))
+            except (TypeError, ValueError):
+                raise ValueError(msg.CURSOR_INVALIDO)
 
         # Verificar usuario
         usuario = self.usuario_repo.obtener_por_id(usuario_id)
         if not usuario:
             raise UsuarioNoEncontradoException(msg.USUARIO_NO_ENCONTRADO)
 
-        # Obtener invitaciones
-        return self.invitacion_repo.obtener_por_jugador(usuario_id, estado.value)
+        # Obtener invitaciones (una de más para saber si hay página siguiente)
+        invitaciones = self.invitacion_repo.obtener_por_jugador(
+            usuario_id, estado.value, cursor=posicion, limite=limite + 1
+        )
+
+        siguiente_cursor = None
+        if len(invitaciones) > limite:
+            invitaciones = invitaciones[:limite]
+            ultima = invitaciones[-1]
+            siguiente_cursor = codificar_cursor(ultima['fecha_invitacion'].isoformat(), ultima['id'])
+
+        return invitaciones, siguiente_cursor
 
     # ============================================
     # RESPONDER INVITACIÓN
@@ -86,11 +111,8 @@ class InvitacionService:
             if not partido:
                 raise ValueError(msg.PARTIDO_NO_ENCONTRADO)
 
-            # Verificar cupo
-            confirmados = self.participacion_repo.contar_por_estado(
-                invitacion['partido_id'], EstadoParticipacion.CONFIRMADO.value
-            )
-            if confirmados >= partido['capacidad_maxima']:
+            # Verificar cupo (la reserva atómica la hace el repositorio al confirmar)
+            if partido['confirmados'] >= partido['capacidad_maxima']:
                 raise PartidoCompletoException(msg.PARTIDO_COMPLETO)
 
             # Verificar si ya existe una participación
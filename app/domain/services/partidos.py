@@ -1,11 +1,13 @@
 """Servicio de dominio para Partidos - Todos los casos de uso"""
-from typing import Optional, List, Dict, Any
+import heapq
+from typing import Optional, List, Dict, Any, Tuple
 from datetime import datetime, timedelta
 
 from app.domain.repositories.partidos import PartidoRepositoryInterface
 from app.domain.repositories.usuarios import UsuarioRepositoryInterface
 from app.domain.repositories.participaciones import ParticipacionRepositoryInterface
 from app.domain.repositories.invitaciones import InvitacionRepositoryInterface
+from app.domain.schemas.invitaciones import EstadoInvitacion, ResultadoInvitacion
 from app.domain.schemas.partidos import TipoPartido, EstadoPartido, EstadoParticipacion, TipoFutbol
 from app.domain.exceptions import (
     PartidoNoEncontradoException,
@@ -15,8 +17,19 @@ from app.domain.exceptions import (
     UsuarioNoEncontradoException,
 )
 from app.domain import error_messages as msg
-from app.utils.date_utils import convertir_a_fecha_local, calcular_distancia
-from app.utils.constants import HORAS_MINIMAS_ELIMINAR_PARTIDO
+from app.utils.date_utils import (
+    convertir_a_fecha_local,
+    calcular_distancias,
+    normalizar_texto,
+)
+from app.utils.constants import (
+    HORAS_MINIMAS_ELIMINAR_PARTIDO,
+    LIMITE_PAGINA_DEFECTO,
+    MAX_CELDAS_BUSQUEDA_PARTIDOS,
+    PRECISIONES_GEOHASH_PARTIDOS,
+)
+from app.utils.geohash import celdas_en_radio
+from app.utils.paginacion import codificar_cursor, decodificar_cursor
 
 
 class PartidoService:
@@ -143,9 +156,7 @@ class PartidoService:
             partido['ubicacion_texto'] = ubicacion_texto
 
         if capacidad_maxima is not None:
-            confirmados = self.participacion_repo.contar_por_estado(
-                partido_id, EstadoParticipacion.CONFIRMADO.value
-            )
+            confirmados = partido['confirmados']
             if capacidad_maxima < confirmados:
                 raise ValueError(
                     msg.CAPACIDAD_INVALIDA + f" ({confirmados})"
@@ -186,11 +197,7 @@ class PartidoService:
         if not self._puede_eliminar_partido(partido):
             raise ValueError(msg.PARTIDO_ELIMINAR_TIEMPO)
 
-        # Eliminar participaciones e invitaciones
-        self.participacion_repo.eliminar_por_partido(partido_id)
-        self.invitacion_repo.eliminar_por_partido(partido_id)
-
-        # Eliminar partido
+        # Eliminar partido (participaciones, invitaciones y calificaciones caen en cascada)
         self.partido_repo.eliminar(partido_id)
 
         return {
@@ -198,6 +205,46 @@ class PartidoService:
             "partido_id": partido_id
         }
 
+    def eliminar_lote(self, partido_ids: List[int], organizador_id: int) -> Dict[str, Any]:
+        """
+        Elimina varios partidos del organizador en una transacción. Se omiten
+        los que no existen, no son suyos o faltan menos de 24 horas para jugarse.
+
+        Args:
+            partido_ids: IDs de los partidos a eliminar
+            organizador_id: ID del organizador
+
+        Returns:
+            Dict: Eliminados, no eliminados y filas borradas por tabla
+        """
+        fecha_minima = datetime.now() + timedelta(hours=HORAS_MINIMAS_ELIMINAR_PARTIDO)
+        return self._eliminar_lote(partido_ids, organizador_id=organizador_id, fecha_minima=fecha_minima)
+
+    def purgar(self, partido_ids: List[int]) -> Dict[str, Any]:
+        """
+        Elimina varios partidos sin validar organizador ni anticipación
+        (limpieza administrativa, p.ej. spam)
+
+        Args:
+            partido_ids: IDs de los partidos a eliminar
+
+        Returns:
+            Dict: Eliminados, no eliminados y filas borradas por tabla
+        """
+        return self._eliminar_lote(partido_ids)
+
+    def _eliminar_lote(self, partido_ids: List[int], **filtros) -> Dict[str, Any]:
+        partido_ids = list(dict.fromkeys(partido_ids))
+        resultado = self.partido_repo.eliminar_lote(partido_ids, **filtros)
+        eliminados = set(resultado['partido_ids'])
+
+        return {
+            "mensaje": msg.PARTIDOS_ELIMINADOS.format(eliminados=len(eliminados), total=len(partido_ids)),
+            "eliminados": [partido_id for partido_id in partido_ids if partido_id in eliminados],
+            "no_eliminados": [partido_id for partido_id in partido_ids if partido_id not in eliminados],
+            "filas_por_tabla": resultado['filas_por_tabla'],
+        }
+
     # ============================================
     # BUSCAR PARTIDOS
     # ============================================
@@ -211,114 +258,99 @@ class PartidoService:
         distancia_maxima_km: float = 5.0,
         tipo_futbol: Optional[TipoFutbol] = None,
         edad_minima: Optional[int] = None,
-    ) -> List[Dict[str, Any]]:
-        """Busca partidos disponibles"""
+        cursor: Optional[str] = None,
+        limite: int = LIMITE_PAGINA_DEFECTO,
+    ) -> Tuple[List[Dict[str, Any]], Optional[str]]:
+        """
+        Busca partidos disponibles ordenados por distancia
+
+        Args:
+            cursor: Cursor devuelto por la página anterior (None para la primera)
+            limite: Cantidad máxima de partidos a devolver
+
+        Returns:
+            Tuple: (partidos de la página, cursor de la página siguiente o None)
+        """
+        posicion = decodificar_cursor(cursor, 2)
+        if posicion:
+            try:
+                posicion = (float(posicion[0]), int(posicion[1]))
+            except (TypeError, ValueError):
+                raise ValueError(msg.CURSOR_INVALIDO)
 
         # Obtener usuario
         usuario = self.usuario_repo.obtener_por_id(usuario_id)
         if not usuario:
             raise UsuarioNoEncontradoException(msg.USUARIO_NO_ENCONTRADO)
 
-        # Construir query SQL para buscar partidos
-        from sqlalchemy import text
-
-        sql_parts = [
-            """
-            SELECT DISTINCT
-                p.id, p.titulo, p.dinero_por_persona, p.descripcion,
-                p.fecha_hora, p.latitud, p.longitud, p.ubicacion_texto,
-                p.capacidad_maxima, p.organizador_id, p.tipo_partido,
-                p.tipo_futbol, p.edad_minima, p.estado,
-                (SELECT COUNT(*) FROM participaciones part 
-                 WHERE part.partido_id = p.id AND part.estado = :estado_confirmado) as jugadores_confirmados,
-                (SELECT u.nombre FROM usuarios u WHERE u.id = p.organizador_id) as organizador_nombre
-            FROM partidos p
-            WHERE p.id NOT IN (
-                SELECT pa.partido_id FROM participaciones pa 
-                WHERE pa.jugador_id = :usuario_id 
-                AND pa.estado IN (:estado_confirmado, :estado_pendiente)
-            )
-            AND p.fecha_hora >= NOW()
-            """
+        latitud = float(usuario['latitud'])
+        longitud = float(usuario['longitud'])
+
+        # Partidos abiertos de las celdas que cubren el radio (snapshot compartido),
+        # en la precisión más fina que no requiera demasiadas celdas
+        for precision in PRECISIONES_GEOHASH_PARTIDOS:
+            celdas = celdas_en_radio(latitud, longitud, distancia_maxima_km, precision)
+            if len(celdas) <= MAX_CELDAS_BUSQUEDA_PARTIDOS:
+                break
+        candidatos = self.partido_repo.obtener_por_celdas(celdas)
+
+        # Filtros de la búsqueda; el snapshot puede traer partidos que ya empezaron
+        ahora = datetime.now()
+        if fecha_desde is not None and fecha_desde.tzinfo is not None:
+            fecha_desde = fecha_desde.replace(tzinfo=None)
+        if fecha_hasta is not None and fecha_hasta.tzinfo is not None:
+            fecha_hasta = fecha_hasta.replace(tzinfo=None)
+        titulo_normalizado = normalizar_texto(titulo) if titulo else None
+        tipo = tipo_futbol.value if tipo_futbol else None
+        candidatos = [
+            partido for partido in candidatos
+            if partido['fecha_hora'] >= ahora
+            and (fecha_desde is None or partido['fecha_hora'] >= fecha_desde)
+            and (fecha_hasta is None or partido['fecha_hora'] <= fecha_hasta)
+            and (tipo is None or partido['tipo_futbol'] == tipo)
+            and (edad_minima is None or partido['edad_minima'] <= edad_minima)
+            and (titulo_normalizado is None or titulo_normalizado in partido['titulo_normalizado'])
         ]
 
-        params = {
-            "usuario_id": usuario_id,
-            "estado_confirmado": EstadoParticipacion.CONFIRMADO.value,
-            "estado_pendiente": EstadoParticipacion.PENDIENTE.value
-        }
-
-        # Agregar filtros opcionales
-        if titulo:
-            sql_parts.append("AND LOWER(p.titulo) LIKE :titulo")
-            params["titulo"] = f"%{titulo.lower()}%"
-
-        if fecha_desde:
-            sql_parts.append("AND p.fecha_hora >= :fecha_desde")
-            params["fecha_desde"] = fecha_desde
-
-        if fecha_hasta:
-            sql_parts.append("AND p.fecha_hora <= :fecha_hasta")
-            params["fecha_hasta"] = fecha_hasta
-
-        if tipo_futbol:
-            sql_parts.append("AND p.tipo_futbol = :tipo_futbol")
-            params["tipo_futbol"] = tipo_futbol.value
+        distancias, dentro = calcular_distancias(
+            latitud,
+            longitud,
+            [partido['latitud'] for partido in candidatos],
+            [partido['longitud'] for partido in candidatos],
+            distancia_maxima_km,
+        )
 
-        if edad_minima is not None:
-            sql_parts.append("AND p.edad_minima <= :edad_minima")
-            params["edad_minima"] = edad_minima
-
-        # Ejecutar query
-        from app.infra.database.database import database_client
-        sql = text(" ".join(sql_parts))
-
-        with database_client.get_session("tt") as db:
-            results = db.execute(sql, params).fetchall()
-
-        # Filtrar por distancia y capacidad
-        partidos_filtrados = []
-        for row in results:
-            # Verificar cupo
-            if row.jugadores_confirmados >= row.capacidad_maxima:
-                continue
-
-            # Calcular distancia
-            distancia = calcular_distancia(
-                float(usuario['latitud']),
-                float(usuario['longitud']),
-                float(row.latitud),
-                float(row.longitud),
+        # Orden (distancia_km, id) a partir del cursor, como heap: solo se
+        # ordena lo que entra en la página, no todos los candidatos
+        orden = [
+            (distancia, partido['id'], indice)
+            for indice, (partido, distancia, en_radio) in enumerate(zip(candidatos, distancias, dentro))
+            if en_radio and (not posicion or (distancia, partido['id']) > posicion)
+        ]
+        heapq.heapify(orden)
+
+        # Sacar los más cercanos por tandas, excluyendo los partidos en los que
+        # el usuario ya participa, hasta llenar la página (+1 para saber si hay más)
+        pagina = []
+        while orden and len(pagina) <= limite:
+            tanda = [heapq.heappop(orden) for _ in range(min(limite + 1 - len(pagina), len(orden)))]
+            participando = self.participacion_repo.obtener_partidos_activos(
+                usuario_id, [partido_id for _, partido_id, _ in tanda]
             )
+            pagina.extend(clave for clave in tanda if clave[1] not in participando)
 
-            if distancia > distancia_maxima_km:
-                continue
-
-            partidos_filtrados.append({
-                "id": row.id,
-                "titulo": row.titulo,
-                "dinero_por_persona": row.dinero_por_persona,
-                "descripcion": row.descripcion,
-                "fecha_hora": row.fecha_hora,
-                "latitud": row.latitud,
-                "longitud": row.longitud,
-                "ubicacion_texto": row.ubicacion_texto,
-                "capacidad_maxima": row.capacidad_maxima,
-                "jugadores_confirmados": row.jugadores_confirmados,
-                "organizador_id": row.organizador_id,
-                "organizador_nombre": row.organizador_nombre,
-                "tipo_partido": row.tipo_partido,
-                "tipo_futbol": row.tipo_futbol,
-                "edad_minima": row.edad_minima,
-                "estado": row.estado,
-                "tiene_cupo": True,
-                "distancia_km": distancia,
-            })
+        partidos = [
+            {**candidatos[indice], "distancia_km": distancia}
+            for distancia, _, indice in pagina
+        ]
 
-        # Ordenar por distancia
-        partidos_filtrados.sort(key=lambda x: x["distancia_km"])
+        siguiente_cursor = None
+        if len(partidos) > limite:
+            partidos = partidos[:limite]
+            ultimo = partidos[-1]
+            siguiente_cursor = codificar_cursor(ultimo["distancia_km"], ultimo["id"])
 
-        return partidos_filtrados
+        return [{**partido, "tiene_cupo": True} for partido in partidos], siguiente_cursor
 
     # ============================================
     # VER DETALLE PARTIDO
@@ -332,51 +364,46 @@ class PartidoService:
         if not usuario:
             raise UsuarioNoEncontradoException(msg.USUARIO_NO_ENCONTRADO)
 
-        # Obtener partido
-        partido = self.partido_repo.obtener_por_id(partido_id)
+        # Obtener partido, organizador y participantes activos
+        partido = self.partido_repo.obtener_detalle(partido_id)
         if not partido:
             raise PartidoNoEncontradoException(msg.PARTIDO_NO_ENCONTRADO)
 
-        # Obtener participantes
-        participaciones = self.participacion_repo.obtener_por_partido(partido_id)
-
-        # Filtrar solo confirmados y pendientes
-        participantes = [
-            p for p in participaciones
-            if p['estado'] in [
-                EstadoParticipacion.CONFIRMADO.value,
-                EstadoParticipacion.PENDIENTE.value
-            ]
-        ]
-
-        # Ordenar: confirmados primero
-        participantes.sort(
-            key=lambda x: (
-                x["estado"] != EstadoParticipacion.CONFIRMADO.value,
-                x["fecha_postulacion"],
-            )
+        # Contar participantes (la lista ya viene ordenada, confirmados primero)
+        participantes = partido['participantes']
+        confirmados = sum(
+            1 for p in participantes if p['estado'] == EstadoParticipacion.CONFIRMADO.value
         )
-
-        # Contar participantes
-        confirmados = self.participacion_repo.contar_por_estado(
-            partido_id, EstadoParticipacion.CONFIRMADO.value
-        )
-        pendientes = self.participacion_repo.contar_por_estado(
-            partido_id, EstadoParticipacion.PENDIENTE.value
-        )
-
-        # Obtener organizador
-        organizador = self.usuario_repo.obtener_por_id(partido['organizador_id'])
+        pendientes = len(participantes) - confirmados
 
         return {
             **partido,
             "jugadores_confirmados": confirmados,
             "jugadores_pendientes": pendientes,
-            "organizador_nombre": organizador['nombre'] if organizador else "Desconocido",
+            "organizador_nombre": partido['organizador_nombre'] or "Desconocido",
             "tiene_cupo": confirmados < partido['capacidad_maxima'],
-            "participantes": participantes,
         }
 
+    def obtener_version_detalle(self, partido_id: int, usuario_id: int) -> Tuple[int, int]:
+        """
+        Obtiene las versiones que identifican el detalle de un partido, sin
+        cargarlo (para responder GET condicionales)
+
+        Returns:
+            Tuple: (versión del partido, versión de los usuarios que nombra)
+        """
+
+        # Verificar usuario
+        usuario = self.usuario_repo.obtener_por_id(usuario_id)
+        if not usuario:
+            raise UsuarioNoEncontradoException(msg.USUARIO_NO_ENCONTRADO)
+
+        version = self.partido_repo.obtener_version(partido_id)
+        if not version:
+            raise PartidoNoEncontradoException(msg.PARTIDO_NO_ENCONTRADO)
+
+        return version['version'], version['version_usuarios']
+
     # ============================================
     # POSTULARSE A PARTIDO
     # ============================================
@@ -415,10 +442,8 @@ class PartidoService:
             if contrasena != partido['contrasena']:
                 raise ContrasenaIncorrectaException(msg.PARTIDO_CONTRASENA_INCORRECTA)
 
-        # Validar cupo
-        confirmados = self.participacion_repo.contar_por_estado(
-            partido_id, EstadoParticipacion.CONFIRMADO.value
-        )
+        # Validar cupo (el repositorio lo vuelve a verificar de forma atómica al reservar)
+        confirmados = partido['confirmados']
         if confirmados >= partido['capacidad_maxima']:
             raise PartidoCompletoException(msg.PARTIDO_COMPLETO)
 
@@ -431,10 +456,8 @@ class PartidoService:
         }
         self.participacion_repo.crear(participacion_data)
 
-        # Contar pendientes
-        pendientes = self.participacion_repo.contar_por_estado(
-            partido_id, EstadoParticipacion.PENDIENTE.value
-        )
+        # La nueva participación suma un pendiente
+        pendientes = partido['pendientes'] + 1
 
         return {
             "mensaje": msg.POSTULACION_ENVIADA,
@@ -492,11 +515,8 @@ class PartidoService:
         if participacion['estado'] != EstadoParticipacion.PENDIENTE.value:
             raise ValueError(msg.PARTICIPACION_SOLO_PENDIENTES_APROBAR)
 
-        # Verificar cupo
-        confirmados = self.participacion_repo.contar_por_estado(
-            partido['id'], EstadoParticipacion.CONFIRMADO.value
-        )
-        if confirmados >= partido['capacidad_maxima']:
+        # Verificar cupo (rápido; la reserva atómica la hace el repositorio al actualizar)
+        if partido['confirmados'] >= partido['capacidad_maxima']:
             raise PartidoCompletoException(msg.PARTIDO_COMPLETO)
 
         # Aprobar
@@ -532,20 +552,13 @@ class PartidoService:
 
     def _generar_respuesta_participacion(self, partido_id: int, mensaje: str) -> Dict[str, Any]:
         """Genera la respuesta con conteos actualizados"""
-        confirmados = self.participacion_repo.contar_por_estado(
-            partido_id, EstadoParticipacion.CONFIRMADO.value
-        )
-        pendientes = self.participacion_repo.contar_por_estado(
-            partido_id, EstadoParticipacion.PENDIENTE.value
-        )
-
         partido = self.partido_repo.obtener_por_id(partido_id)
 
         return {
             "mensaje": mensaje,
             "partido_id": partido_id,
-            "jugadores_confirmados": confirmados,
-            "jugadores_pendientes": pendientes,
+            "jugadores_confirmados": partido['confirmados'],
+            "jugadores_pendientes": partido['pendientes'],
             "capacidad_maxima": partido['capacidad_maxima'],
         }
 
@@ -586,19 +599,14 @@ class PartidoService:
         participacion['estado'] = EstadoParticipacion.CANCELADO.value
         self.participacion_repo.actualizar(participacion['id'], participacion)
 
-        # Contar participantes
-        confirmados = self.participacion_repo.contar_por_estado(
-            partido_id, EstadoParticipacion.CONFIRMADO.value
-        )
-        pendientes = self.participacion_repo.contar_por_estado(
-            partido_id, EstadoParticipacion.PENDIENTE.value
-        )
+        # Contadores actualizados
+        partido = self.partido_repo.obtener_por_id(partido_id)
 
         return {
             "mensaje": msg.PARTIDO_SALIDA.format(estado=estado_anterior),
             "partido_id": partido_id,
-            "jugadores_confirmados": confirmados,
-            "jugadores_pendientes": pendientes,
+            "jugadores_confirmados": partido['confirmados'],
+            "jugadores_pendientes": partido['pendientes'],
         }
 
     # ============================================
@@ -659,6 +667,86 @@ class PartidoService:
             "invitacion_id": invitacion_creada['id'],
         }
 
+    def invitar_jugadores(
+        self,
+        partido_id: int,
+        jugador_ids: List[int],
+        organizador_id: int,
+    ) -> Dict[str, Any]:
+        """
+        Invita varios jugadores a un partido. Las validaciones se hacen con una
+        consulta por chequeo para todo el lote y las invitaciones se crean con
+        un único INSERT; un jugador que no puede ser invitado no frena al resto.
+
+        Args:
+            partido_id: ID del partido
+            jugador_ids: IDs de los jugadores a invitar (los repetidos se ignoran)
+            organizador_id: ID del organizador
+
+        Returns:
+            Dict: Cantidad de invitados y el resultado por jugador, en el orden recibido
+        """
+
+        # Verificar organizador
+        organizador = self.usuario_repo.obtener_por_id(organizador_id)
+        if not organizador:
+            raise UsuarioNoEncontradoException(msg.ORGANIZADOR_NO_ENCONTRADO)
+
+        # Obtener partido
+        partido = self.partido_repo.obtener_por_id(partido_id)
+        if not partido:
+            raise PartidoNoEncontradoException(msg.PARTIDO_NO_ENCONTRADO)
+
+        # Validar permisos
+        self._validar_organizador(partido, organizador_id)
+
+        jugador_ids = list(dict.fromkeys(jugador_ids))
+
+        # Un chequeo por consulta para todo el lote
+        nombres = self.usuario_repo.obtener_nombres(jugador_ids)
+        activos = self.participacion_repo.obtener_jugadores_activos(partido_id, jugador_ids)
+        invitaciones = self.invitacion_repo.obtener_estados_por_jugador(partido_id, jugador_ids)
+
+        rechazos = {}
+        for jugador_id in jugador_ids:
+            if jugador_id not in nombres:
+                rechazos[jugador_id] = (ResultadoInvitacion.JUGADOR_NO_ENCONTRADO, msg.JUGADOR_NO_ENCONTRADO)
+            elif jugador_id == organizador_id:
+                rechazos[jugador_id] = (ResultadoInvitacion.ES_ORGANIZADOR, msg.INVITACION_NO_MISMO_JUGADOR)
+            elif jugador_id in activos:
+                rechazos[jugador_id] = (ResultadoInvitacion.YA_PARTICIPA, msg.PARTICIPACION_YA_EXISTE)
+            elif invitaciones.get(jugador_id) == EstadoInvitacion.PENDIENTE.value:
+                rechazos[jugador_id] = (ResultadoInvitacion.YA_INVITADO, msg.INVITACION_YA_PENDIENTE)
+            elif jugador_id in invitaciones:
+                # UNIQUE (partido_id, jugador_id): no se puede volver a invitar
+                rechazos[jugador_id] = (ResultadoInvitacion.YA_RESPONDIO, msg.INVITACION_YA_RESPONDIO)
+
+        # Crear todas las invitaciones válidas de una vez
+        a_invitar = [jugador_id for jugador_id in jugador_ids if jugador_id not in rechazos]
+        creadas = self.invitacion_repo.crear_lote(partido_id, a_invitar, datetime.now()) if a_invitar else {}
+
+        resultados = []
+        for jugador_id in jugador_ids:
+            if jugador_id in rechazos:
+                resultado, mensaje = rechazos[jugador_id]
+            else:
+                resultado = ResultadoInvitacion.INVITADO
+                mensaje = msg.INVITACION_ENVIADA.format(nombre=nombres[jugador_id])
+
+            resultados.append({
+                "jugador_id": jugador_id,
+                "resultado": resultado,
+                "invitacion_id": creadas.get(jugador_id),
+                "mensaje": mensaje,
+            })
+
+        return {
+            "mensaje": msg.INVITACIONES_ENVIADAS.format(enviadas=len(a_invitar), total=len(jugador_ids)),
+            "partido_id": partido_id,
+            "invitados": len(a_invitar),
+            "resultados": resultados,
+        }
+
     # ============================================
     # MÉTODOS PRIVADOS
     # ============================================
@@ -4,6 +4,12 @@ from app.infra.database.repositories.partidos import PartidoRepository
 from app.infra.database.repositories.usuarios import UsuarioRepository
 from app.infra.database.repositories.participaciones import ParticipacionRepository
 from app.infra.database.repositories.invitaciones import InvitacionRepository
+from app.infra.database.repositories.asincronos import (
+    AsyncPartidoRepository,
+    AsyncUsuarioRepository,
+    AsyncParticipacionRepository,
+    AsyncInvitacionRepository,
+)
 
 
 class RepositoryDelegator:
@@ -52,6 +58,38 @@ class RepositoryDelegator:
         }
 
 
+class AsyncRepositoryDelegator:
+    """
+    Delegador para crear instancias de repositorios asíncronos.
+    Requiere un cliente asíncrono (BIOAsyncMySqlConnection o AioSqliteConnection).
+    """
+
+    def __init__(self, database_client: DatabaseConnection):
+        """
+        Inicializa el delegador con el cliente asíncrono de base de datos
+
+        Args:
+            database_client: Cliente asíncrono de conexión a la base de datos
+        """
+        self.database_client = database_client
+
+    def get_partido_repository(self) -> AsyncPartidoRepository:
+        """Obtiene una instancia del repositorio asíncrono de partidos"""
+        return AsyncPartidoRepository(self.database_client)
+
+    def get_usuario_repository(self) -> AsyncUsuarioRepository:
+        """Obtiene una instancia del repositorio asíncrono de usuarios"""
+        return AsyncUsuarioRepository(self.database_client)
+
+    def get_participacion_repository(self) -> AsyncParticipacionRepository:
+        """Obtiene una instancia del repositorio asíncrono de participaciones"""
+        return AsyncParticipacionRepository(self.database_client)
+
+    def get_invitacion_repository(self) -> AsyncInvitacionRepository:
+        """Obtiene una instancia del repositorio asíncrono de invitaciones"""
+        return AsyncInvitacionRepository(self.database_client)
+
+
 # Singleton del delegador (opcional, para uso global)
 _repository_delegator_instance = None
 
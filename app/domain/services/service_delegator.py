@@ -45,7 +45,7 @@ class ServiceDelegator:
         """
         return UsuarioService(
             usuario_repo=self.repo_delegator.get_usuario_repository(),
-            database_client=self.database_client,
+            partido_repo=self.repo_delegator.get_partido_repository(),
         )
 
     def get_invitacion_service(self) -> InvitacionService:
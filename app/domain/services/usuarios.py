@@ -1,14 +1,15 @@
 """Servicio de dominio para Usuarios"""
-from typing import List, Optional, Dict, Any
+from typing import List, Optional, Dict, Any, Tuple
 from datetime import datetime, timedelta
-from sqlalchemy import text
 
 from app.domain.repositories.usuarios import UsuarioRepositoryInterface
+from app.domain.repositories.partidos import PartidoRepositoryInterface
 from app.domain.exceptions import UsuarioNoEncontradoException
 from app.domain.schemas.usuarios import Genero, Posicion
 from app.domain import error_messages as msg
-from app.utils.date_utils import calcular_distancia, normalizar_texto
-from app.utils.constants import DIAS_CALENDARIO_FUTURO
+from app.utils.date_utils import normalizar_texto
+from app.utils.constants import DIAS_CALENDARIO_FUTURO, LIMITE_PAGINA_DEFECTO, TANDA_MINIMA_JUGADORES
+from app.utils.paginacion import codificar_cursor, decodificar_cursor
 
 
 class UsuarioService:
@@ -17,10 +18,10 @@ class UsuarioService:
     def __init__(
         self,
         usuario_repo: UsuarioRepositoryInterface,
-        database_client,
+        partido_repo: PartidoRepositoryInterface,
     ):
         self.usuario_repo = usuario_repo
-        self.database_client = database_client
+        self.partido_repo = partido_repo
 
     # ============================================
     # OBTENER PERFIL
@@ -33,6 +34,19 @@ class UsuarioService:
             raise UsuarioNoEncontradoException(msg.USUARIO_NO_ENCONTRADO)
         return usuario
 
+    def obtener_version_perfil(self, usuario_id: int) -> Tuple[int, int]:
+        """
+        Obtiene lo que identifica el perfil de un usuario, sin cargarlo
+        (para responder GET condicionales)
+
+        Returns:
+            Tuple: (versión del usuario, edad)
+        """
+        version = self.usuario_repo.obtener_version(usuario_id)
+        if not version:
+            raise UsuarioNoEncontradoException(msg.USUARIO_NO_ENCONTRADO)
+        return version['version'], version['edad']
+
     # ============================================
     # ACTUALIZAR USUARIO
     # ============================================
@@ -83,86 +97,69 @@ class UsuarioService:
         posicion: Optional[Posicion] = None,
         ubicacion_texto: Optional[str] = None,
         distancia_maxima_km: float = 10.0,
-    ) -> List[Dict[str, Any]]:
-        """Busca jugadores postulados disponibles para invitar"""
+        cursor: Optional[str] = None,
+        limite: int = LIMITE_PAGINA_DEFECTO,
+    ) -> Tuple[List[Dict[str, Any]], Optional[str]]:
+        """
+        Busca jugadores postulados disponibles para invitar, los más cercanos primero
+
+        Returns:
+            Tuple: (jugadores de la página, cursor de la página siguiente o None)
+        """
+        posicion_cursor = decodificar_cursor(cursor, 2)
+        if posicion_cursor:
+            try:
+                posicion_cursor = (float(posicion_cursor[0]), int(posicion_cursor[1]))
+            except (TypeError, ValueError):
+                raise ValueError(msg.CURSOR_INVALIDO)
 
         # Obtener organizador para calcular distancias
         organizador = self.usuario_repo.obtener_por_id(organizador_id)
         if not organizador:
             raise UsuarioNoEncontradoException(msg.ORGANIZADOR_NO_ENCONTRADO)
 
-        # Construir query SQL con filtros opcionales
-        sql_parts = [
-            """
-            SELECT 
-                u.id,
-                u.nombre,
-                u.posicion,
-                u.genero,
-                TIMESTAMPDIFF(YEAR, u.fecha_nacimiento, CURDATE()) as edad,
-                u.ubicacion_texto,
-                u.latitud,
-                u.longitud
-            FROM usuarios u
-            WHERE u.postulado = 1
-            AND u.id != :organizador_id
-            """
-        ]
-
-        params = {"organizador_id": organizador_id}
-
-        if genero:
-            sql_parts.append("AND u.genero = :genero")
-            params["genero"] = genero.value
-
-        if posicion:
-            sql_parts.append("AND u.posicion = :posicion")
-            params["posicion"] = posicion.value
-
-        # Filtro por ubicación (búsqueda parcial, case & accent insensitive)
-        if ubicacion_texto:
-            ubicacion_normalizada = normalizar_texto(ubicacion_texto)
-            sql_parts.append(
-                "AND LOWER(REPLACE(REPLACE(REPLACE(REPLACE(REPLACE(u.ubicacion_texto, 'á', 'a'), 'é', 'e'), 'í', 'i'), 'ó', 'o'), 'ú', 'u')) LIKE :ubicacion"
-            )
-            params["ubicacion"] = f"%{ubicacion_normalizada}%"
-
-        sql = text(" ".join(sql_parts))
-
-        # Ejecutar query
-        with self.database_client.get_session("tt") as db:
-            results = db.execute(sql, params).fetchall()
-
-        # Calcular distancias y filtrar por distancia máxima
-        jugadores_con_distancia = []
-        for row in results:
-            # Calcular distancia
-            distancia = calcular_distancia(
-                float(organizador['latitud']),
-                float(organizador['longitud']),
-                float(row.latitud),
-                float(row.longitud),
+        # Candidatos dentro del radio según el índice espacial
+        cercanos = self.usuario_repo.buscar_postulados_cercanos(
+            float(organizador['latitud']),
+            float(organizador['longitud']),
+            distancia_maxima_km,
+        )
+        cercanos.pop(organizador_id, None)
+
+        # Orden (distancia, id) y descarte de lo ya devuelto en páginas anteriores
+        orden = sorted(cercanos, key=lambda jugador_id: (cercanos[jugador_id], jugador_id))
+        if posicion_cursor:
+            orden = [jugador_id for jugador_id in orden if (cercanos[jugador_id], jugador_id) > posicion_cursor]
+
+        # Traer los datos por tandas, en orden, hasta llenar la página (+1 para saber si hay más)
+        filtros = {
+            "genero": genero.value if genero else None,
+            "posicion": posicion.value if posicion else None,
+            "ubicacion_texto": normalizar_texto(ubicacion_texto) if ubicacion_texto else None,
+        }
+        tanda = max(limite * 2, TANDA_MINIMA_JUGADORES)
+        jugadores: List[Dict[str, Any]] = []
+        for inicio in range(0, len(orden), tanda):
+            ids = orden[inicio:inicio + tanda]
+            encontrados = {
+                jugador['id']: jugador
+                for jugador in self.usuario_repo.buscar_postulados(ids=ids, **filtros)
+            }
+            jugadores.extend(
+                {**encontrados[jugador_id], "distancia_km": cercanos[jugador_id]}
+                for jugador_id in ids
+                if jugador_id in encontrados
             )
+            if len(jugadores) > limite:
+                break
 
-            # Filtrar por distancia máxima
-            if distancia > distancia_maxima_km:
-                continue
-
-            # Agregar a resultados
-            jugadores_con_distancia.append({
-                "id": row.id,
-                "nombre": row.nombre,
-                "posicion": row.posicion,
-                "genero": row.genero,
-                "edad": row.edad,
-                "ubicacion_texto": row.ubicacion_texto,
-                "distancia_km": distancia,
-            })
+        siguiente_cursor = None
+        if len(jugadores) > limite:
+            jugadores = jugadores[:limite]
+            ultimo = jugadores[-1]
+            siguiente_cursor = codificar_cursor(ultimo["distancia_km"], ultimo["id"])
 
-        # Ordenar por distancia (más cercanos primero)
-        jugadores_con_distancia.sort(key=lambda x: x["distancia_km"])
-
-        return jugadores_con_distancia
+        return jugadores, siguiente_cursor
 
     # ============================================
     # OBTENER CALENDARIO
@@ -195,52 +192,44 @@ class UsuarioService:
             if fecha_hasta.tzinfo is not None:
                 fecha_hasta = fecha_hasta.replace(tzinfo=None)
 
-        # Query SQL para obtener partidos del usuario
-        sql = text(
-            """
-            SELECT 
-                p.id,
-                p.titulo,
-                p.fecha_hora,
-                p.ubicacion_texto,
-                p.organizador_id,
-                p.capacidad_maxima,
-                p.tipo_partido,
-                (p.organizador_id = :usuario_id) as es_organizador,
-                (SELECT COUNT(*) 
-                 FROM participaciones part 
-                 WHERE part.partido_id = p.id 
-                 AND part.estado = 'Confirmado') as jugadores_confirmados
-            FROM partidos p
-            INNER JOIN participaciones pa ON p.id = pa.partido_id
-            WHERE pa.jugador_id = :usuario_id
-            AND pa.estado = 'Confirmado'
-            AND p.fecha_hora >= :fecha_desde
-            AND p.fecha_hora <= :fecha_hasta
-            AND p.fecha_hora >= :ahora
-            ORDER BY p.fecha_hora ASC
-            """
-        )
+        return self.partido_repo.obtener_calendario(usuario_id, fecha_desde, fecha_hasta)
 
-        with self.database_client.get_session("tt") as db:
-            results = db.execute(sql, {
-                "usuario_id": usuario_id,
-                "fecha_desde": fecha_desde,
-                "fecha_hasta": fecha_hasta,
-                "ahora": ahora
-            }).fetchall()
-
-        # Convertir resultados
-        return [
-            {
-                "id": row.id,
-                "titulo": row.titulo,
-                "fecha_hora": row.fecha_hora,
-                "ubicacion_texto": row.ubicacion_texto,
-                "es_organizador": bool(row.es_organizador),
-                "jugadores_confirmados": row.jugadores_confirmados,
-                "capacidad_maxima": row.capacidad_maxima,
-                "tipo_partido": row.tipo_partido,
-            }
-            for row in results
-        ]
\ No newline at end of file
+    # ============================================
+    # OBTENER HISTORIAL
+    # ============================================
+
+    def obtener_historial(
+        self,
+        usuario_id: int,
+        cursor: Optional[str] = None,
+        limite: int = LIMITE_PAGINA_DEFECTO,
+    ) -> Tuple[List[Dict[str, Any]], Optional[str]]:
+        """
+        Obtiene los partidos jugados por un usuario, los más recientes primero,
+        incluidos los que ya pasaron a las tablas de archivo
+
+        Returns:
+            Tuple: (partidos de la página, cursor de la página siguiente o None)
+        """
+        posicion = decodificar_cursor(cursor, 2)
+        if posicion:
+            try:
+                posicion = (datetime.fromisoformat(posicion[0]), int(posicion[1]))
+            except (TypeError, ValueError):
+                raise ValueError(msg.CURSOR_INVALIDO)
+
+        # Verificar usuario
+        usuario = self.usuario_repo.obtener_por_id(usuario_id)
+        if not usuario:
+            raise UsuarioNoEncontradoException(msg.USUARIO_NO_ENCONTRADO)
+
+        # Obtener historial (uno de más para saber si hay página siguiente)
+        partidos = self.partido_repo.obtener_historial(usuario_id, cursor=posicion, limite=limite + 1)
+
+        siguiente_cursor = None
+        if len(partidos) > limite:
+            partidos = partidos[:limite]
+            ultimo = partidos[-1]
+            siguiente_cursor = codificar_cursor(ultimo['fecha_hora'].isoformat(), ultimo['id'])
+
+        return partidos, siguiente_cursor
@@ -0,0 +1,33 @@
+import app.infra.cache.cache_service as cache
+from app.utils.config import settings
+
+# Backend compartido por todos los caches de la aplicación
+cache_backend = cache.crear_backend(
+    settings.CACHE_BACKEND,
+    redis_url=settings.CACHE_REDIS_URL,
+    max_entries=settings.CACHE_MAX_ENTRADAS,
+)
+
+cache_usuarios = cache.ReadThroughCache(
+    nombre="usuarios",
+    backend=cache_backend,
+    ttl=settings.CACHE_USUARIOS_TTL_SEGUNDOS,
+)
+
+# Partidos abiertos por celda de geohash; se invalida la celda al escribir
+cache_partidos_celda = cache.ReadThroughCache(
+    nombre="partidos_celda",
+    backend=cache_backend,
+    ttl=settings.CACHE_PARTIDOS_CELDA_TTL_SEGUNDOS,
+)
+
+# Última escritura que afectó las vistas propias de cada usuario; mientras
+# dura, esas vistas leen del primario (ver solo_lectura_de_usuario)
+cache_escrituras_usuario = cache.ReadThroughCache(
+    nombre="escrituras_usuario",
+    backend=cache_backend,
+    ttl=settings.DB_REPLICA_RETRASO_MAXIMO_SEGUNDOS,
+)
+
+# Caches expuestos en /metrics
+caches = [cache_usuarios, cache_partidos_celda, cache_escrituras_usuario]
@@ -0,0 +1,174 @@
+"""Cache read-through con backends intercambiables (memoria o Redis)"""
+import copy
+import pickle
+import threading
+import time
+from abc import ABCMeta, abstractmethod
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Hashable, Optional
+
+
+class CacheBackend(metaclass=ABCMeta):
+    @abstractmethod
+    def get(self, key: str) -> Optional[Any]:
+        pass
+
+    @abstractmethod
+    def set(self, key: str, value: Any, ttl: int) -> None:
+        pass
+
+    @abstractmethod
+    def delete(self, key: str) -> None:
+        pass
+
+
+class InMemoryCacheBackend(CacheBackend):
+    """Backend en memoria del proceso con TTL y desalojo LRU"""
+
+    def __init__(self, max_entries: int = 10000):
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[str, tuple]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> Optional[Any]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            expires_at, value = entry
+            if expires_at <= time.monotonic():
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+        # Copia para que quien lo use pueda modificarlo sin alterar el cache
+        return copy.copy(value)
+
+    def set(self, key: str, value: Any, ttl: int) -> None:
+        with self._lock:
+            self._entries[key] = (time.monotonic() + ttl, copy.copy(value))
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def delete(self, key: str) -> None:
+        with self._lock:
+            self._entries.pop(key, None)
+
+
+class RedisCacheBackend(CacheBackend):
+    """
+    Backend sobre cualquier cliente compatible con Redis (get/set con ex/delete).
+    Los valores se serializan con pickle.
+    """
+
+    def __init__(self, client, prefix: str = "mefaltauno:"):
+        self.client = client
+        self.prefix = prefix
+
+    def get(self, key: str) -> Optional[Any]:
+        data = self.client.get(self.prefix + key)
+        if data is None:
+            return None
+        return pickle.loads(data)
+
+    def set(self, key: str, value: Any, ttl: int) -> None:
+        self.client.set(self.prefix + key, pickle.dumps(value), ex=ttl)
+
+    def delete(self, key: str) -> None:
+        self.client.delete(self.prefix + key)
+
+
+class ReadThroughCache:
+    """
+    Cache read-through sobre un backend, con contadores de aciertos y fallos.
+    Los valores None no se cachean.
+    """
+
+    def __init__(self, nombre: str, backend: CacheBackend, ttl: int):
+        self.nombre = nombre
+        self.backend = backend
+        self.ttl = ttl
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+
+    def obtener(self, key: Hashable, cargar: Callable[[], Optional[Any]]) -> Optional[Any]:
+        """Devuelve el valor cacheado o lo carga y lo guarda"""
+        clave = self._clave(key)
+        valor = self.backend.get(clave)
+        if valor is not None:
+            self._contar(hit=True)
+            return valor
+
+        self._contar(hit=False)
+        valor = cargar()
+        if valor is not None:
+            self.backend.set(clave, valor, self.ttl)
+        return valor
+
+    def guardar(self, key: Hashable, valor: Any) -> None:
+        """Guarda el valor sin pasar por el loader"""
+        self.backend.set(self._clave(key), valor, self.ttl)
+
+    def modificar(self, key: Hashable, funcion: Callable[[Any], Optional[Any]]) -> None:
+        """
+        Reemplaza el valor cacheado por funcion(valor), renovando el TTL; si
+        funcion devuelve None se invalida. Sin valor cacheado no hace nada.
+        """
+        clave = self._clave(key)
+        valor = self.backend.get(clave)
+        if valor is None:
+            return
+
+        nuevo = funcion(valor)
+        if nuevo is None:
+            self.backend.delete(clave)
+        else:
+            self.backend.set(clave, nuevo, self.ttl)
+
+    def invalidar(self, key: Hashable) -> None:
+        """Elimina el valor cacheado"""
+        self.backend.delete(self._clave(key))
+
+    def estadisticas(self) -> Dict[str, Any]:
+        """Devuelve los contadores de aciertos y fallos"""
+        total = self.hits + self.misses
+        return {
+            "cache": self.nombre,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": round(self.hits / total, 4) if total else 0.0,
+        }
+
+    def _clave(self, key: Hashable) -> str:
+        return f"{self.nombre}:{key}"
+
+    def _contar(self, hit: bool) -> None:
+        with self._lock:
+            if hit:
+                self.hits += 1
+            else:
+                self.misses += 1
+
+
+def crear_backend(tipo: str, redis_url: Optional[str] = None, max_entries: int = 10000) -> CacheBackend:
+    """
+    Crea el backend de cache configurado
+
+    Args:
+        tipo: "memoria" o "redis"
+        redis_url: URL de Redis (solo para tipo "redis")
+        max_entries: Máximo de entradas del backend en memoria
+
+    Returns:
+        CacheBackend: Backend de cache
+    """
+    if tipo == "redis":
+        import redis  # dependencia opcional
+
+        return RedisCacheBackend(redis.Redis.from_url(redis_url))
+
+    if tipo == "memoria":
+        return InMemoryCacheBackend(max_entries=max_entries)
+
+    raise ValueError(f"Backend de cache desconocido: {tipo}")
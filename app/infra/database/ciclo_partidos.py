@@ -0,0 +1,150 @@
+"""Ciclo de vida de partidos: finaliza los vencidos y archiva los viejos en tablas frías"""
+import asyncio
+import logging
+import time
+from contextlib import contextmanager
+from datetime import datetime, timedelta
+from typing import Callable, Dict, Iterator, Optional
+
+from starlette.concurrency import run_in_threadpool
+
+from app.domain.repositories.partidos import PartidoRepositoryInterface
+from app.infra.metrics.metrics import ciclo_partidos_filas, ciclo_partidos_lote, rezago_ciclo_partidos
+from app.utils.constants import DIAS_ARCHIVAR_PARTIDO, MINUTOS_FINALIZAR_PARTIDO
+
+logger = logging.getLogger(__name__)
+
+
+class CicloPartidos:
+    """
+    Transiciones automáticas de partidos, en lotes:
+
+    - Pendiente/Confirmado -> Finalizado, MINUTOS_FINALIZAR_PARTIDO después de fecha_hora
+    - Finalizado/Cancelado -> tablas de archivo, DIAS_ARCHIVAR_PARTIDO después de fecha_hora
+
+    Cada lote es una transacción corta. Una corrida repite lotes hasta agotar
+    el trabajo (o llegar a max_lotes por operación, None = sin límite) y
+    actualiza las métricas: filas procesadas, duración de cada lote y rezago
+    del partido más viejo que quedó pendiente. Con pausa_segundos se duerme
+    entre lotes para no competir con el tráfico (migraciones de histórico).
+    """
+
+    def __init__(
+        self,
+        partido_repo: PartidoRepositoryInterface,
+        lote: int = 500,
+        max_lotes: Optional[int] = 100,
+        pausa_segundos: float = 0.0,
+        dias_archivar: int = DIAS_ARCHIVAR_PARTIDO,
+    ):
+        self.partido_repo = partido_repo
+        self.lote = lote
+        self.max_lotes = max_lotes
+        self.pausa_segundos = pausa_segundos
+        self.dias_archivar = dias_archivar
+
+    def ejecutar(self, ahora: Optional[datetime] = None) -> Dict[str, int]:
+        """
+        Ejecuta una corrida completa del ciclo de vida
+
+        Args:
+            ahora: Momento de referencia (por defecto, el actual)
+
+        Returns:
+            Dict: Partidos finalizados y filas archivadas por tabla
+        """
+        ahora = ahora or datetime.now()
+        hasta_finalizar = ahora - timedelta(minutes=MINUTOS_FINALIZAR_PARTIDO)
+        antes_de_archivar = ahora - timedelta(days=self.dias_archivar)
+
+        resumen = {"finalizados": self.finalizar(hasta_finalizar)}
+        resumen.update(self.archivar(antes_de_archivar))
+
+        rezago = self.partido_repo.obtener_rezago(hasta_finalizar, antes_de_archivar)
+        rezago_ciclo_partidos["finalizar"] = _segundos_de_atraso(rezago["finalizar"], hasta_finalizar)
+        rezago_ciclo_partidos["archivar"] = _segundos_de_atraso(rezago["archivar"], antes_de_archivar)
+
+        return resumen
+
+    def finalizar(self, hasta: datetime) -> int:
+        """
+        Finaliza en lotes los partidos vencidos antes de hasta
+
+        Returns:
+            int: Cantidad de partidos finalizados
+        """
+        finalizados = 0
+        for cantidad in self._en_lotes("finalizar", lambda: self.partido_repo.finalizar_vencidos(hasta, self.lote)):
+            finalizados += cantidad
+        return finalizados
+
+    def archivar(
+        self,
+        antes_de: datetime,
+        al_avanzar: Optional[Callable[[Dict[str, int]], None]] = None,
+    ) -> Dict[str, int]:
+        """
+        Mueve en lotes a las tablas frías los partidos terminados antes de antes_de
+
+        Args:
+            antes_de: Fecha límite de fecha_hora
+            al_avanzar: Se llama tras cada lote con el acumulado hasta el momento
+
+        Returns:
+            Dict: Filas archivadas por tabla
+        """
+        archivadas = {"partidos": 0, "participaciones": 0, "invitaciones": 0, "calificaciones": 0}
+
+        def paso() -> int:
+            lote = self.partido_repo.archivar(antes_de, self.lote)
+            for tabla, cantidad in lote.items():
+                archivadas[tabla] += cantidad
+            if al_avanzar is not None:
+                al_avanzar(dict(archivadas))
+            return lote["partidos"]
+
+        for _ in self._en_lotes("archivar", paso):
+            pass
+        return archivadas
+
+    def _en_lotes(self, operacion: str, paso: Callable[[], int]) -> Iterator[int]:
+        """Repite paso (que procesa un lote) hasta que no llene el lote o se llegue a max_lotes"""
+        numero = 0
+        while self.max_lotes is None or numero < self.max_lotes:
+            if numero and self.pausa_segundos:
+                time.sleep(self.pausa_segundos)
+            numero += 1
+
+            with self._medir_lote(operacion):
+                cantidad = paso()
+            ciclo_partidos_filas.incrementar(cantidad, operacion=operacion)
+            yield cantidad
+            if cantidad < self.lote:
+                break
+
+    @staticmethod
+    @contextmanager
+    def _medir_lote(operacion: str) -> Iterator[None]:
+        inicio = time.perf_counter()
+        try:
+            yield
+        finally:
+            ciclo_partidos_lote.observar(time.perf_counter() - inicio, operacion=operacion)
+
+
+def _segundos_de_atraso(mas_viejo: Optional[datetime], limite: datetime) -> float:
+    """Cuánto hace que el partido más viejo pendiente debió procesarse (0 si no hay)"""
+    if mas_viejo is None:
+        return 0.0
+    return max(0.0, (limite - mas_viejo).total_seconds())
+
+
+async def ejecutar_periodicamente(ciclo: CicloPartidos, intervalo_segundos: float) -> None:
+    """Corre el ciclo de vida cada intervalo_segundos en el threadpool (para usar como tarea de asyncio)"""
+    while True:
+        try:
+            resumen = await run_in_threadpool(ciclo.ejecutar)
+            logger.info("Ciclo de vida de partidos: %s", resumen)
+        except Exception:
+            logger.exception("Falló la corrida del ciclo de vida de partidos")
+        await asyncio.sleep(intervalo_segundos)
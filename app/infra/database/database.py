@@ -2,28 +2,56 @@ from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.schema import MetaData
 
 import app.infra.database.database_service as db
+from app.infra.metrics.metrics import instrumentar_engine, registrar_pools
+from app.utils.config import settings
 
-# DB app
-default_mysql_connections_app = {
-    "tt": "root:MeFaltaUno2024!@localhost:3306/yojuego"
-}
+# DB app: una URL por datasource, tomadas de la configuración (.env / entorno)
+default_mysql_connections = settings.conexiones_base_datos()
 
-default_mysql_connections = default_mysql_connections_app
-
-DB_POOL_SIZE: int = 2
-DB_POOL_MAX_SIZE: int = 5
-DB_LOG_QUERY: bool = False
-DB_CONNECTION_RECYCLE: int = 3600
+DB_CLIENT_PARAMS = dict(
+    pool_size=settings.DB_POOL_SIZE,
+    max_overflow=settings.DB_MAX_OVERFLOW,
+    pool_timeout=settings.DB_POOL_TIMEOUT,
+    connection_recycle=settings.DB_POOL_RECYCLE,
+    pool_pre_ping=settings.DB_POOL_PRE_PING,
+    pool_por_key=settings.DB_POOL_POR_DATASOURCE,
+    echo=settings.DB_ECHO,
+    replicas=settings.DATABASE_REPLICAS,
+    expulsion_replica_segundos=settings.DB_REPLICA_EXPULSION_SEGUNDOS,
+)
 
 database_client = db.DatabaseService.create(
     impl=db.BIOMySqlConnection,
     connections=default_mysql_connections,
-    pool_size=DB_POOL_SIZE,
-    max_overflow=DB_POOL_MAX_SIZE,
-    echo=DB_LOG_QUERY,
-    connection_recycle=DB_CONNECTION_RECYCLE,
+    **DB_CLIENT_PARAMS,
 )
 
+for _key in default_mysql_connections:
+    instrumentar_engine(database_client.get_engine(_key), _key)
+    for _nombre, _engine in database_client.get_replica_engines(_key).items():
+        instrumentar_engine(_engine, _nombre)
+registrar_pools(database_client)
+
+# Cliente asíncrono: se crea bajo demanda para no exigir aiomysql al importar
+_async_database_client = None
+
+
+def get_async_database_client() -> db.DatabaseConnection:
+    """Obtiene el cliente asíncrono de base de datos (patrón Singleton)"""
+    global _async_database_client
+    if _async_database_client is None:
+        _async_database_client = db.DatabaseService.create(
+            impl=db.BIOAsyncMySqlConnection,
+            connections=default_mysql_connections,
+            **DB_CLIENT_PARAMS,
+        )
+        for key in default_mysql_connections:
+            instrumentar_engine(_async_database_client.get_engine(key).sync_engine, key)
+            for nombre, engine in _async_database_client.get_replica_engines(key).items():
+                instrumentar_engine(engine.sync_engine, nombre)
+    return _async_database_client
+
+
 Base = declarative_base()
 
 metadata = MetaData(
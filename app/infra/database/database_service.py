@@ -1,7 +1,14 @@
+import itertools
+import threading
+import time
 from abc import ABCMeta, abstractmethod
+from typing import Callable, Dict, List, Optional
 
 from sqlalchemy import create_engine
+from sqlalchemy.engine import make_url
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
 from sqlalchemy.orm import sessionmaker, Session
+from sqlalchemy.pool import AsyncAdaptedQueuePool, QueuePool
 
 
 class DatabaseConnection(metaclass=ABCMeta):
@@ -13,33 +20,266 @@ class DatabaseConnection(metaclass=ABCMeta):
     def get_engine(self, key):
         pass
 
+    def get_keys(self):
+        """Devuelve las keys de los datasources configurados"""
+        return list(self.engines)
+
+    def pool_config(self, key) -> dict:
+        """Devuelve los parámetros de pool del datasource"""
+        return {}
+
+    def get_read_session(self, key) -> Session:
+        """Obtiene una sesión para lecturas (sin réplicas, la del primario)"""
+        return self.get_session(key)
+
+    def expulsar_replica(self, key, indice) -> None:
+        """Saca de rotación una réplica que falló (sin réplicas no hace nada)"""
+
+    def get_replica_engines(self, key) -> dict:
+        """Devuelve los engines de las réplicas del datasource por nombre"""
+        return {}
+
+    def replicas_disponibles(self, key) -> int:
+        """Cantidad de réplicas del datasource en rotación"""
+        return 0
+
+
+def armar_url(dsn: str, driver: str):
+    """
+    Arma la URL del engine forzando el driver indicado
+
+    Args:
+        dsn: URL completa (mysql://..., mysql+pymysql://...) o "usuario:clave@host/base"
+        driver: Driver de SQLAlchemy (p.ej. "mysql+pymysql")
+    """
+    if "://" not in dsn:
+        return f"{driver}://{dsn}"
+    return make_url(dsn).set(drivername=driver)
+
+
+class MedicionCheckout:
+    """Informa cuánto tardó cada checkout del pool (espera + conexión nueva si hace falta)"""
+
+    observador: Optional[Callable[[str, float], None]] = None
+
+    def _do_get(self):
+        inicio = time.perf_counter()
+        try:
+            return super()._do_get()
+        finally:
+            observador = MedicionCheckout.observador
+            if observador is not None:
+                observador(self.logging_name or "default", time.perf_counter() - inicio)
+
+
+class QueuePoolMedido(MedicionCheckout, QueuePool):
+    pass
+
+
+class AsyncQueuePoolMedido(MedicionCheckout, AsyncAdaptedQueuePool):
+    pass
+
+
+class SelectorReplicas:
+    """
+    Elige réplicas en round-robin salteando las expulsadas. Una réplica que
+    falla queda fuera de rotación durante expulsion_segundos y después se
+    vuelve a probar.
+    """
+
+    def __init__(self, cantidad: int, expulsion_segundos: float):
+        self.cantidad = cantidad
+        self.expulsion_segundos = expulsion_segundos
+        self._turnos = itertools.count()
+        self._expulsadas_hasta: Dict[int, float] = {}
+        self._lock = threading.Lock()
+
+    def elegir(self) -> Optional[int]:
+        """Devuelve el índice de la próxima réplica disponible o None si no hay"""
+        ahora = time.monotonic()
+        with self._lock:
+            for _ in range(self.cantidad):
+                indice = next(self._turnos) % self.cantidad
+                if self._expulsadas_hasta.get(indice, 0) <= ahora:
+                    return indice
+        return None
+
+    def expulsar(self, indice: int) -> None:
+        with self._lock:
+            self._expulsadas_hasta[indice] = time.monotonic() + self.expulsion_segundos
+
+    def disponibles(self) -> int:
+        ahora = time.monotonic()
+        with self._lock:
+            return sum(1 for i in range(self.cantidad) if self._expulsadas_hasta.get(i, 0) <= ahora)
+
 
 class BIOMySqlConnection(DatabaseConnection):
-    def __init__(self, connections, pool_size=10, max_overflow=10, echo=True, connection_recycle=3600):
+    """
+    Conexión a MySQL con un engine y un pool por datasource.
+
+    connections mapea cada key a una URL completa (mysql+pymysql://...) o a
+    "usuario:clave@host:puerto/base". Los parámetros de pool se aplican a todas
+    las keys y pool_por_key permite sobreescribirlos por datasource, p.ej.
+    {"tt": {"pool_size": 10, "max_overflow": 20}}.
+
+    replicas mapea una key a las URLs de sus réplicas de lectura; cada una
+    tiene su propio pool (con los parámetros de la key) y get_read_session las
+    reparte en round-robin. Sin réplicas disponibles las lecturas van al primario.
+    """
+
+    url_driver = "mysql+pymysql"
+
+    def __init__(
+        self,
+        connections,
+        pool_size=10,
+        max_overflow=10,
+        echo=True,
+        connection_recycle=3600,
+        pool_timeout=30,
+        pool_pre_ping=True,
+        pool_por_key=None,
+        replicas=None,
+        expulsion_replica_segundos=30,
+    ):
         self.engines = {}
         self.sessions = {}
+        self.pool_params = {}
+        self.replica_engines: Dict[str, List] = {}
+        self.replica_sessions: Dict[str, List] = {}
+        self.selectores: Dict[str, SelectorReplicas] = {}
+        self.expulsion_replica_segundos = expulsion_replica_segundos
         self.pool_size = pool_size
         self.max_overflow = max_overflow
         self.echo = echo
         self.pool_recycle = connection_recycle
-        self.__load_datasources(connections)
+        self.pool_timeout = pool_timeout
+        self.pool_pre_ping = pool_pre_ping
+        self.__load_datasources(connections, pool_por_key or {})
+        self.__load_replicas(replicas or {})
 
-    def __load_datasources(self, connections):
-        url_driver = "mysql+pymysql://"
+    def __load_datasources(self, connections, pool_por_key):
         for key in connections:
-            self.engines[key] = create_engine(
-                f"{url_driver}{connections[key]}",
-                pool_pre_ping=True,
-                pool_size=self.pool_size,
-                max_overflow=self.max_overflow,
+            self.pool_params[key] = {
+                "pool_size": self.pool_size,
+                "max_overflow": self.max_overflow,
+                "pool_timeout": self.pool_timeout,
+                "pool_recycle": self.pool_recycle,
+                "pool_pre_ping": self.pool_pre_ping,
+                **pool_por_key.get(key, {}),
+            }
+            self.engines[key] = self._crear_engine(
+                armar_url(connections[key], self.url_driver),
+                poolclass=self.poolclass,
+                pool_logging_name=key,
                 echo=self.echo,
-                pool_recycle=self.pool_recycle,
+                **self.pool_params[key],
             )
-            self.sessions[key] = sessionmaker(self.engines[key], autocommit=False, expire_on_commit=False)
+            self.sessions[key] = self._crear_sessionmaker(self.engines[key])
+
+    def __load_replicas(self, replicas):
+        for key, urls in replicas.items():
+            if not urls:
+                continue
+            self.replica_engines[key] = [
+                self._crear_engine(
+                    armar_url(url, self.url_driver),
+                    poolclass=self.poolclass,
+                    pool_logging_name=f"{key}_replica{indice}",
+                    echo=self.echo,
+                    **self.pool_params[key],
+                )
+                for indice, url in enumerate(urls)
+            ]
+            self.replica_sessions[key] = [self._crear_sessionmaker(engine) for engine in self.replica_engines[key]]
+            self.selectores[key] = SelectorReplicas(len(urls), self.expulsion_replica_segundos)
+
+    poolclass = QueuePoolMedido
+
+    @staticmethod
+    def _crear_engine(url, **params):
+        return create_engine(url, **params)
+
+    @staticmethod
+    def _crear_sessionmaker(engine):
+        return sessionmaker(engine, autocommit=False, expire_on_commit=False)
+
+    def pool_config(self, key) -> dict:
+        return self.pool_params[key]
 
     def get_session(self, key) -> Session:
         return self.sessions[key]()
 
+    def get_read_session(self, key) -> Session:
+        """
+        Obtiene una sesión sobre la próxima réplica disponible del datasource
+        (o del primario si no hay). La réplica usada queda en session.info["replica"].
+        """
+        selector = self.selectores.get(key)
+        indice = selector.elegir() if selector is not None else None
+        if indice is None:
+            return self.get_session(key)
+
+        session = self.replica_sessions[key][indice]()
+        session.info["replica"] = (key, indice)
+        return session
+
+    def expulsar_replica(self, key, indice) -> None:
+        self.selectores[key].expulsar(indice)
+
+    def get_replica_engines(self, key) -> dict:
+        return {
+            f"{key}_replica{indice}": engine
+            for indice, engine in enumerate(self.replica_engines.get(key, []))
+        }
+
+    def replicas_disponibles(self, key) -> int:
+        selector = self.selectores.get(key)
+        return selector.disponibles() if selector is not None else 0
+
+    def get_engine(self, key):
+        return self.engines[key]
+
+
+class BIOAsyncMySqlConnection(BIOMySqlConnection):
+    """Conexión asíncrona a MySQL (driver aiomysql). get_session devuelve AsyncSession"""
+
+    url_driver = "mysql+aiomysql"
+    poolclass = AsyncQueuePoolMedido
+
+    @staticmethod
+    def _crear_engine(url, **params):
+        return create_async_engine(url, **params)
+
+    @staticmethod
+    def _crear_sessionmaker(engine):
+        return sessionmaker(engine, class_=AsyncSession, autocommit=False, expire_on_commit=False)
+
+    def get_session(self, key) -> AsyncSession:
+        return self.sessions[key]()
+
+
+class AioSqliteConnection(DatabaseConnection):
+    """
+    Conexión asíncrona a SQLite (driver aiosqlite) para tests.
+    connections mapea cada key a una ruta de archivo o ":memory:".
+    """
+
+    url_driver = "sqlite+aiosqlite:///"
+
+    def __init__(self, connections, echo=False, **params):
+        self.engines = {}
+        self.sessions = {}
+        for key in connections:
+            self.engines[key] = create_async_engine(f"{self.url_driver}{connections[key]}", echo=echo)
+            self.sessions[key] = sessionmaker(
+                self.engines[key], class_=AsyncSession, autocommit=False, expire_on_commit=False
+            )
+
+    def get_session(self, key) -> AsyncSession:
+        return self.sessions[key]()
+
     def get_engine(self, key):
         return self.engines[key]
 
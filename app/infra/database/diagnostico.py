@@ -0,0 +1,123 @@
+"""Diagnóstico de los datasources: estado del pool, latencia y dimensionamiento"""
+import logging
+import time
+from typing import Any, Dict, List, Optional
+
+from sqlalchemy import text
+
+from app.infra.database.database_service import DatabaseConnection
+
+logger = logging.getLogger(__name__)
+
+
+def estado_pool(database_client: DatabaseConnection, key: str) -> Dict[str, Any]:
+    """
+    Obtiene la ocupación del pool de conexiones del datasource
+
+    Args:
+        database_client: Cliente de base de datos
+        key: Key del datasource
+
+    Returns:
+        Dict: Tamaño, conexiones en uso/libres, overflow y si está saturado
+    """
+    pool = database_client.get_engine(key).pool
+    max_overflow = database_client.pool_config(key).get("max_overflow", 0)
+    en_uso = pool.checkedout()
+
+    return {
+        "pool_size": pool.size(),
+        "max_overflow": max_overflow,
+        "checked_out": en_uso,
+        "checked_in": pool.checkedin(),
+        "overflow": max(0, pool.overflow()),
+        "saturado": en_uso >= pool.size() + max_overflow,
+    }
+
+
+def verificar_datasource(database_client: DatabaseConnection, key: str) -> Dict[str, Any]:
+    """
+    Verifica el datasource: estado del pool y un SELECT 1 cronometrado.
+    Si el pool está saturado no se intenta el SELECT (esperaría un checkout).
+
+    Args:
+        database_client: Cliente de base de datos
+        key: Key del datasource
+
+    Returns:
+        Dict: Estado del pool, latencia_ms, ok y error (si lo hubo)
+    """
+    estado = estado_pool(database_client, key)
+    estado.update({"ok": False, "latencia_ms": None, "error": None})
+
+    if estado["saturado"]:
+        estado["error"] = "Pool de conexiones saturado"
+        return estado
+
+    inicio = time.perf_counter()
+    try:
+        with database_client.get_engine(key).connect() as conexion:
+            conexion.execute(text("SELECT 1"))
+    except Exception as exc:
+        estado["error"] = exc.__class__.__name__
+        return estado
+
+    estado["latencia_ms"] = round((time.perf_counter() - inicio) * 1000, 2)
+    estado["ok"] = True
+    return estado
+
+
+def reporte_dimensionamiento(
+    database_client: DatabaseConnection,
+    workers: int,
+    hilos: int,
+    max_conexiones_servidor: Optional[int] = None,
+) -> List[Dict[str, Any]]:
+    """
+    Compara la concurrencia de la aplicación con la capacidad de cada pool y
+    loguea una advertencia cuando no alcanza.
+
+    Cada request síncrono ocupa un hilo del threadpool y, por la unidad de
+    trabajo, una conexión por datasource; si hay más hilos que conexiones, los
+    requests sobrantes esperan un checkout (hasta pool_timeout) en vez de avanzar.
+
+    Args:
+        database_client: Cliente de base de datos
+        workers: Procesos de uvicorn (WEB_CONCURRENCY)
+        hilos: Tamaño del threadpool por proceso
+        max_conexiones_servidor: max_connections del servidor, si se conoce
+
+    Returns:
+        List[Dict]: Por datasource: capacidad por proceso y total, demanda total y advertencias
+    """
+    reporte = []
+    for key in database_client.get_keys():
+        config = database_client.pool_config(key)
+        capacidad = config.get("pool_size", 0) + config.get("max_overflow", 0)
+        advertencias = []
+
+        if hilos > capacidad:
+            advertencias.append(
+                f"{workers} workers x {hilos} hilos = {workers * hilos} requests concurrentes "
+                f"para {workers} x {capacidad} = {workers * capacidad} conexiones: "
+                f"subir pool_size/max_overflow o bajar THREADPOOL_SIZE"
+            )
+        if max_conexiones_servidor is not None and workers * capacidad > max_conexiones_servidor:
+            advertencias.append(
+                f"{workers} workers x {capacidad} conexiones = {workers * capacidad} "
+                f"supera max_connections del servidor ({max_conexiones_servidor})"
+            )
+
+        for advertencia in advertencias:
+            logger.warning("Pool '%s': %s", key, advertencia)
+
+        reporte.append({
+            "datasource": key,
+            "pool_size": config.get("pool_size", 0),
+            "max_overflow": config.get("max_overflow", 0),
+            "capacidad_por_proceso": capacidad,
+            "capacidad_total": workers * capacidad,
+            "concurrencia_total": workers * hilos,
+            "advertencias": advertencias,
+        })
+    return reporte
@@ -0,0 +1,90 @@
+"""Migraciones versionadas del esquema (archivos SQL en migraciones/)"""
+import re
+from pathlib import Path
+from typing import List, NamedTuple
+
+from sqlalchemy import text
+
+from app.infra.database.database_service import DatabaseConnection
+
+DIRECTORIO_MIGRACIONES = Path(__file__).resolve().parents[3] / "migraciones"
+
+_PATRON_ARCHIVO = re.compile(r"^(\d+)_(\w+)\.sql$")
+
+
+class Migracion(NamedTuple):
+    version: str
+    nombre: str
+    ruta: Path
+
+
+def listar_migraciones(directorio: Path = DIRECTORIO_MIGRACIONES) -> List[Migracion]:
+    """Lista las migraciones del directorio ordenadas por versión"""
+    migraciones = []
+    for ruta in directorio.glob("*.sql"):
+        coincidencia = _PATRON_ARCHIVO.match(ruta.name)
+        if coincidencia:
+            migraciones.append(Migracion(coincidencia.group(1), coincidencia.group(2), ruta))
+    return sorted(migraciones, key=lambda migracion: int(migracion.version))
+
+
+def separar_sentencias(sql: str) -> List[str]:
+    """Separa un script SQL en sentencias (sin comentarios de línea)"""
+    lineas = [linea for linea in sql.splitlines() if not linea.strip().startswith("--")]
+    return [sentencia.strip() for sentencia in "\n".join(lineas).split(";") if sentencia.strip()]
+
+
+class MigradorEsquema:
+    """
+    Aplica las migraciones pendientes registrando cada versión en schema_migrations.
+
+    MySQL confirma implícitamente cada DDL, así que cada migración se registra
+    apenas termina: si una falla, las anteriores quedan aplicadas y registradas.
+    """
+
+    def __init__(self, database_client: DatabaseConnection, key: str = "tt"):
+        self.database_client = database_client
+        self.key = key
+
+    def versiones_aplicadas(self) -> List[str]:
+        """Obtiene las versiones ya aplicadas"""
+        with self.database_client.get_session(self.key) as db:
+            db.execute(
+                text(
+                    """
+                    CREATE TABLE IF NOT EXISTS schema_migrations (
+                        version VARCHAR(20) PRIMARY KEY,
+                        nombre VARCHAR(255) NOT NULL,
+                        aplicada_en TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP
+                    )
+                    """
+                )
+            )
+            results = db.execute(text("SELECT version FROM schema_migrations")).fetchall()
+            db.commit()
+        return [row.version for row in results]
+
+    def pendientes(self) -> List[Migracion]:
+        """Obtiene las migraciones que todavía no se aplicaron"""
+        aplicadas = set(self.versiones_aplicadas())
+        return [migracion for migracion in listar_migraciones() if migracion.version not in aplicadas]
+
+    def aplicar(self) -> List[Migracion]:
+        """
+        Aplica las migraciones pendientes en orden
+
+        Returns:
+            List[Migracion]: Migraciones aplicadas
+        """
+        aplicadas = []
+        for migracion in self.pendientes():
+            with self.database_client.get_session(self.key) as db:
+                for sentencia in separar_sentencias(migracion.ruta.read_text(encoding="utf-8")):
+                    db.execute(text(sentencia))
+                db.execute(
+                    text("INSERT INTO schema_migrations (version, nombre) VALUES (:version, :nombre)"),
+                    {"version": migracion.version, "nombre": migracion.nombre},
+                )
+                db.commit()
+            aplicadas.append(migracion)
+        return aplicadas
@@ -0,0 +1,70 @@
+"""Variantes asíncronas de los repositorios"""
+from typing import Any, Callable, Dict, Tuple, Type
+
+from sqlalchemy.orm import Session
+
+from app.infra.database.database_service import DatabaseConnection
+from app.infra.database.unit_of_work import UnitOfWork
+from app.infra.database.repositories.base import BaseRepository
+from app.infra.database.repositories.partidos import PartidoRepository
+from app.infra.database.repositories.usuarios import UsuarioRepository
+from app.infra.database.repositories.participaciones import ParticipacionRepository
+from app.infra.database.repositories.invitaciones import InvitacionRepository
+
+
+def _ejecutar_en_unidad(
+    session: Session, metodo: Callable, args: Tuple[Any, ...], kwargs: Dict[str, Any]
+) -> Any:
+    with UnitOfWork(session=session):
+        return metodo(*args, **kwargs)
+
+
+class AsyncRepository:
+    """
+    Expone los métodos públicos de un repositorio síncrono como corrutinas.
+
+    Cada llamada abre una AsyncSession y ejecuta el método original con
+    AsyncSession.run_sync, de modo que el SQL se reutiliza tal cual pero la
+    I/O se hace con el driver asíncrono, sin bloquear un hilo del threadpool.
+    Cada llamada es una unidad de trabajo que se confirma al terminar.
+    """
+
+    repository_class: Type[BaseRepository] = BaseRepository
+
+    def __init__(self, database_client: DatabaseConnection, key: str = "tt"):
+        self.database_client = database_client
+        self.key = key
+        self._repository = self.repository_class(database_client)
+
+    def __getattr__(self, nombre: str) -> Any:
+        atributo = getattr(self._repository, nombre)
+        if nombre.startswith("_") or not callable(atributo):
+            return atributo
+
+        async def ejecutar(*args, **kwargs):
+            async with self.database_client.get_session(self.key) as session:
+                return await session.run_sync(_ejecutar_en_unidad, atributo, args, kwargs)
+
+        ejecutar.__name__ = nombre
+        ejecutar.__doc__ = atributo.__doc__
+        return ejecutar
+
+
+class AsyncPartidoRepository(AsyncRepository):
+    """Repositorio asíncrono de partidos"""
+    repository_class = PartidoRepository
+
+
+class AsyncUsuarioRepository(AsyncRepository):
+    """Repositorio asíncrono de usuarios"""
+    repository_class = UsuarioRepository
+
+
+class AsyncParticipacionRepository(AsyncRepository):
+    """Repositorio asíncrono de participaciones"""
+    repository_class = ParticipacionRepository
+
+
+class AsyncInvitacionRepository(AsyncRepository):
+    """Repositorio asíncrono de invitaciones"""
+    repository_class = InvitacionRepository
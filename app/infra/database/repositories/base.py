@@ -1,7 +1,82 @@
 """Repositorio base con utilidades comunes"""
-from typing import Dict, Any, Optional
+import functools
+import inspect
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Callable, Dict, Any, Iterable, Iterator, Optional
 from datetime import datetime
 
+from sqlalchemy.exc import OperationalError
+from sqlalchemy.orm import Session
+
+from app.infra.cache.cache import cache_escrituras_usuario
+from app.infra.database.unit_of_work import get_unit_of_work
+from app.infra.metrics.metrics import metodo_repositorio
+
+
+_en_lectura: ContextVar[bool] = ContextVar("repositorio_en_lectura", default=False)
+
+
+class _ReplicaCaida(Exception):
+    """La réplica usada por una lectura falló; la lectura se reintenta en el primario"""
+
+
+def solo_lectura(metodo: Callable) -> Callable:
+    """
+    Marca un método de repositorio como de solo lectura: sus sesiones se
+    toman de una réplica (round-robin) salvo que el request ya haya escrito.
+    Si la réplica falla se expulsa de la rotación y el método se reintenta
+    en el primario.
+    """
+
+    @functools.wraps(metodo)
+    def en_replica(*args, **kwargs):
+        token = _en_lectura.set(True)
+        try:
+            return metodo(*args, **kwargs)
+        except _ReplicaCaida:
+            pass
+        finally:
+            _en_lectura.reset(token)
+        return metodo(*args, **kwargs)
+
+    return en_replica
+
+
+def solo_lectura_de_usuario(parametro: str) -> Callable[[Callable], Callable]:
+    """
+    Como solo_lectura, para vistas propias de un usuario (calendario, historial,
+    invitaciones): el argumento parametro indica de qué usuario. Si se confirmó
+    hace menos de DB_REPLICA_RETRASO_MAXIMO_SEGUNDOS una escritura que lo
+    afecta (aunque la haya hecho otro request, p.ej. el organizador que lo
+    aprobó), la lectura va al primario para que vea el cambio.
+    """
+
+    def decorar(metodo: Callable) -> Callable:
+        en_replica = solo_lectura(metodo)
+        firma = inspect.signature(metodo)
+
+        @functools.wraps(metodo)
+        def leer(*args, **kwargs):
+            usuario_id = firma.bind(*args, **kwargs).arguments[parametro]
+            if cache_escrituras_usuario.obtener(usuario_id, lambda: None) is not None:
+                return metodo(*args, **kwargs)
+            return en_replica(*args, **kwargs)
+
+        return leer
+
+    return decorar
+
+
+def _medir_metodo(nombre: str, metodo: Callable) -> Callable:
+    @functools.wraps(metodo)
+    def medido(*args, **kwargs):
+        with metodo_repositorio(nombre):
+            return metodo(*args, **kwargs)
+
+    return medido
+
 
 class BaseRepository:
     """Clase base para repositorios con métodos comunes"""
@@ -9,6 +84,92 @@ class BaseRepository:
     def __init__(self, database_client):
         self.database_client = database_client
 
+    def __init_subclass__(cls, **kwargs):
+        """Atribuye el SQL de cada método público a "Repositorio.metodo" en las métricas"""
+        super().__init_subclass__(**kwargs)
+        for nombre, atributo in list(vars(cls).items()):
+            if not nombre.startswith("_") and inspect.isfunction(atributo):
+                setattr(cls, nombre, _medir_metodo(f"{cls.__name__}.{nombre}", atributo))
+
+    @contextmanager
+    def _sesion(self, key: str = "tt") -> Iterator[Session]:
+        """Obtiene la sesión de la unidad de trabajo activa o abre una nueva"""
+        unidad = get_unit_of_work()
+        if _en_lectura.get():
+            with self._sesion_lectura(key, unidad) as db:
+                yield db
+            return
+
+        if unidad is not None:
+            yield unidad.get_session(key)
+            return
+
+        with self.database_client.get_session(key) as db:
+            yield db
+
+    @contextmanager
+    def _sesion_lectura(self, key: str, unidad) -> Iterator[Session]:
+        """Sesión de lectura; si su réplica falla la expulsa y avisa a solo_lectura"""
+        if unidad is not None:
+            db = unidad.get_read_session(key)
+        else:
+            db = self.database_client.get_read_session(key)
+
+        try:
+            yield db
+        except OperationalError as exc:
+            replica = db.info.get("replica")
+            if replica is None:
+                raise
+            self.database_client.expulsar_replica(*replica)
+            if unidad is not None:
+                unidad.descartar_lectura(key)
+            raise _ReplicaCaida() from exc
+        finally:
+            if unidad is None:
+                db.close()
+
+    @staticmethod
+    def _confirmar(db: Session) -> None:
+        """Confirma la transacción salvo que la maneje una unidad de trabajo"""
+        unidad = get_unit_of_work()
+        if unidad is None:
+            db.commit()
+        else:
+            unidad.marcar_escritura()
+
+    @staticmethod
+    def _despues_de_confirmar(callback: Callable[[], None]) -> None:
+        """Ejecuta la acción cuando la transacción en curso quede confirmada"""
+        unidad = get_unit_of_work()
+        if unidad is None:
+            callback()
+        else:
+            unidad.al_confirmar(callback)
+
+    def _marcar_escritura_usuarios(self, usuario_ids: Iterable[int]) -> None:
+        """
+        Al confirmar la transacción, registra que cambiaron datos propios de los
+        usuarios para que sus vistas lean del primario un rato (ver solo_lectura_de_usuario)
+        """
+        usuario_ids = list(usuario_ids)
+
+        def marcar():
+            for usuario_id in usuario_ids:
+                cache_escrituras_usuario.guardar(usuario_id, time.time())
+
+        self._despues_de_confirmar(marcar)
+
+    @staticmethod
+    def _despues_de_finalizar(callback: Callable[[], None]) -> None:
+        """Ejecuta la acción al terminar la transacción en curso, se confirme o no"""
+        unidad = get_unit_of_work()
+        if unidad is None:
+            callback()
+        else:
+            unidad.al_confirmar(callback)
+            unidad.al_revertir(callback)
+
     @staticmethod
     def dict_to_object(data: Dict[str, Any]) -> Dict[str, Any]:
         """Convierte un diccionario de datos a formato estándar"""
@@ -19,4 +180,4 @@ class BaseRepository:
         """Convierte datetime con timezone a naive datetime"""
         if dt and dt.tzinfo:
             return dt.replace(tzinfo=None)
-        return dt
\ No newline at end of file
+        return dt
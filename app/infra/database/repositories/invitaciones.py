@@ -1,10 +1,10 @@
 """Implementación del repositorio de Invitaciones"""
-from typing import List, Optional, Dict, Any
+from typing import List, Optional, Dict, Any, Tuple
 from datetime import datetime
-from sqlalchemy import text
+from sqlalchemy import bindparam, text
 
 from app.domain.repositories.invitaciones import InvitacionRepositoryInterface
-from app.infra.database.repositories.base import BaseRepository
+from app.infra.database.repositories.base import BaseRepository, solo_lectura_de_usuario
 
 
 class InvitacionRepository(BaseRepository, InvitacionRepositoryInterface):
@@ -22,11 +22,13 @@ class InvitacionRepository(BaseRepository, InvitacionRepositoryInterface):
             """
         )
 
-        with self.database_client.get_session("tt") as db:
+        with self._sesion() as db:
             result = db.execute(sql, invitacion_data)
-            db.commit()
+            self._confirmar(db)
             invitacion_data['id'] = result.lastrowid
 
+        self._marcar_escritura_usuarios([invitacion_data['jugador_id']])
+
         return invitacion_data
 
     def obtener_por_id(self, invitacion_id: int) -> Optional[Dict[str, Any]]:
@@ -48,7 +50,7 @@ class InvitacionRepository(BaseRepository, InvitacionRepositoryInterface):
             """
         )
 
-        with self.database_client.get_session("tt") as db:
+        with self._sesion() as db:
             result = db.execute(sql, {"invitacion_id": invitacion_id}).fetchone()
             if result is None:
                 return None
@@ -64,10 +66,15 @@ class InvitacionRepository(BaseRepository, InvitacionRepositoryInterface):
             'fecha_invitacion': result.fecha_invitacion
         }
 
+    @solo_lectura_de_usuario("jugador_id")
     def obtener_por_jugador(
-        self, jugador_id: int, estado: Optional[str] = None
+        self,
+        jugador_id: int,
+        estado: Optional[str] = None,
+        cursor: Optional[Tuple[datetime, int]] = None,
+        limite: Optional[int] = None,
     ) -> List[Dict[str, Any]]:
-        """Obtiene todas las invitaciones de un jugador"""
+        """Obtiene las invitaciones de un jugador ordenadas por (fecha_invitacion, id) descendente"""
         sql_parts = [
             """
             SELECT 
@@ -90,11 +97,22 @@ class InvitacionRepository(BaseRepository, InvitacionRepositoryInterface):
             sql_parts.append("AND i.estado = :estado")
             params["estado"] = estado
 
-        sql_parts.append("ORDER BY i.fecha_invitacion DESC")
+        if cursor is not None:
+            sql_parts.append(
+                "AND (i.fecha_invitacion < :cursor_fecha "
+                "OR (i.fecha_invitacion = :cursor_fecha AND i.id < :cursor_id))"
+            )
+            params["cursor_fecha"], params["cursor_id"] = cursor
+
+        sql_parts.append("ORDER BY i.fecha_invitacion DESC, i.id DESC")
+
+        if limite is not None:
+            sql_parts.append("LIMIT :limite")
+            params["limite"] = limite
 
         sql = text(" ".join(sql_parts))
 
-        with self.database_client.get_session("tt") as db:
+        with self._sesion() as db:
             results = db.execute(sql, params).fetchall()
 
         return [
@@ -123,7 +141,7 @@ class InvitacionRepository(BaseRepository, InvitacionRepositoryInterface):
             """
         )
 
-        with self.database_client.get_session("tt") as db:
+        with self._sesion() as db:
             result = db.execute(sql, {
                 "partido_id": partido_id,
                 "jugador_id": jugador_id
@@ -131,6 +149,57 @@ class InvitacionRepository(BaseRepository, InvitacionRepositoryInterface):
 
         return result.total > 0 if result else False
 
+    def obtener_estados_por_jugador(self, partido_id: int, jugador_ids: List[int]) -> Dict[int, str]:
+        """Obtiene el estado de la invitación al partido de cada jugador dado que ya tenga una"""
+        sql = text(
+            """
+            SELECT jugador_id, estado
+            FROM invitaciones
+            WHERE partido_id = :partido_id
+            AND jugador_id IN :jugador_ids
+            """
+        ).bindparams(bindparam("jugador_ids", expanding=True))
+
+        with self._sesion() as db:
+            results = db.execute(sql, {"partido_id": partido_id, "jugador_ids": jugador_ids}).fetchall()
+
+        return {row.jugador_id: row.estado for row in results}
+
+    def crear_lote(self, partido_id: int, jugador_ids: List[int], fecha_invitacion: datetime) -> Dict[int, int]:
+        """
+        Crea invitaciones pendientes para varios jugadores con un único INSERT
+        de varias filas. Si otra transacción invitó al mismo jugador entretanto,
+        la fila se ignora (UNIQUE partido_id, jugador_id) y se devuelve la existente.
+        """
+        params: Dict[str, Any] = {"partido_id": partido_id, "fecha_invitacion": fecha_invitacion}
+        filas = []
+        for indice, jugador_id in enumerate(jugador_ids):
+            params[f"jugador_{indice}"] = jugador_id
+            filas.append(f"(:partido_id, :jugador_{indice}, 'Pendiente', :fecha_invitacion)")
+
+        sql = text(
+            "INSERT INTO invitaciones (partido_id, jugador_id, estado, fecha_invitacion) VALUES "
+            + ", ".join(filas)
+            + " ON DUPLICATE KEY UPDATE id = id"
+        )
+        sql_ids = text(
+            """
+            SELECT id, jugador_id
+            FROM invitaciones
+            WHERE partido_id = :partido_id
+            AND jugador_id IN :jugador_ids
+            """
+        ).bindparams(bindparam("jugador_ids", expanding=True))
+
+        with self._sesion() as db:
+            db.execute(sql, params)
+            results = db.execute(sql_ids, {"partido_id": partido_id, "jugador_ids": jugador_ids}).fetchall()
+            self._confirmar(db)
+
+        self._marcar_escritura_usuarios(jugador_ids)
+
+        return {row.jugador_id: row.id for row in results}
+
     def actualizar(self, invitacion_id: int, invitacion_data: Dict[str, Any]) -> Dict[str, Any]:
         """Actualiza una invitación"""
         sql = text(
@@ -147,17 +216,14 @@ class InvitacionRepository(BaseRepository, InvitacionRepositoryInterface):
         if 'fecha_respuesta' not in invitacion_data:
             invitacion_data['fecha_respuesta'] = datetime.now() if invitacion_data.get('estado') != 'Pendiente' else None
 
-        with self.database_client.get_session("tt") as db:
+        with self._sesion() as db:
+            jugador = db.execute(
+                text("SELECT jugador_id FROM invitaciones WHERE id = :id"), {"id": invitacion_id}
+            ).fetchone()
             db.execute(sql, invitacion_data)
-            db.commit()
+            self._confirmar(db)
 
-        return invitacion_data
-
-    def eliminar_por_partido(self, partido_id: int) -> int:
-        """Elimina todas las invitaciones de un partido"""
-        sql = text("DELETE FROM invitaciones WHERE partido_id = :partido_id")
+        if jugador is not None:
+            self._marcar_escritura_usuarios([jugador.jugador_id])
 
-        with self.database_client.get_session("tt") as db:
-            result = db.execute(sql, {"partido_id": partido_id})
-            db.commit()
-            return result.rowcount
\ No newline at end of file
+        return invitacion_data
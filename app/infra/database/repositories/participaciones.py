@@ -1,9 +1,70 @@
 """Implementación del repositorio de Participaciones"""
-from typing import List, Optional, Dict, Any
-from sqlalchemy import text
+from typing import Callable, List, Optional, Dict, Any, Set
+from sqlalchemy import bindparam, text
 
+from app.domain import error_messages as msg
+from app.domain.exceptions import PartidoCompletoException
 from app.domain.repositories.participaciones import ParticipacionRepositoryInterface
+from app.domain.schemas.partidos import EstadoParticipacion
 from app.infra.database.repositories.base import BaseRepository
+from app.infra.database.repositories.partidos import refresco_confirmados_celdas
+
+
+def _ajustar_contadores(
+    db, partido_id: int, estado_anterior: Optional[str], estado_nuevo: Optional[str]
+) -> Optional[Callable[[], None]]:
+    """
+    Actualiza los contadores confirmados/pendientes del partido según la transición de estado.
+
+    Si la transición ocupa cupo (nuevo confirmado, o nueva postulación pendiente)
+    el UPDATE es condicional sobre el cupo: la verificación y la reserva son una
+    sola sentencia atómica, y el lock de la fila del partido serializa las
+    transiciones concurrentes hasta el commit.
+
+    Returns:
+        Callable: Si cambian los confirmados, la actualización del snapshot de
+        búsqueda a ejecutar una vez confirmada la transacción (si no, None)
+
+    Raises:
+        PartidoCompletoException: Si la transición excede capacidad_maxima
+    """
+    confirmado = EstadoParticipacion.CONFIRMADO.value
+    pendiente = EstadoParticipacion.PENDIENTE.value
+
+    delta_confirmados = (estado_nuevo == confirmado) - (estado_anterior == confirmado)
+    delta_pendientes = (estado_nuevo == pendiente) - (estado_anterior == pendiente)
+    if not delta_confirmados and not delta_pendientes:
+        return None
+
+    sql_parts = [
+        """
+        UPDATE partidos
+        SET
+            confirmados = confirmados + :delta_confirmados,
+            pendientes = pendientes + :delta_pendientes,
+            version = version + 1
+        WHERE id = :partido_id
+        """
+    ]
+    if delta_confirmados > 0:
+        sql_parts.append("AND confirmados + :delta_confirmados <= capacidad_maxima")
+    elif delta_pendientes > 0:
+        sql_parts.append("AND confirmados < capacidad_maxima")
+
+    result = db.execute(
+        text(" ".join(sql_parts)),
+        {
+            "partido_id": partido_id,
+            "delta_confirmados": delta_confirmados,
+            "delta_pendientes": delta_pendientes,
+        },
+    )
+    if len(sql_parts) > 1 and result.rowcount == 0:
+        raise PartidoCompletoException(msg.PARTIDO_COMPLETO)
+
+    if delta_confirmados:
+        return refresco_confirmados_celdas(db, partido_id)
+    return None
 
 
 class ParticipacionRepository(BaseRepository, ParticipacionRepositoryInterface):
@@ -21,11 +82,18 @@ class ParticipacionRepository(BaseRepository, ParticipacionRepositoryInterface):
             """
         )
 
-        with self.database_client.get_session("tt") as db:
+        with self._sesion() as db:
+            # Reserva el cupo antes de insertar (bloquea la fila del partido)
+            refrescar = _ajustar_contadores(db, participacion_data['partido_id'], None, participacion_data['estado'])
             result = db.execute(sql, participacion_data)
-            db.commit()
+            self._confirmar(db)
             participacion_data['id'] = result.lastrowid
 
+        if refrescar is not None:
+            self._despues_de_confirmar(refrescar)
+
+        self._marcar_escritura_usuarios([participacion_data['jugador_id']])
+
         return participacion_data
 
     def obtener_por_id(self, participacion_id: int) -> Optional[Dict[str, Any]]:
@@ -45,7 +113,7 @@ class ParticipacionRepository(BaseRepository, ParticipacionRepositoryInterface):
             """
         )
 
-        with self.database_client.get_session("tt") as db:
+        with self._sesion() as db:
             result = db.execute(sql, {"participacion_id": participacion_id}).fetchone()
             if result is None:
                 return None
@@ -80,7 +148,7 @@ class ParticipacionRepository(BaseRepository, ParticipacionRepositoryInterface):
             """
         )
 
-        with self.database_client.get_session("tt") as db:
+        with self._sesion() as db:
             result = db.execute(sql, {
                 "partido_id": partido_id,
                 "jugador_id": jugador_id
@@ -115,7 +183,7 @@ class ParticipacionRepository(BaseRepository, ParticipacionRepositoryInterface):
             """
         )
 
-        with self.database_client.get_session("tt") as db:
+        with self._sesion() as db:
             results = db.execute(sql, {"partido_id": partido_id}).fetchall()
 
         return [
@@ -140,7 +208,7 @@ class ParticipacionRepository(BaseRepository, ParticipacionRepositoryInterface):
             """
         )
 
-        with self.database_client.get_session("tt") as db:
+        with self._sesion() as db:
             result = db.execute(sql, {
                 "partido_id": partido_id,
                 "estado": estado
@@ -160,20 +228,24 @@ class ParticipacionRepository(BaseRepository, ParticipacionRepositoryInterface):
 
         participacion_data['id'] = participacion_id
 
-        with self.database_client.get_session("tt") as db:
-            db.execute(sql, participacion_data)
-            db.commit()
+        with self._sesion() as db:
+            # Estado anterior (bloqueando la fila) para ajustar los contadores
+            anterior = db.execute(
+                text("SELECT partido_id, jugador_id, estado FROM participaciones WHERE id = :id FOR UPDATE"),
+                {"id": participacion_id},
+            ).fetchone()
 
-        return participacion_data
+            refrescar = None
+            if anterior is not None:
+                refrescar = _ajustar_contadores(db, anterior.partido_id, anterior.estado, participacion_data['estado'])
+                self._marcar_escritura_usuarios([anterior.jugador_id])
+            db.execute(sql, participacion_data)
+            self._confirmar(db)
 
-    def eliminar_por_partido(self, partido_id: int) -> int:
-        """Elimina todas las participaciones de un partido"""
-        sql = text("DELETE FROM participaciones WHERE partido_id = :partido_id")
+        if refrescar is not None:
+            self._despues_de_confirmar(refrescar)
 
-        with self.database_client.get_session("tt") as db:
-            result = db.execute(sql, {"partido_id": partido_id})
-            db.commit()
-            return result.rowcount
+        return participacion_data
 
     def existe_participacion_activa(self, partido_id: int, jugador_id: int) -> bool:
         """Verifica si existe una participación activa"""
@@ -187,10 +259,47 @@ class ParticipacionRepository(BaseRepository, ParticipacionRepositoryInterface):
             """
         )
 
-        with self.database_client.get_session("tt") as db:
+        with self._sesion() as db:
             result = db.execute(sql, {
                 "partido_id": partido_id,
                 "jugador_id": jugador_id
             }).fetchone()
 
-        return result.total > 0 if result else False
\ No newline at end of file
+        return result.total > 0 if result else False
+
+    def obtener_jugadores_activos(self, partido_id: int, jugador_ids: List[int]) -> Set[int]:
+        """Obtiene los jugadores, entre los dados, con participación activa en el partido"""
+        sql = text(
+            """
+            SELECT jugador_id
+            FROM participaciones
+            WHERE partido_id = :partido_id
+            AND jugador_id IN :jugador_ids
+            AND estado IN ('Confirmado', 'Pendiente')
+            """
+        ).bindparams(bindparam("jugador_ids", expanding=True))
+
+        with self._sesion() as db:
+            results = db.execute(sql, {"partido_id": partido_id, "jugador_ids": jugador_ids}).fetchall()
+
+        return {row.jugador_id for row in results}
+
+    def obtener_partidos_activos(self, jugador_id: int, partido_ids: List[int]) -> Set[int]:
+        """Obtiene los partidos, entre los dados, en los que el jugador tiene participación activa"""
+        if not partido_ids:
+            return set()
+
+        sql = text(
+            """
+            SELECT partido_id
+            FROM participaciones
+            WHERE partido_id IN :partido_ids
+            AND jugador_id = :jugador_id
+            AND estado IN ('Confirmado', 'Pendiente')
+            """
+        ).bindparams(bindparam("partido_ids", expanding=True))
+
+        with self._sesion() as db:
+            results = db.execute(sql, {"jugador_id": jugador_id, "partido_ids": partido_ids}).fetchall()
+
+        return {row.partido_id for row in results}
@@ -1,10 +1,86 @@
 """Implementación del repositorio de Partidos"""
-from typing import List, Optional, Dict, Any
+from typing import Callable, Iterable, List, Optional, Dict, Any, Set, Tuple
 from datetime import datetime
-from sqlalchemy import text
+from sqlalchemy import bindparam, text
 
 from app.domain.repositories.partidos import PartidoRepositoryInterface
-from app.infra.database.repositories.base import BaseRepository
+from app.infra.cache.cache import cache_partidos_celda
+from app.infra.database.repositories.base import BaseRepository, solo_lectura_de_usuario
+from app.utils.constants import PRECISIONES_GEOHASH_PARTIDOS
+from app.utils.date_utils import normalizar_texto
+from app.utils.geohash import codificar_geohash, limites_celda
+
+def celdas_partido(latitud: float, longitud: float) -> Set[str]:
+    """Celdas de geohash (una por precisión) del snapshot de búsqueda que contienen una ubicación"""
+    return {
+        codificar_geohash(float(latitud), float(longitud), precision)
+        for precision in PRECISIONES_GEOHASH_PARTIDOS
+    }
+
+
+def _invalidar_celdas(celdas: Set[str]) -> None:
+    """
+    Invalida el snapshot de las celdas ya y otra vez al terminar la transacción,
+    por si una lectura concurrente volvió a cachear el estado anterior
+    """
+    def invalidar():
+        for celda in celdas:
+            cache_partidos_celda.invalidar(celda)
+
+    invalidar()
+    BaseRepository._despues_de_finalizar(invalidar)
+
+
+def invalidar_celdas_partidos(db, partido_ids: List[int]) -> None:
+    """Invalida el snapshot de las celdas donde están los partidos dados"""
+    sql = text("SELECT latitud, longitud FROM partidos WHERE id IN :ids").bindparams(
+        bindparam("ids", expanding=True)
+    )
+    filas = db.execute(sql, {"ids": partido_ids}).fetchall()
+    _invalidar_celdas({celda for row in filas for celda in celdas_partido(row.latitud, row.longitud)})
+
+
+def refresco_confirmados_celdas(db, partido_id: int) -> Callable[[], None]:
+    """
+    Prepara la actualización en su lugar del snapshot de búsqueda cuando
+    cambian los confirmados del partido (sin descartar las celdas, que a
+    precisión 3 cubren toda un área metropolitana): en cada celda cacheada
+    se actualizan sus jugadores_confirmados, o se saca el partido si se llenó.
+    Si volvió a tener cupo no está en el snapshot y esa celda se invalida.
+
+    Lee el partido con la sesión de la transacción; la función devuelta debe
+    ejecutarse una vez confirmada.
+    """
+    fila = db.execute(
+        text("SELECT latitud, longitud, confirmados, capacidad_maxima FROM partidos WHERE id = :id"),
+        {"id": partido_id},
+    ).fetchone()
+    if fila is None:
+        return lambda: None
+
+    celdas = celdas_partido(fila.latitud, fila.longitud)
+    confirmados, con_cupo = fila.confirmados, fila.confirmados < fila.capacidad_maxima
+
+    def refrescar_celda(partidos: List[Dict[str, Any]]) -> Optional[List[Dict[str, Any]]]:
+        if not any(partido["id"] == partido_id for partido in partidos):
+            return None if con_cupo else partidos
+        if not con_cupo:
+            return [partido for partido in partidos if partido["id"] != partido_id]
+        return [
+            {**partido, "jugadores_confirmados": confirmados} if partido["id"] == partido_id else partido
+            for partido in partidos
+        ]
+
+    def refrescar():
+        for celda in celdas:
+            cache_partidos_celda.modificar(celda, refrescar_celda)
+
+    return refrescar
+
+
+def _version_usuarios(organizador_version: Optional[int], participantes) -> int:
+    """Suma de versiones de los usuarios nombrados en el detalle (ver obtener_version)"""
+    return (organizador_version or 0) + sum(row.jugador_version for row in participantes)
 
 
 class PartidoRepository(BaseRepository, PartidoRepositoryInterface):
@@ -18,20 +94,23 @@ class PartidoRepository(BaseRepository, PartidoRepositoryInterface):
                 titulo, dinero_por_persona, descripcion, fecha_hora,
                 latitud, longitud, ubicacion_texto, capacidad_maxima,
                 organizador_id, tipo_partido, tipo_futbol, edad_minima,
-                estado, contrasena
+                estado, contrasena, titulo_normalizado
             ) VALUES (
                 :titulo, :dinero_por_persona, :descripcion, :fecha_hora,
                 :latitud, :longitud, :ubicacion_texto, :capacidad_maxima,
                 :organizador_id, :tipo_partido, :tipo_futbol, :edad_minima,
-                :estado, :contrasena
+                :estado, :contrasena, :titulo_normalizado
             )
             """
         )
 
-        with self.database_client.get_session("tt") as db:
-            result = db.execute(sql, partido_data)
-            db.commit()
+        with self._sesion() as db:
+            result = db.execute(
+                sql, {**partido_data, "titulo_normalizado": normalizar_texto(partido_data['titulo'])}
+            )
             partido_data['id'] = result.lastrowid
+            _invalidar_celdas(celdas_partido(partido_data['latitud'], partido_data['longitud']))
+            self._confirmar(db)
 
         return partido_data
 
@@ -43,13 +122,13 @@ class PartidoRepository(BaseRepository, PartidoRepositoryInterface):
                 id, titulo, dinero_por_persona, descripcion, fecha_hora,
                 latitud, longitud, ubicacion_texto, capacidad_maxima,
                 organizador_id, tipo_partido, tipo_futbol, edad_minima,
-                estado, contrasena
+                estado, contrasena, confirmados, pendientes
             FROM partidos
             WHERE id = :partido_id
             """
         )
 
-        with self.database_client.get_session("tt") as db:
+        with self._sesion() as db:
             result = db.execute(sql, {"partido_id": partido_id}).fetchone()
             if result is None:
                 return None
@@ -69,9 +148,117 @@ class PartidoRepository(BaseRepository, PartidoRepositoryInterface):
             'tipo_futbol': result.tipo_futbol,
             'edad_minima': result.edad_minima,
             'estado': result.estado,
-            'contrasena': result.contrasena
+            'contrasena': result.contrasena,
+            'confirmados': result.confirmados,
+            'pendientes': result.pendientes
         }
 
+    def obtener_detalle(self, partido_id: int) -> Optional[Dict[str, Any]]:
+        """
+        Obtiene un partido con el nombre del organizador y sus participantes
+        confirmados y pendientes (confirmados primero) en dos consultas
+        """
+        sql_partido = text(
+            """
+            SELECT 
+                p.id, p.titulo, p.dinero_por_persona, p.descripcion, p.fecha_hora,
+                p.latitud, p.longitud, p.ubicacion_texto, p.capacidad_maxima,
+                p.organizador_id, p.tipo_partido, p.tipo_futbol, p.edad_minima,
+                p.estado, p.contrasena, p.version,
+                u.nombre as organizador_nombre,
+                u.version as organizador_version
+            FROM partidos p
+            LEFT JOIN usuarios u ON u.id = p.organizador_id
+            WHERE p.id = :partido_id
+            """
+        )
+        sql_participantes = text(
+            """
+            SELECT 
+                pa.id, 
+                pa.partido_id, 
+                pa.jugador_id, 
+                u.nombre as jugador_nombre,
+                u.version as jugador_version,
+                pa.estado, 
+                pa.fecha_postulacion
+            FROM participaciones pa
+            INNER JOIN usuarios u ON pa.jugador_id = u.id
+            WHERE pa.partido_id = :partido_id
+            AND pa.estado IN ('Confirmado', 'Pendiente')
+            ORDER BY (pa.estado != 'Confirmado'), pa.fecha_postulacion ASC
+            """
+        )
+
+        with self._sesion() as db:
+            result = db.execute(sql_partido, {"partido_id": partido_id}).fetchone()
+            if result is None:
+                return None
+            participantes = db.execute(sql_participantes, {"partido_id": partido_id}).fetchall()
+
+        return {
+            'id': result.id,
+            'titulo': result.titulo,
+            'dinero_por_persona': result.dinero_por_persona,
+            'descripcion': result.descripcion,
+            'fecha_hora': result.fecha_hora,
+            'latitud': result.latitud,
+            'longitud': result.longitud,
+            'ubicacion_texto': result.ubicacion_texto,
+            'capacidad_maxima': result.capacidad_maxima,
+            'organizador_id': result.organizador_id,
+            'organizador_nombre': result.organizador_nombre,
+            'tipo_partido': result.tipo_partido,
+            'tipo_futbol': result.tipo_futbol,
+            'edad_minima': result.edad_minima,
+            'estado': result.estado,
+            'contrasena': result.contrasena,
+            'version': result.version,
+            'version_usuarios': _version_usuarios(result.organizador_version, participantes),
+            'participantes': [
+                {
+                    'id': row.id,
+                    'partido_id': row.partido_id,
+                    'jugador_id': row.jugador_id,
+                    'jugador_nombre': row.jugador_nombre,
+                    'estado': row.estado,
+                    'fecha_postulacion': row.fecha_postulacion
+                }
+                for row in participantes
+            ],
+        }
+
+    def obtener_version(self, partido_id: int) -> Optional[Dict[str, int]]:
+        """
+        Obtiene las versiones que identifican el detalle del partido en una
+        sola consulta: la del partido (cambia con sus datos y con cada alta o
+        baja de participantes activos) y la suma de las versiones de los
+        usuarios que el detalle nombra, igual que obtener_detalle
+        """
+        sql = text(
+            """
+            SELECT
+                p.version,
+                COALESCE((SELECT u.version FROM usuarios u WHERE u.id = p.organizador_id), 0)
+                + COALESCE((
+                    SELECT SUM(u.version)
+                    FROM participaciones pa
+                    INNER JOIN usuarios u ON pa.jugador_id = u.id
+                    WHERE pa.partido_id = p.id
+                    AND pa.estado IN ('Confirmado', 'Pendiente')
+                ), 0) as version_usuarios
+            FROM partidos p
+            WHERE p.id = :partido_id
+            """
+        )
+
+        with self._sesion() as db:
+            result = db.execute(sql, {"partido_id": partido_id}).fetchone()
+            if result is None:
+                return None
+
+        return {"version": result.version, "version_usuarios": int(result.version_usuarios)}
+
     def actualizar(self, partido_id: int, partido_data: Dict[str, Any]) -> Dict[str, Any]:
         """Actualiza un partido existente"""
         sql = text(
@@ -90,92 +277,510 @@ class PartidoRepository(BaseRepository, PartidoRepositoryInterface):
                 tipo_futbol = :tipo_futbol,
                 edad_minima = :edad_minima,
                 estado = :estado,
-                contrasena = :contrasena
+                contrasena = :contrasena,
+                titulo_normalizado = :titulo_normalizado,
+                version = version + 1
             WHERE id = :id
             """
         )
 
         partido_data['id'] = partido_id
 
-        with self.database_client.get_session("tt") as db:
-            db.execute(sql, partido_data)
-            db.commit()
+        with self._sesion() as db:
+            # Celda anterior (si cambió la ubicación el partido sale de ella) y nueva
+            invalidar_celdas_partidos(db, [partido_id])
+            _invalidar_celdas(celdas_partido(partido_data['latitud'], partido_data['longitud']))
+            db.execute(
+                sql, {**partido_data, "titulo_normalizado": normalizar_texto(partido_data['titulo'])}
+            )
+            self._confirmar(db)
 
         return partido_data
 
     def eliminar(self, partido_id: int) -> bool:
-        """Elimina un partido"""
+        """Elimina un partido (participaciones, invitaciones y calificaciones caen en cascada)"""
         sql = text("DELETE FROM partidos WHERE id = :partido_id")
 
-        with self.database_client.get_session("tt") as db:
+        with self._sesion() as db:
+            invalidar_celdas_partidos(db, [partido_id])
             result = db.execute(sql, {"partido_id": partido_id})
-            db.commit()
+            self._confirmar(db)
             return result.rowcount > 0
 
-    def buscar(
+    def eliminar_lote(
         self,
-        titulo: Optional[str] = None,
-        fecha_desde: Optional[datetime] = None,
-        fecha_hasta: Optional[datetime] = None,
-        tipo_futbol: Optional[str] = None,
-        edad_minima: Optional[int] = None,
-    ) -> List[Dict[str, Any]]:
-        """Busca partidos según criterios"""
-        sql_parts = [
+        partido_ids: List[int],
+        organizador_id: Optional[int] = None,
+        fecha_minima: Optional[datetime] = None,
+    ) -> Dict[str, Any]:
+        """
+        Elimina varios partidos con un único DELETE; las tablas dependientes se
+        borran por ON DELETE CASCADE. Como el rowcount del DELETE no incluye las
+        filas en cascada, se cuentan antes dentro de la misma transacción, con
+        los partidos bloqueados (FOR UPDATE) para que no se agreguen filas hijas.
+
+        Args:
+            partido_ids: IDs de los partidos a eliminar
+            organizador_id: Si se indica, solo elimina los partidos de ese organizador
+            fecha_minima: Si se indica, solo elimina los partidos con fecha_hora posterior
+
+        Returns:
+            Dict: IDs eliminados y filas borradas por tabla
+        """
+        sql_parts = ["SELECT id FROM partidos WHERE id IN :partido_ids"]
+        params: Dict[str, Any] = {"partido_ids": partido_ids}
+
+        if organizador_id is not None:
+            sql_parts.append("AND organizador_id = :organizador_id")
+            params["organizador_id"] = organizador_id
+
+        if fecha_minima is not None:
+            sql_parts.append("AND fecha_hora >= :fecha_minima")
+            params["fecha_minima"] = fecha_minima
+
+        sql_parts.append("FOR UPDATE")
+        sql = text(" ".join(sql_parts)).bindparams(bindparam("partido_ids", expanding=True))
+
+        sql_conteos = text(
             """
-            SELECT 
-                id, titulo, dinero_por_persona, descripcion, fecha_hora,
-                latitud, longitud, ubicacion_texto, capacidad_maxima,
-                organizador_id, tipo_partido, tipo_futbol, edad_minima,
-                estado, contrasena
-            FROM partidos
-            WHERE 1=1
+            SELECT
+                (SELECT COUNT(*) FROM participaciones WHERE partido_id IN :ids) as participaciones,
+                (SELECT COUNT(*) FROM invitaciones WHERE partido_id IN :ids) as invitaciones,
+                (SELECT COUNT(*) FROM calificaciones WHERE partido_id IN :ids) as calificaciones
             """
+        ).bindparams(bindparam("ids", expanding=True))
+        sql_eliminar = text("DELETE FROM partidos WHERE id IN :ids").bindparams(bindparam("ids", expanding=True))
+
+        filas = {
+            "partidos": 0,
+            "participaciones": 0,
+            "invitaciones": 0,
+            "calificaciones": 0,
+        }
+
+        with self._sesion() as db:
+            ids = [row.id for row in db.execute(sql, params).fetchall()]
+            if ids:
+                invalidar_celdas_partidos(db, ids)
+                filas.update(db.execute(sql_conteos, {"ids": ids}).fetchone()._mapping)
+                filas["partidos"] = db.execute(sql_eliminar, {"ids": ids}).rowcount
+                self._confirmar(db)
+
+        return {"partido_ids": ids, "filas_por_tabla": filas}
+
+    def obtener_por_celdas(self, celdas: Iterable[str]) -> List[Dict[str, Any]]:
+        """
+        Obtiene los partidos futuros con cupo de las celdas de geohash dadas,
+        desde el snapshot por celda (cache_partidos_celda). Cada celda se carga
+        con una consulta por rango de ubicación (idx_partidos_ubicacion) y se
+        invalida cuando se crea, modifica o elimina un partido en ella; cuando
+        cambian sus confirmados se actualiza en su lugar (ver
+        refresco_confirmados_celdas). Como el snapshot puede tener hasta el TTL de
+        antigüedad, quien lo use debe volver a filtrar por fecha_hora.
+
+        No es solo_lectura: el snapshot se comparte entre requests, así que se
+        carga del primario para no cachear el retraso de una réplica. Si lo
+        carga una transacción con escrituras sin confirmar en la celda, esas
+        escrituras lo invalidan al terminar (ver _invalidar_celdas).
+        """
+        return [
+            partido
+            for celda in sorted(set(celdas))
+            for partido in cache_partidos_celda.obtener(celda, lambda: self._cargar_celda(celda))
         ]
-        params = {}
 
-        if titulo:
-            sql_parts.append("AND LOWER(titulo) LIKE :titulo")
-            params["titulo"] = f"%{titulo.lower()}%"
+    def _cargar_celda(self, celda: str) -> List[Dict[str, Any]]:
+        """Carga desde el primario los partidos futuros con cupo de una celda"""
+        sql = text(
+            """
+            SELECT
+                p.id, p.titulo, p.titulo_normalizado, p.dinero_por_persona, p.descripcion,
+                p.fecha_hora, p.latitud, p.longitud, p.ubicacion_texto,
+                p.capacidad_maxima, p.organizador_id, p.tipo_partido,
+                p.tipo_futbol, p.edad_minima, p.estado,
+                p.confirmados as jugadores_confirmados,
+                (SELECT u.nombre FROM usuarios u WHERE u.id = p.organizador_id) as organizador_nombre
+            FROM partidos p
+            WHERE p.latitud >= :lat_min AND p.latitud < :lat_max
+            AND p.longitud >= :lon_min AND p.longitud < :lon_max
+            AND p.fecha_hora >= NOW()
+            AND p.confirmados < p.capacidad_maxima
+            """
+        )
+        lat_min, lat_max, lon_min, lon_max = limites_celda(celda)
+
+        with self._sesion() as db:
+            results = db.execute(sql, {
+                "lat_min": lat_min,
+                "lat_max": lat_max,
+                "lon_min": lon_min,
+                "lon_max": lon_max,
+            }).fetchall()
+
+        return [
+            {
+                "id": row.id,
+                "titulo": row.titulo,
+                "titulo_normalizado": row.titulo_normalizado,
+                "dinero_por_persona": row.dinero_por_persona,
+                "descripcion": row.descripcion,
+                "fecha_hora": row.fecha_hora,
+                "latitud": float(row.latitud),
+                "longitud": float(row.longitud),
+                "ubicacion_texto": row.ubicacion_texto,
+                "capacidad_maxima": row.capacidad_maxima,
+                "jugadores_confirmados": row.jugadores_confirmados,
+                "organizador_id": row.organizador_id,
+                "organizador_nombre": row.organizador_nombre,
+                "tipo_partido": row.tipo_partido,
+                "tipo_futbol": row.tipo_futbol,
+                "edad_minima": row.edad_minima,
+                "estado": row.estado,
+            }
+            for row in results
+        ]
 
-        if tipo_futbol:
-            sql_parts.append("AND tipo_futbol = :tipo_futbol")
-            params["tipo_futbol"] = tipo_futbol
+    @solo_lectura_de_usuario("usuario_id")
+    def obtener_calendario(
+        self,
+        usuario_id: int,
+        fecha_desde: datetime,
+        fecha_hasta: datetime,
+    ) -> List[Dict[str, Any]]:
+        """Obtiene los partidos futuros en los que el usuario está confirmado"""
+        sql = text(
+            """
+            SELECT 
+                p.id,
+                p.titulo,
+                p.fecha_hora,
+                p.ubicacion_texto,
+                p.organizador_id,
+                p.capacidad_maxima,
+                p.tipo_partido,
+                (p.organizador_id = :usuario_id) as es_organizador,
+                p.confirmados as jugadores_confirmados
+            FROM partidos p
+            INNER JOIN participaciones pa ON p.id = pa.partido_id
+            WHERE pa.jugador_id = :usuario_id
+            AND pa.estado = 'Confirmado'
+            AND p.fecha_hora >= :fecha_desde
+            AND p.fecha_hora <= :fecha_hasta
+            AND p.fecha_hora >= :ahora
+            ORDER BY p.fecha_hora ASC
+            """
+        )
 
-        if edad_minima is not None:
-            sql_parts.append("AND edad_minima <= :edad_minima")
-            params["edad_minima"] = edad_minima
+        with self._sesion() as db:
+            results = db.execute(sql, {
+                "usuario_id": usuario_id,
+                "fecha_desde": fecha_desde,
+                "fecha_hasta": fecha_hasta,
+                "ahora": datetime.now()
+            }).fetchall()
 
-        if fecha_desde:
-            sql_parts.append("AND fecha_hora >= :fecha_desde")
-            params["fecha_desde"] = fecha_desde
+        return [
+            {
+                "id": row.id,
+                "titulo": row.titulo,
+                "fecha_hora": row.fecha_hora,
+                "ubicacion_texto": row.ubicacion_texto,
+                "es_organizador": bool(row.es_organizador),
+                "jugadores_confirmados": row.jugadores_confirmados,
+                "capacidad_maxima": row.capacidad_maxima,
+                "tipo_partido": row.tipo_partido,
+            }
+            for row in results
+        ]
 
-        if fecha_hasta:
-            sql_parts.append("AND fecha_hora <= :fecha_hasta")
-            params["fecha_hasta"] = fecha_hasta
+    @solo_lectura_de_usuario("usuario_id")
+    def obtener_historial(
+        self,
+        usuario_id: int,
+        cursor: Optional[Tuple[datetime, int]] = None,
+        limite: int = 20,
+    ) -> List[Dict[str, Any]]:
+        """
+        Obtiene los partidos ya jugados en los que el usuario estuvo confirmado,
+        del más reciente al más viejo, juntando las tablas calientes con las de
+        archivo. Cada rama se pagina por (fecha_hora, id) antes de unirlas, así
+        ninguna lee más de limite filas.
+        """
+        columnas = """
+                p.id,
+                p.titulo,
+                p.fecha_hora,
+                p.ubicacion_texto,
+                p.estado,
+                p.tipo_partido,
+                (p.organizador_id = :usuario_id) as es_organizador,
+                p.confirmados as jugadores_confirmados,
+                p.capacidad_maxima,
+        """
+        filtro_cursor = ""
+        params = {"usuario_id": usuario_id, "ahora": datetime.now(), "limite": limite}
+        if cursor is not None:
+            filtro_cursor = (
+                "AND (p.fecha_hora < :cursor_fecha "
+                "OR (p.fecha_hora = :cursor_fecha AND p.id < :cursor_id))"
+            )
+            params["cursor_fecha"], params["cursor_id"] = cursor
 
-        sql = text(" ".join(sql_parts))
+        sql = text(
+            f"""
+            SELECT * FROM (
+                SELECT {columnas} 0 as archivado
+                FROM partidos p
+                INNER JOIN participaciones pa ON p.id = pa.partido_id
+                WHERE pa.jugador_id = :usuario_id
+                AND pa.estado = 'Confirmado'
+                AND p.fecha_hora < :ahora
+                {filtro_cursor}
+                ORDER BY p.fecha_hora DESC, p.id DESC
+                LIMIT :limite
+            ) calientes
+            UNION ALL
+            SELECT * FROM (
+                SELECT {columnas} 1 as archivado
+                FROM partidos_archivo p
+                INNER JOIN participaciones_archivo pa ON p.id = pa.partido_id
+                WHERE pa.jugador_id = :usuario_id
+                AND pa.estado = 'Confirmado'
+                {filtro_cursor}
+                ORDER BY p.fecha_hora DESC, p.id DESC
+                LIMIT :limite
+            ) archivados
+            ORDER BY fecha_hora DESC, id DESC
+            LIMIT :limite
+            """
+        )
 
-        with self.database_client.get_session("tt") as db:
+        with self._sesion() as db:
             results = db.execute(sql, params).fetchall()
 
         return [
             {
-                'id': row.id,
-                'titulo': row.titulo,
-                'dinero_por_persona': row.dinero_por_persona,
-                'descripcion': row.descripcion,
-                'fecha_hora': row.fecha_hora,
-                'latitud': row.latitud,
-                'longitud': row.longitud,
-                'ubicacion_texto': row.ubicacion_texto,
-                'capacidad_maxima': row.capacidad_maxima,
-                'organizador_id': row.organizador_id,
-                'tipo_partido': row.tipo_partido,
-                'tipo_futbol': row.tipo_futbol,
-                'edad_minima': row.edad_minima,
-                'estado': row.estado,
-                'contrasena': row.contrasena
+                "id": row.id,
+                "titulo": row.titulo,
+                "fecha_hora": row.fecha_hora,
+                "ubicacion_texto": row.ubicacion_texto,
+                "estado": row.estado,
+                "tipo_partido": row.tipo_partido,
+                "es_organizador": bool(row.es_organizador),
+                "jugadores_confirmados": row.jugadores_confirmados,
+                "capacidad_maxima": row.capacidad_maxima,
+                "archivado": bool(row.archivado),
             }
             for row in results
-        ]
\ No newline at end of file
+        ]
+
+    def finalizar_vencidos(self, hasta: datetime, lote: int = 500) -> int:
+        """
+        Pasa a Finalizado un lote de partidos Pendiente/Confirmado con fecha_hora
+        anterior a hasta (idx_partidos_estado_fecha). Cada llamada es una
+        transacción corta; el ciclo de vida la repite hasta agotar los vencidos.
+
+        Returns:
+            int: Cantidad de partidos finalizados
+        """
+        sql = text(
+            """
+            UPDATE partidos
+            SET estado = 'Finalizado', version = version + 1
+            WHERE estado IN ('Pendiente', 'Confirmado')
+            AND fecha_hora < :hasta
+            ORDER BY fecha_hora
+            LIMIT :lote
+            """
+        )
+
+        with self._sesion() as db:
+            result = db.execute(sql, {"hasta": hasta, "lote": lote})
+            self._confirmar(db)
+            return result.rowcount
+
+    def archivar(self, antes_de: datetime, lote: int = 500) -> Dict[str, int]:
+        """
+        Mueve un lote de partidos Finalizado/Cancelado con fecha_hora anterior a
+        antes_de a las tablas frías, junto con sus participaciones,
+        invitaciones y calificaciones, y los borra de las tablas calientes (las
+        filas hijas caen en cascada). Los partidos se toman con SKIP LOCKED
+        para que varios procesos puedan archivar a la vez sin esperarse.
+
+        Returns:
+            Dict: Filas archivadas por tabla
+        """
+        sql_ids = text(
+            """
+            SELECT id
+            FROM partidos
+            WHERE estado IN ('Finalizado', 'Cancelado')
+            AND fecha_hora < :antes_de
+            ORDER BY fecha_hora
+            LIMIT :lote
+            FOR UPDATE SKIP LOCKED
+            """
+        )
+        sql_partidos = text(
+            """
+            INSERT INTO partidos_archivo (
+                id, titulo, dinero_por_persona, descripcion, fecha_hora,
+                latitud, longitud, ubicacion_texto, capacidad_maxima,
+                organizador_id, tipo_partido, tipo_futbol, edad_minima,
+                estado, contrasena, titulo_normalizado, confirmados, pendientes,
+                created_at, updated_at
+            )
+            SELECT
+                id, titulo, dinero_por_persona, descripcion, fecha_hora,
+                latitud, longitud, ubicacion_texto, capacidad_maxima,
+                organizador_id, tipo_partido, tipo_futbol, edad_minima,
+                estado, contrasena, titulo_normalizado, confirmados, pendientes,
+                created_at, updated_at
+            FROM partidos
+            WHERE id IN :ids
+            """
+        ).bindparams(bindparam("ids", expanding=True))
+        sql_participaciones = text(
+            """
+            INSERT INTO participaciones_archivo (
+                id, partido_id, jugador_id, estado, fecha_postulacion, created_at, updated_at
+            )
+            SELECT id, partido_id, jugador_id, estado, fecha_postulacion, created_at, updated_at
+            FROM participaciones
+            WHERE partido_id IN :ids
+            """
+        ).bindparams(bindparam("ids", expanding=True))
+        sql_invitaciones = text(
+            """
+            INSERT INTO invitaciones_archivo (
+                id, partido_id, jugador_id, estado, fecha_invitacion, fecha_respuesta, created_at, updated_at
+            )
+            SELECT id, partido_id, jugador_id, estado, fecha_invitacion, fecha_respuesta, created_at, updated_at
+            FROM invitaciones
+            WHERE partido_id IN :ids
+            """
+        ).bindparams(bindparam("ids", expanding=True))
+        sql_calificaciones = text(
+            """
+            INSERT INTO calificaciones_archivo (
+                id, partido_id, calificador_id, calificado_id, puntuacion, comentario, created_at
+            )
+            SELECT id, partido_id, calificador_id, calificado_id, puntuacion, comentario, created_at
+            FROM calificaciones
+            WHERE partido_id IN :ids
+            """
+        ).bindparams(bindparam("ids", expanding=True))
+        sql_eliminar = text("DELETE FROM partidos WHERE id IN :ids").bindparams(bindparam("ids", expanding=True))
+
+        archivadas = {"partidos": 0, "participaciones": 0, "invitaciones": 0, "calificaciones": 0}
+
+        with self._sesion() as db:
+            ids = [row.id for row in db.execute(sql_ids, {"antes_de": antes_de, "lote": lote}).fetchall()]
+            if not ids:
+                return archivadas
+
+            archivadas["partidos"] = db.execute(sql_partidos, {"ids": ids}).rowcount
+            archivadas["participaciones"] = db.execute(sql_participaciones, {"ids": ids}).rowcount
+            archivadas["invitaciones"] = db.execute(sql_invitaciones, {"ids": ids}).rowcount
+            archivadas["calificaciones"] = db.execute(sql_calificaciones, {"ids": ids}).rowcount
+            db.execute(sql_eliminar, {"ids": ids})
+            self._confirmar(db)
+
+        return archivadas
+
+    def obtener_rezago(self, hasta_finalizar: datetime, antes_de_archivar: datetime) -> Dict[str, Optional[datetime]]:
+        """
+        Obtiene la fecha_hora del partido más viejo pendiente de finalizar y
+        la del más viejo pendiente de archivar (None si no hay)
+        """
+        sql = text(
+            """
+            SELECT
+                (SELECT MIN(fecha_hora) FROM partidos
+                 WHERE estado IN ('Pendiente', 'Confirmado') AND fecha_hora < :hasta_finalizar) as finalizar,
+                (SELECT MIN(fecha_hora) FROM partidos
+                 WHERE estado IN ('Finalizado', 'Cancelado') AND fecha_hora < :antes_de_archivar) as archivar
+            """
+        )
+
+        with self._sesion() as db:
+            result = db.execute(sql, {
+                "hasta_finalizar": hasta_finalizar,
+                "antes_de_archivar": antes_de_archivar,
+            }).fetchone()
+
+        return {"finalizar": result.finalizar, "archivar": result.archivar}
+
+    def reconciliar_contadores(self, lote: int = 1000) -> int:
+        """
+        Recalcula confirmados/pendientes desde participaciones y corrige los
+        partidos que difieran. Recorre la tabla por rangos de ID confirmando
+        cada lote para no mantener bloqueos largos.
+
+        Returns:
+            int: Cantidad de partidos corregidos
+        """
+        sql = text(
+            """
+            UPDATE partidos p
+            LEFT JOIN (
+                SELECT
+                    partido_id,
+                    SUM(estado = 'Confirmado') as confirmados,
+                    SUM(estado = 'Pendiente') as pendientes
+                FROM participaciones
+                WHERE partido_id >= :desde_id AND partido_id < :hasta_id
+                GROUP BY partido_id
+            ) c ON c.partido_id = p.id
+            SET
+                p.confirmados = COALESCE(c.confirmados, 0),
+                p.pendientes = COALESCE(c.pendientes, 0)
+            WHERE p.id >= :desde_id AND p.id < :hasta_id
+            AND (
+                p.confirmados <> COALESCE(c.confirmados, 0)
+                OR p.pendientes <> COALESCE(c.pendientes, 0)
+            )
+            """
+        )
+
+        with self._sesion() as db:
+            max_id = db.execute(text("SELECT COALESCE(MAX(id), 0) as max_id FROM partidos")).fetchone().max_id
+
+        corregidos = 0
+        for desde_id in range(1, max_id + 1, lote):
+            with self._sesion() as db:
+                result = db.execute(sql, {"desde_id": desde_id, "hasta_id": desde_id + lote})
+                self._confirmar(db)
+                corregidos += result.rowcount
+
+        return corregidos
+
+    def reindexar_titulos(self, lote: int = 500) -> int:
+        """
+        Recalcula titulo_normalizado de todos los partidos, confirmando cada
+        lote por rango de ID.
+
+        Returns:
+            int: Cantidad de partidos reindexados
+        """
+        with self._sesion() as db:
+            max_id = db.execute(text("SELECT COALESCE(MAX(id), 0) as max_id FROM partidos")).fetchone().max_id
+
+        reindexados = 0
+        for desde_id in range(1, max_id + 1, lote):
+            with self._sesion() as db:
+                partidos = db.execute(
+                    text("SELECT id, titulo FROM partidos WHERE id >= :desde_id AND id < :hasta_id"),
+                    {"desde_id": desde_id, "hasta_id": desde_id + lote},
+                ).fetchall()
+
+                for partido in partidos:
+                    db.execute(
+                        text("UPDATE partidos SET titulo_normalizado = :titulo_normalizado WHERE id = :id"),
+                        {"id": partido.id, "titulo_normalizado": normalizar_texto(partido.titulo)},
+                    )
+
+                self._confirmar(db)
+                reindexados += len(partidos)
+
+        return reindexados
@@ -1,16 +1,30 @@
 """Implementación del repositorio de Usuarios"""
-from typing import Optional, Dict, Any
-from sqlalchemy import text
+from typing import List, Optional, Dict, Any
+from sqlalchemy import text, bindparam
 
 from app.domain.repositories.usuarios import UsuarioRepositoryInterface
-from app.infra.database.repositories.base import BaseRepository
+from app.infra.cache.cache import cache_usuarios
+from app.infra.database.repositories.base import BaseRepository, solo_lectura
+from app.utils.constants import PRECISION_GEOHASH_JUGADORES, INDICE_JUGADORES_TTL_SEGUNDOS
+from app.utils.date_utils import normalizar_texto, normalizar_textos
+from app.utils.geohash import IndiceGeohash
+
+# Índice en memoria de jugadores postulados (compartido por el proceso)
+indice_postulados = IndiceGeohash(
+    precision=PRECISION_GEOHASH_JUGADORES,
+    ttl_segundos=INDICE_JUGADORES_TTL_SEGUNDOS,
+)
 
 
 class UsuarioRepository(BaseRepository, UsuarioRepositoryInterface):
     """Repositorio de usuarios conectado a MySQL"""
 
     def obtener_por_id(self, usuario_id: int) -> Optional[Dict[str, Any]]:
-        """Obtiene un usuario por ID"""
+        """Obtiene un usuario por ID (read-through sobre cache_usuarios)"""
+        return cache_usuarios.obtener(usuario_id, lambda: self._obtener_por_id_db(usuario_id))
+
+    def _obtener_por_id_db(self, usuario_id: int) -> Optional[Dict[str, Any]]:
+        """Obtiene un usuario por ID desde la base de datos"""
         sql = text(
             """
             SELECT 
@@ -24,13 +38,14 @@ class UsuarioRepository(BaseRepository, UsuarioRepositoryInterface):
                 u.descripcion,
                 u.genero,
                 u.posicion,
-                u.postulado
+                u.postulado,
+                u.version
             FROM usuarios u
             WHERE u.id = :idUsuario
             """
         )
 
-        with self.database_client.get_session("tt") as db:
+        with self._sesion() as db:
             result = db.execute(sql, {"idUsuario": usuario_id}).fetchone()
             if result is None:
                 return None
@@ -46,9 +61,30 @@ class UsuarioRepository(BaseRepository, UsuarioRepositoryInterface):
             'descripcion': result.descripcion,
             'genero': result.genero,
             'posicion': result.posicion,
-            'postulado': result.postulado
+            'postulado': result.postulado,
+            'version': result.version
         }
 
+    def obtener_version(self, usuario_id: int) -> Optional[Dict[str, int]]:
+        """
+        Obtiene la versión del usuario y su edad (que cambia sin escrituras),
+        lo que identifica el perfil, con una lectura por clave primaria
+        """
+        sql = text(
+            """
+            SELECT version, TIMESTAMPDIFF(YEAR, fecha_nacimiento, CURDATE()) as edad
+            FROM usuarios
+            WHERE id = :id
+            """
+        )
+
+        with self._sesion() as db:
+            result = db.execute(sql, {"id": usuario_id}).fetchone()
+            if result is None:
+                return None
+
+        return {"version": result.version, "edad": result.edad}
+
     def actualizar(self, usuario_id: int, usuario_data: Dict[str, Any]) -> Dict[str, Any]:
         """Actualiza un usuario en la base de datos"""
         sql = text(
@@ -60,18 +96,34 @@ class UsuarioRepository(BaseRepository, UsuarioRepositoryInterface):
                 latitud = :latitud,
                 longitud = :longitud,
                 ubicacion_texto = :ubicacion_texto,
+                ubicacion_normalizada = :ubicacion_normalizada,
                 descripcion = :descripcion,
                 genero = :genero,
-                posicion = :posicion
+                posicion = :posicion,
+                version = version + 1
             WHERE id = :id
             """
         )
 
         usuario_data['id'] = usuario_id
 
-        with self.database_client.get_session("tt") as db:
-            db.execute(sql, usuario_data)
-            db.commit()
+        with self._sesion() as db:
+            db.execute(
+                sql,
+                {**usuario_data, "ubicacion_normalizada": normalizar_texto(usuario_data['ubicacion_texto'])},
+            )
+            self._confirmar(db)
+
+        self._invalidar_cache(usuario_id)
+
+        # Reubicar en el índice si está postulado (una vez confirmado)
+        latitud, longitud = float(usuario_data['latitud']), float(usuario_data['longitud'])
+
+        def reubicar():
+            if indice_postulados.contiene(usuario_id):
+                indice_postulados.agregar(usuario_id, latitud, longitud)
+
+        self._despues_de_confirmar(reubicar)
 
         return usuario_data
 
@@ -80,14 +132,180 @@ class UsuarioRepository(BaseRepository, UsuarioRepositoryInterface):
         sql = text(
             """
             UPDATE usuarios 
-            SET postulado = :postulado
+            SET postulado = :postulado, version = version + 1
             WHERE id = :id
             """
         )
 
-        with self.database_client.get_session("tt") as db:
+        with self._sesion() as db:
             db.execute(sql, {
                 "id": usuario_id,
                 "postulado": postulacion,
             })
-            db.commit()
\ No newline at end of file
+            self._confirmar(db)
+
+            self._invalidar_cache(usuario_id)
+
+            ubicacion = None
+            if postulacion:
+                ubicacion = db.execute(
+                    text("SELECT latitud, longitud FROM usuarios WHERE id = :id"),
+                    {"id": usuario_id},
+                ).fetchone()
+
+        # Mantener sincronizado el índice de postulados (una vez confirmado)
+        if ubicacion is not None:
+            latitud, longitud = float(ubicacion.latitud), float(ubicacion.longitud)
+            self._despues_de_confirmar(lambda: indice_postulados.agregar(usuario_id, latitud, longitud))
+        else:
+            self._despues_de_confirmar(lambda: indice_postulados.quitar(usuario_id))
+
+    def buscar_postulados_cercanos(
+        self, latitud: float, longitud: float, radio_km: float
+    ) -> Dict[int, float]:
+        """
+        Obtiene los usuarios postulados dentro del radio usando el índice en memoria.
+
+        No es solo_lectura: el índice se comparte en el proceso hasta su TTL, así
+        que se recarga del primario para no fijar el retraso de una réplica.
+        """
+        if not indice_postulados.cargado:
+            self._cargar_indice_postulados()
+
+        return indice_postulados.buscar(latitud, longitud, radio_km)
+
+    @solo_lectura
+    def buscar_postulados(
+        self,
+        ids: List[int],
+        genero: Optional[str] = None,
+        posicion: Optional[str] = None,
+        ubicacion_texto: Optional[str] = None,
+    ) -> List[Dict[str, Any]]:
+        """
+        Obtiene los usuarios postulados entre los IDs dados que cumplen los filtros.
+        ubicacion_texto debe venir normalizado (minúsculas y sin acentos).
+        """
+        sql_parts = [
+            """
+            SELECT 
+                u.id,
+                u.nombre,
+                u.posicion,
+                u.genero,
+                TIMESTAMPDIFF(YEAR, u.fecha_nacimiento, CURDATE()) as edad,
+                u.ubicacion_texto
+            FROM usuarios u
+            WHERE u.postulado = 1
+            AND u.id IN :ids
+            """
+        ]
+        params = {"ids": ids}
+
+        if genero:
+            sql_parts.append("AND u.genero = :genero")
+            params["genero"] = genero
+
+        if posicion:
+            sql_parts.append("AND u.posicion = :posicion")
+            params["posicion"] = posicion
+
+        # Búsqueda parcial, case & accent insensitive (columna ya normalizada al escribir)
+        if ubicacion_texto:
+            sql_parts.append("AND u.ubicacion_normalizada LIKE :ubicacion")
+            params["ubicacion"] = f"%{ubicacion_texto}%"
+
+        sql = text(" ".join(sql_parts)).bindparams(bindparam("ids", expanding=True))
+
+        with self._sesion() as db:
+            results = db.execute(sql, params).fetchall()
+
+        return [
+            {
+                'id': row.id,
+                'nombre': row.nombre,
+                'posicion': row.posicion,
+                'genero': row.genero,
+                'edad': row.edad,
+                'ubicacion_texto': row.ubicacion_texto
+            }
+            for row in results
+        ]
+
+    def obtener_nombres(self, ids: List[int]) -> Dict[int, str]:
+        """Obtiene el nombre de cada usuario existente entre los IDs dados"""
+        sql = text("SELECT u.id, u.nombre FROM usuarios u WHERE u.id IN :ids").bindparams(
+            bindparam("ids", expanding=True)
+        )
+
+        with self._sesion() as db:
+            results = db.execute(sql, {"ids": ids}).fetchall()
+
+        return {row.id: row.nombre for row in results}
+
+    def normalizar_ubicaciones(self, lote: int = 1000) -> int:
+        """
+        Recalcula ubicacion_normalizada de todos los usuarios, confirmando
+        cada lote por rango de ID.
+
+        Returns:
+            int: Cantidad de usuarios actualizados
+        """
+        with self._sesion() as db:
+            max_id = db.execute(text("SELECT COALESCE(MAX(id), 0) as max_id FROM usuarios")).fetchone().max_id
+
+        actualizados = 0
+        for desde_id in range(1, max_id + 1, lote):
+            with self._sesion() as db:
+                usuarios = db.execute(
+                    text(
+                        """
+                        SELECT id, ubicacion_texto, ubicacion_normalizada
+                        FROM usuarios
+                        WHERE id >= :desde_id AND id < :hasta_id
+                        """
+                    ),
+                    {"desde_id": desde_id, "hasta_id": desde_id + lote},
+                ).fetchall()
+
+                normalizadas = normalizar_textos(usuario.ubicacion_texto for usuario in usuarios)
+                cambios = [
+                    {"id": usuario.id, "ubicacion_normalizada": normalizada}
+                    for usuario, normalizada in zip(usuarios, normalizadas)
+                    if usuario.ubicacion_normalizada != normalizada
+                ]
+                if cambios:
+                    db.execute(
+                        text("UPDATE usuarios SET ubicacion_normalizada = :ubicacion_normalizada WHERE id = :id"),
+                        cambios,
+                    )
+
+                self._confirmar(db)
+                actualizados += len(cambios)
+
+        return actualizados
+
+    def _invalidar_cache(self, usuario_id: int) -> None:
+        """
+        Invalida el usuario en el cache ahora y al terminar la transacción,
+        para no dejar cacheado un valor leído antes del commit o del rollback
+        """
+        cache_usuarios.invalidar(usuario_id)
+        self._despues_de_finalizar(lambda: cache_usuarios.invalidar(usuario_id))
+
+    def _cargar_indice_postulados(self) -> None:
+        """Carga (o recarga) el índice de postulados desde el primario"""
+        sql = text(
+            """
+            SELECT id, latitud, longitud
+            FROM usuarios
+            WHERE postulado = 1
+            """
+        )
+
+        with self._sesion() as db:
+            results = db.execute(sql).fetchall()
+
+        indice_postulados.cargar(
+            (row.id, float(row.latitud), float(row.longitud)) for row in results
+        )
\ No newline at end of file
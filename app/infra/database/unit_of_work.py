@@ -0,0 +1,132 @@
+"""Unidad de trabajo: una sesión y una transacción compartidas por los repositorios"""
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Callable, Dict, Iterator, List, Optional
+
+from sqlalchemy.orm import Session
+
+from app.infra.database.database_service import DatabaseConnection
+
+_unidad_actual: ContextVar[Optional["UnitOfWork"]] = ContextVar("unidad_de_trabajo", default=None)
+
+
+def get_unit_of_work() -> Optional["UnitOfWork"]:
+    """Obtiene la unidad de trabajo activa en el contexto actual (o None)"""
+    return _unidad_actual.get()
+
+
+class UnitOfWork:
+    """
+    Comparte una sesión por datasource entre todos los repositorios que se
+    ejecutan dentro de su alcance, de modo que un request usa un único
+    checkout del pool y una única transacción con un solo commit al final.
+
+    Las lecturas marcadas como de solo lectura usan una sesión aparte sobre
+    una réplica hasta que el request escribe; desde ese momento van al
+    primario para que el request lea sus propias escrituras.
+
+    Puede recibir una sesión ya abierta (p.ej. la del adaptador asíncrono);
+    en ese caso la usa para cualquier key y no la cierra.
+    """
+
+    def __init__(self, database_client: Optional[DatabaseConnection] = None, session: Optional[Session] = None):
+        self.database_client = database_client
+        self._sesion_externa = session
+        self._sesiones: Dict[str, Session] = {}
+        self._sesiones_lectura: Dict[str, Session] = {}
+        self.escribio = False
+        self._al_confirmar: List[Callable[[], None]] = []
+        self._al_revertir: List[Callable[[], None]] = []
+
+    def get_session(self, key: str) -> Session:
+        """Obtiene (abriéndola si hace falta) la sesión del datasource"""
+        if self._sesion_externa is not None:
+            return self._sesion_externa
+
+        if key not in self._sesiones:
+            self._sesiones[key] = self.database_client.get_session(key)
+        return self._sesiones[key]
+
+    def get_read_session(self, key: str) -> Session:
+        """Obtiene la sesión para lecturas: réplica si el request no escribió, si no la del primario"""
+        if (
+            self._sesion_externa is not None
+            or self.escribio
+            or not self.database_client.replicas_disponibles(key)
+        ):
+            return self.get_session(key)
+
+        if key not in self._sesiones_lectura:
+            self._sesiones_lectura[key] = self.database_client.get_read_session(key)
+        return self._sesiones_lectura[key]
+
+    def marcar_escritura(self) -> None:
+        """Indica que el request escribió: las lecturas siguientes van al primario"""
+        self.escribio = True
+
+    def descartar_lectura(self, key: str) -> None:
+        """Cierra la sesión de lectura del datasource (p.ej. si su réplica falló)"""
+        session = self._sesiones_lectura.pop(key, None)
+        if session is not None:
+            session.close()
+
+    def al_confirmar(self, callback: Callable[[], None]) -> None:
+        """Registra una acción a ejecutar solo si la transacción se confirma"""
+        self._al_confirmar.append(callback)
+
+    def al_revertir(self, callback: Callable[[], None]) -> None:
+        """Registra una acción a ejecutar solo si la transacción se revierte"""
+        self._al_revertir.append(callback)
+
+    def commit(self) -> None:
+        """Confirma todas las sesiones y ejecuta las acciones posteriores"""
+        for session in self._sesiones_abiertas():
+            session.commit()
+
+        callbacks, self._al_confirmar, self._al_revertir = self._al_confirmar, [], []
+        for callback in callbacks:
+            callback()
+
+    def rollback(self) -> None:
+        """Revierte todas las sesiones y ejecuta las acciones de reversión"""
+        for session in self._sesiones_abiertas():
+            session.rollback()
+
+        callbacks, self._al_confirmar, self._al_revertir = self._al_revertir, [], []
+        for callback in callbacks:
+            callback()
+
+    def close(self) -> None:
+        """Cierra las sesiones propias (devuelve las conexiones al pool)"""
+        for session in [*self._sesiones.values(), *self._sesiones_lectura.values()]:
+            session.close()
+        self._sesiones = {}
+        self._sesiones_lectura = {}
+
+    @contextmanager
+    def activar(self) -> Iterator["UnitOfWork"]:
+        """Hace visible la unidad de trabajo para los repositorios"""
+        token = _unidad_actual.set(self)
+        try:
+            yield self
+        finally:
+            _unidad_actual.reset(token)
+
+    def __enter__(self) -> "UnitOfWork":
+        self._contexto = self.activar()
+        return self._contexto.__enter__()
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        try:
+            if exc_type is None:
+                self.commit()
+            else:
+                self.rollback()
+        finally:
+            self.close()
+            self._contexto.__exit__(exc_type, exc_value, traceback)
+
+    def _sesiones_abiertas(self) -> List[Session]:
+        if self._sesion_externa is not None:
+            return [self._sesion_externa]
+        return [*self._sesiones.values(), *self._sesiones_lectura.values()]
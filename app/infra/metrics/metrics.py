@@ -0,0 +1,134 @@
+"""Métricas de la aplicación e instrumentación de base de datos"""
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Dict, Iterator
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+import app.infra.metrics.metrics_service as metrics
+from app.infra.cache.cache import caches
+from app.infra.database.database_service import DatabaseConnection, MedicionCheckout
+from app.infra.database.diagnostico import estado_pool
+
+# Método de repositorio en ejecución, para atribuirle el tiempo de SQL
+_metodo_repositorio: ContextVar[str] = ContextVar("metodo_repositorio", default="sin_repositorio")
+
+registro = metrics.RegistroMetricas()
+
+duracion_requests = registro.registrar(metrics.Histograma(
+    "http_request_duration_seconds",
+    "Latencia de los requests HTTP por ruta",
+    ("method", "route", "status"),
+))
+
+duracion_sql = registro.registrar(metrics.Histograma(
+    "db_query_duration_seconds",
+    "Tiempo de ejecución de SQL por método de repositorio",
+    ("datasource", "repository_method"),
+))
+
+espera_pool = registro.registrar(metrics.Histograma(
+    "db_pool_checkout_seconds",
+    "Tiempo de espera para obtener una conexión del pool",
+    ("datasource",),
+))
+
+
+ciclo_partidos_filas = registro.registrar(metrics.Contador(
+    "partidos_ciclo_filas_total",
+    "Partidos procesados por el ciclo de vida",
+    ("operacion",),
+))
+
+ciclo_partidos_lote = registro.registrar(metrics.Histograma(
+    "partidos_ciclo_lote_seconds",
+    "Duración de cada lote del ciclo de vida",
+    ("operacion",),
+))
+
+# Segundos de atraso por operación, actualizados en cada corrida del ciclo de vida
+rezago_ciclo_partidos: Dict[str, float] = {}
+
+registro.registrar(metrics.MetricaCalculada(
+    "partidos_ciclo_rezago_seconds",
+    "Atraso del partido más viejo pendiente de procesar por el ciclo de vida",
+    ("operacion",),
+    lambda: [((operacion,), segundos) for operacion, segundos in list(rezago_ciclo_partidos.items())],
+))
+
+def _estadisticas_caches(campo: str):
+    return [((cache.nombre,), cache.estadisticas()[campo]) for cache in caches]
+
+
+registro.registrar(metrics.MetricaCalculada(
+    "cache_hits_total", "Aciertos del cache", ("cache",),
+    lambda: _estadisticas_caches("hits"), tipo="counter",
+))
+registro.registrar(metrics.MetricaCalculada(
+    "cache_misses_total", "Fallos del cache", ("cache",),
+    lambda: _estadisticas_caches("misses"), tipo="counter",
+))
+registro.registrar(metrics.MetricaCalculada(
+    "cache_hit_ratio", "Proporción de aciertos del cache", ("cache",),
+    lambda: _estadisticas_caches("hit_rate"),
+))
+
+MedicionCheckout.observador = lambda datasource, segundos: espera_pool.observar(segundos, datasource=datasource)
+
+
+def registrar_pools(database_client: DatabaseConnection) -> None:
+    """Expone la ocupación de los pools del cliente de base de datos"""
+
+    def calcular(campo: str):
+        return [((key,), estado_pool(database_client, key)[campo]) for key in database_client.get_keys()]
+
+    registro.registrar(metrics.MetricaCalculada(
+        "db_pool_checked_out", "Conexiones del pool en uso", ("datasource",),
+        lambda: calcular("checked_out"),
+    ))
+    registro.registrar(metrics.MetricaCalculada(
+        "db_pool_overflow", "Conexiones abiertas por encima de pool_size", ("datasource",),
+        lambda: calcular("overflow"),
+    ))
+    registro.registrar(metrics.MetricaCalculada(
+        "db_replicas_disponibles", "Réplicas de lectura en rotación", ("datasource",),
+        lambda: [((key,), database_client.replicas_disponibles(key)) for key in database_client.get_keys()],
+    ))
+
+
+@contextmanager
+def metodo_repositorio(nombre: str) -> Iterator[None]:
+    """Atribuye al método de repositorio dado el SQL ejecutado dentro del bloque"""
+    token = _metodo_repositorio.set(nombre)
+    try:
+        yield
+    finally:
+        _metodo_repositorio.reset(token)
+
+
+def instrumentar_engine(engine: Engine, datasource: str) -> None:
+    """Registra los eventos del engine que miden el tiempo de cada sentencia"""
+
+    @event.listens_for(engine, "before_cursor_execute")
+    def _antes(conn, cursor, statement, parameters, context, executemany):
+        conn.info.setdefault("inicio_sentencias", []).append(time.perf_counter())
+
+    @event.listens_for(engine, "after_cursor_execute")
+    def _despues(conn, cursor, statement, parameters, context, executemany):
+        _observar(conn)
+
+    @event.listens_for(engine, "handle_error")
+    def _error(contexto_error):
+        if contexto_error.connection is not None:
+            _observar(contexto_error.connection)
+
+    def _observar(conn):
+        inicios = conn.info.get("inicio_sentencias")
+        if inicios:
+            duracion_sql.observar(
+                time.perf_counter() - inicios.pop(),
+                datasource=datasource,
+                repository_method=_metodo_repositorio.get(),
+            )
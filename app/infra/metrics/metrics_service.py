@@ -0,0 +1,155 @@
+"""Métricas en memoria con exposición en formato de texto de Prometheus"""
+import bisect
+import threading
+from abc import ABCMeta, abstractmethod
+from typing import Callable, Dict, Iterable, List, Sequence, Tuple
+
+Etiquetas = Tuple[str, ...]
+
+BUCKETS_SEGUNDOS = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+
+def _formatear_etiquetas(nombres: Sequence[str], valores: Sequence[str]) -> str:
+    if not nombres:
+        return ""
+    pares = (
+        '{}="{}"'.format(nombre, str(valor).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n"))
+        for nombre, valor in zip(nombres, valores)
+    )
+    return "{" + ",".join(pares) + "}"
+
+
+def _formatear_valor(valor: float) -> str:
+    if valor == float("inf"):
+        return "+Inf"
+    return repr(float(valor))
+
+
+class Metrica(metaclass=ABCMeta):
+    tipo = "untyped"
+
+    def __init__(self, nombre: str, descripcion: str, etiquetas: Sequence[str] = ()):
+        self.nombre = nombre
+        self.descripcion = descripcion
+        self.etiquetas = tuple(etiquetas)
+        self._lock = threading.Lock()
+
+    def exponer(self) -> List[str]:
+        """Devuelve las líneas de la métrica en formato de texto de Prometheus"""
+        return [
+            f"# HELP {self.nombre} {self.descripcion}",
+            f"# TYPE {self.nombre} {self.tipo}",
+            *self._muestras(),
+        ]
+
+    def _clave(self, valores: Dict[str, str]) -> Etiquetas:
+        return tuple(str(valores[etiqueta]) for etiqueta in self.etiquetas)
+
+    @abstractmethod
+    def _muestras(self) -> Iterable[str]:
+        pass
+
+
+class Contador(Metrica):
+    """Contador monótono por combinación de etiquetas"""
+
+    tipo = "counter"
+
+    def __init__(self, nombre: str, descripcion: str, etiquetas: Sequence[str] = ()):
+        super().__init__(nombre, descripcion, etiquetas)
+        self._valores: Dict[Etiquetas, float] = {}
+
+    def incrementar(self, cantidad: float = 1.0, **etiquetas: str) -> None:
+        clave = self._clave(etiquetas)
+        with self._lock:
+            self._valores[clave] = self._valores.get(clave, 0.0) + cantidad
+
+    def _muestras(self) -> Iterable[str]:
+        with self._lock:
+            valores = list(self._valores.items())
+        for clave, valor in valores:
+            yield f"{self.nombre}{_formatear_etiquetas(self.etiquetas, clave)} {_formatear_valor(valor)}"
+
+
+class Histograma(Metrica):
+    """Histograma acumulativo por combinación de etiquetas"""
+
+    tipo = "histogram"
+
+    def __init__(
+        self,
+        nombre: str,
+        descripcion: str,
+        etiquetas: Sequence[str] = (),
+        buckets: Sequence[float] = BUCKETS_SEGUNDOS,
+    ):
+        super().__init__(nombre, descripcion, etiquetas)
+        self.buckets = tuple(sorted(buckets))
+        # clave -> [conteos por bucket (+Inf al final), suma]
+        self._series: Dict[Etiquetas, Tuple[List[int], List[float]]] = {}
+
+    def observar(self, valor: float, **etiquetas: str) -> None:
+        clave = self._clave(etiquetas)
+        indice = bisect.bisect_left(self.buckets, valor)
+        with self._lock:
+            serie = self._series.get(clave)
+            if serie is None:
+                serie = self._series[clave] = ([0] * (len(self.buckets) + 1), [0.0])
+            serie[0][indice] += 1
+            serie[1][0] += valor
+
+    def _muestras(self) -> Iterable[str]:
+        with self._lock:
+            series = [(clave, list(conteos), suma[0]) for clave, (conteos, suma) in self._series.items()]
+
+        nombres_bucket = self.etiquetas + ("le",)
+        for clave, conteos, suma in series:
+            acumulado = 0
+            for limite, conteo in zip(self.buckets + (float("inf"),), conteos):
+                acumulado += conteo
+                etiquetas = _formatear_etiquetas(nombres_bucket, clave + (_formatear_valor(limite),))
+                yield f"{self.nombre}_bucket{etiquetas} {acumulado}"
+            etiquetas = _formatear_etiquetas(self.etiquetas, clave)
+            yield f"{self.nombre}_sum{etiquetas} {_formatear_valor(suma)}"
+            yield f"{self.nombre}_count{etiquetas} {acumulado}"
+
+
+class MetricaCalculada(Metrica):
+    """
+    Métrica cuyo valor se calcula al exponer a partir de otro objeto
+    (p.ej. estado de un pool o contadores de un cache)
+    """
+
+    def __init__(
+        self,
+        nombre: str,
+        descripcion: str,
+        etiquetas: Sequence[str],
+        calcular: Callable[[], Iterable[Tuple[Etiquetas, float]]],
+        tipo: str = "gauge",
+    ):
+        super().__init__(nombre, descripcion, etiquetas)
+        self.calcular = calcular
+        self.tipo = tipo
+
+    def _muestras(self) -> Iterable[str]:
+        for clave, valor in self.calcular():
+            yield f"{self.nombre}{_formatear_etiquetas(self.etiquetas, clave)} {_formatear_valor(valor)}"
+
+
+class RegistroMetricas:
+    """Conjunto de métricas expuestas por /metrics"""
+
+    def __init__(self):
+        self._metricas: List[Metrica] = []
+
+    def registrar(self, metrica: Metrica) -> Metrica:
+        self._metricas.append(metrica)
+        return metrica
+
+    def exponer(self) -> str:
+        """Devuelve todas las métricas en formato de texto de Prometheus"""
+        lineas = []
+        for metrica in self._metricas:
+            lineas.extend(metrica.exponer())
+        return "\n".join(lineas) + "\n"
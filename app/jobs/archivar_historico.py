@@ -0,0 +1,59 @@
+"""
+Migra el histórico existente a las tablas frías (tras las migraciones 006 y
+008): mueve los partidos Finalizado/Cancelado anteriores a --dias con sus
+participaciones, invitaciones y calificaciones, en lotes chicos y con una
+pausa entre lotes.
+
+Cada lote es una transacción corta que toma sus partidos con SKIP LOCKED, así
+que no bloquea las tablas calientes ni a la API y puede cortarse y retomarse
+en cualquier momento. Los partidos Pendiente/Confirmado vencidos se finalizan
+antes para que también entren en el archivo.
+
+Uso:
+    python -m app.jobs.archivar_historico [--dias 30] [--lote 200] [--pausa 0.5]
+"""
+import argparse
+import time
+from datetime import datetime, timedelta
+
+from app.infra.database.ciclo_partidos import CicloPartidos
+from app.infra.database.database import database_client
+from app.infra.database.repositories.partidos import PartidoRepository
+from app.utils.constants import DIAS_ARCHIVAR_PARTIDO, MINUTOS_FINALIZAR_PARTIDO
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Mueve el histórico de partidos a las tablas de archivo")
+    parser.add_argument(
+        "--dias", type=int, default=DIAS_ARCHIVAR_PARTIDO,
+        help="Archiva los partidos jugados hace más de estos días",
+    )
+    parser.add_argument("--lote", type=int, default=200, help="Partidos por transacción")
+    parser.add_argument("--pausa", type=float, default=0.5, help="Segundos de pausa entre lotes")
+    args = parser.parse_args()
+
+    ciclo = CicloPartidos(
+        PartidoRepository(database_client),
+        lote=args.lote,
+        max_lotes=None,
+        pausa_segundos=args.pausa,
+        dias_archivar=args.dias,
+    )
+    inicio = time.perf_counter()
+    ahora = datetime.now()
+
+    finalizados = ciclo.finalizar(ahora - timedelta(minutes=MINUTOS_FINALIZAR_PARTIDO))
+    print(f"Finalizados: {finalizados}")
+
+    def al_avanzar(archivadas):
+        print(
+            f"Archivados: {archivadas['partidos']} partidos, {archivadas['participaciones']} participaciones, "
+            f"{archivadas['invitaciones']} invitaciones, {archivadas['calificaciones']} calificaciones "
+            f"({time.perf_counter() - inicio:.1f}s)"
+        )
+
+    ciclo.archivar(ahora - timedelta(days=args.dias), al_avanzar=al_avanzar)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,46 @@
+"""
+Worker del ciclo de vida de partidos: pasa a Finalizado los partidos vencidos
+y archiva en tablas frías los terminados hace más de DIAS_ARCHIVAR_PARTIDO.
+
+También puede correr dentro de la API (CICLO_PARTIDOS_ACTIVO=true); en ese
+caso su rezago y su throughput se exponen en /metrics.
+
+Uso:
+    python -m app.jobs.ciclo_partidos [--lote 500] [--intervalo 60] [--una-vez]
+"""
+import argparse
+import time
+
+from app.infra.database.ciclo_partidos import CicloPartidos
+from app.infra.database.database import database_client
+from app.infra.database.repositories.partidos import PartidoRepository
+from app.utils.config import settings
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Finaliza y archiva partidos vencidos")
+    parser.add_argument("--lote", type=int, default=settings.CICLO_PARTIDOS_LOTE, help="Partidos por transacción")
+    parser.add_argument(
+        "--intervalo", type=int, default=settings.CICLO_PARTIDOS_INTERVALO_SEGUNDOS,
+        help="Segundos entre corridas",
+    )
+    parser.add_argument("--una-vez", action="store_true", help="Ejecuta una sola corrida y termina")
+    args = parser.parse_args()
+
+    ciclo = CicloPartidos(PartidoRepository(database_client), lote=args.lote)
+    while True:
+        inicio = time.perf_counter()
+        resumen = ciclo.ejecutar()
+        print(
+            f"Finalizados: {resumen['finalizados']} | Archivados: {resumen['partidos']} partidos, "
+            f"{resumen['participaciones']} participaciones, {resumen['invitaciones']} invitaciones, "
+            f"{resumen['calificaciones']} calificaciones "
+            f"({time.perf_counter() - inicio:.2f}s)"
+        )
+        if args.una_vez:
+            break
+        time.sleep(args.intervalo)
+
+
+if __name__ == "__main__":
+    main()
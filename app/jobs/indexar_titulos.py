@@ -0,0 +1,25 @@
+"""
+Recalcula partidos.titulo_normalizado, sobre el que filtra la búsqueda por título.
+
+Se corre una vez después de la migración 004 (o si se cambia normalizar_texto).
+
+Uso:
+    python -m app.jobs.indexar_titulos [--lote 500]
+"""
+import argparse
+
+from app.infra.database.database import database_client
+from app.infra.database.repositories.partidos import PartidoRepository
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Reindexa los títulos de los partidos")
+    parser.add_argument("--lote", type=int, default=500, help="Cantidad de partidos por transacción")
+    args = parser.parse_args()
+
+    reindexados = PartidoRepository(database_client).reindexar_titulos(lote=args.lote)
+    print(f"Partidos reindexados: {reindexados}")
+
+
+if __name__ == "__main__":
+    main()
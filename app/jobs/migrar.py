@@ -0,0 +1,34 @@
+"""
+Aplica las migraciones pendientes de migraciones/.
+
+Uso:
+    python -m app.jobs.migrar            # aplica las pendientes
+    python -m app.jobs.migrar --estado   # solo lista las pendientes
+"""
+import argparse
+
+from app.infra.database.database import database_client
+from app.infra.database.migraciones import MigradorEsquema
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Aplica las migraciones pendientes del esquema")
+    parser.add_argument("--estado", action="store_true", help="Solo lista las migraciones pendientes")
+    args = parser.parse_args()
+
+    migrador = MigradorEsquema(database_client)
+
+    if args.estado:
+        pendientes = migrador.pendientes()
+        for migracion in pendientes:
+            print(f"Pendiente: {migracion.version} {migracion.nombre}")
+        print(f"Migraciones pendientes: {len(pendientes)}")
+        return
+
+    for migracion in migrador.aplicar():
+        print(f"Aplicada: {migracion.version} {migracion.nombre}")
+    print("Esquema actualizado")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,25 @@
+"""
+Recalcula usuarios.ubicacion_normalizada a partir de ubicacion_texto.
+
+Se corre una vez después de la migración 005 (o si se cambia normalizar_texto).
+
+Uso:
+    python -m app.jobs.normalizar_ubicaciones [--lote 1000]
+"""
+import argparse
+
+from app.infra.database.database import database_client
+from app.infra.database.repositories.usuarios import UsuarioRepository
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Normaliza las ubicaciones de los usuarios")
+    parser.add_argument("--lote", type=int, default=1000, help="Cantidad de usuarios por transacción")
+    args = parser.parse_args()
+
+    actualizados = UsuarioRepository(database_client).normalizar_ubicaciones(lote=args.lote)
+    print(f"Usuarios actualizados: {actualizados}")
+
+
+if __name__ == "__main__":
+    main()
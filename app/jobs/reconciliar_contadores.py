@@ -0,0 +1,27 @@
+"""
+Job de reconciliación de los contadores confirmados/pendientes de partidos.
+
+Los contadores se mantienen en cada escritura de participaciones; este job
+los recalcula desde la tabla de participaciones para corregir cualquier
+desvío (escrituras manuales, fallos a mitad de camino, etc.).
+
+Uso:
+    python -m app.jobs.reconciliar_contadores [--lote 1000]
+"""
+import argparse
+
+from app.infra.database.database import database_client
+from app.infra.database.repositories.partidos import PartidoRepository
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Reconcilia los contadores de participantes de los partidos")
+    parser.add_argument("--lote", type=int, default=1000, help="Cantidad de partidos por transacción")
+    args = parser.parse_args()
+
+    corregidos = PartidoRepository(database_client).reconciliar_contadores(lote=args.lote)
+    print(f"Partidos corregidos: {corregidos}")
+
+
+if __name__ == "__main__":
+    main()
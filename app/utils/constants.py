@@ -1,10 +1,5 @@
 """Constantes de la aplicación"""
-
-# Base de datos
-DB_POOL_SIZE: int = 2
-DB_POOL_MAX_SIZE: int = 5
-DB_LOG_QUERY: bool = False
-DB_CONNECTION_RECYCLE: int = 3600
+from typing import Tuple
 
 # Distancias
 RADIO_TIERRA_KM: float = 6371.0
@@ -15,10 +10,34 @@ MAX_EDAD_PARTIDO: int = 99
 MIN_CAPACIDAD_PARTIDO: int = 2
 MAX_CAPACIDAD_PARTIDO: int = 22
 HORAS_MINIMAS_ELIMINAR_PARTIDO: int = 24
+MAX_INVITACIONES_LOTE: int = 50
+MAX_PARTIDOS_ELIMINACION_LOTE: int = 500
 
 # Distancias por defecto
 DISTANCIA_MAXIMA_BUSQUEDA_KM: float = 5.0
 DISTANCIA_MAXIMA_JUGADORES_KM: float = 10.0
 
+# Paginación
+LIMITE_PAGINA_DEFECTO: int = 20
+LIMITE_PAGINA_MAXIMO: int = 100
+TANDA_MINIMA_JUGADORES: int = 100
+
+# Normalización de texto (entradas del LRU de normalizar_texto)
+TAMANO_CACHE_NORMALIZACION: int = 4096
+
+# Índice espacial de jugadores postulados
+PRECISION_GEOHASH_JUGADORES: int = 5
+INDICE_JUGADORES_TTL_SEGUNDOS: int = 300
+
+# Snapshot por celda de geohash de los partidos abiertos (búsqueda de partidos).
+# Se cachea en varias precisiones y cada búsqueda usa la más fina que cubra el
+# radio con a lo sumo MAX_CELDAS_BUSQUEDA_PARTIDOS celdas.
+PRECISIONES_GEOHASH_PARTIDOS: Tuple[int, ...] = (5, 4, 3)
+MAX_CELDAS_BUSQUEDA_PARTIDOS: int = 16
+
 # Calendarios
-DIAS_CALENDARIO_FUTURO: int = 30
\ No newline at end of file
+DIAS_CALENDARIO_FUTURO: int = 30
+
+# Ciclo de vida de partidos
+MINUTOS_FINALIZAR_PARTIDO: int = 120
+DIAS_ARCHIVAR_PARTIDO: int = 30
\ No newline at end of file
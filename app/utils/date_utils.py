@@ -1,8 +1,15 @@
 """Utilidades para manejo de fechas, distancias y texto"""
 import math
 import unicodedata
+from functools import lru_cache
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
 from datetime import datetime, timezone, timedelta
-from app.utils.constants import RADIO_TIERRA_KM
+from app.utils.constants import RADIO_TIERRA_KM, TAMANO_CACHE_NORMALIZACION
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - numpy es opcional
+    np = None
 
 
 def calcular_distancia(lat1: float, lon1: float, lat2: float, lon2: float) -> float:
@@ -33,7 +40,126 @@ def calcular_distancia(lat1: float, lon1: float, lat2: float, lon2: float) -> fl
     return round(RADIO_TIERRA_KM * c, 2)
 
 
+def calcular_distancias(
+    latitud: float,
+    longitud: float,
+    latitudes: Sequence[float],
+    longitudes: Sequence[float],
+    radio_km: Optional[float] = None,
+) -> Tuple[List[float], List[bool]]:
+    """
+    Calcula en lote la distancia Haversine desde un origen a muchos puntos.
+    Usa NumPy si está instalado y un loop en Python puro si no.
+
+    Args:
+        latitud: Latitud del origen
+        longitud: Longitud del origen
+        latitudes: Latitudes de los puntos
+        longitudes: Longitudes de los puntos
+        radio_km: Radio para la máscara (None = todos dentro)
+
+    Returns:
+        Tuple: (distancias en km redondeadas a 2 decimales, máscara dentro del radio)
+    """
+    if len(latitudes) != len(longitudes):
+        raise ValueError("latitudes y longitudes deben tener el mismo largo")
+
+    if np is not None:
+        return _calcular_distancias_numpy(latitud, longitud, latitudes, longitudes, radio_km)
+
+    return _calcular_distancias_python(latitud, longitud, latitudes, longitudes, radio_km)
+
+
+def _calcular_distancias_numpy(latitud, longitud, latitudes, longitudes, radio_km):
+    lat1 = math.radians(latitud)
+    lat2 = np.radians(np.asarray(latitudes, dtype=np.float64))
+    dlat = lat2 - lat1
+    dlon = np.radians(np.asarray(longitudes, dtype=np.float64) - longitud)
+
+    a = np.sin(dlat / 2) ** 2 + math.cos(lat1) * np.cos(lat2) * np.sin(dlon / 2) ** 2
+    c = 2 * np.arctan2(np.sqrt(a), np.sqrt(1 - a))
+    distancias = np.round(RADIO_TIERRA_KM * c, 2)
+
+    if radio_km is None:
+        mascara = np.ones(distancias.shape, dtype=bool)
+    else:
+        mascara = distancias <= radio_km
+
+    return distancias.tolist(), mascara.tolist()
+
+
+def _calcular_distancias_python(latitud, longitud, latitudes, longitudes, radio_km):
+    lat1 = math.radians(latitud)
+    cos_lat1 = math.cos(lat1)
+    radianes = math.radians
+    sin, cos, atan2, sqrt = math.sin, math.cos, math.atan2, math.sqrt
+
+    distancias = []
+    mascara = []
+    for lat, lon in zip(latitudes, longitudes):
+        lat2 = radianes(lat)
+        a = sin((lat2 - lat1) / 2) ** 2 + cos_lat1 * cos(lat2) * sin(radianes(lon - longitud) / 2) ** 2
+        distancia = round(RADIO_TIERRA_KM * 2 * atan2(sqrt(a), sqrt(1 - a)), 2)
+        distancias.append(distancia)
+        mascara.append(radio_km is None or distancia <= radio_km)
+
+    return distancias, mascara
+
+
+def calcular_bounding_box(
+    latitud: float, longitud: float, radio_km: float
+) -> Tuple[float, float, float, float]:
+    """
+    Calcula el rectángulo (lat/lon) que contiene el círculo de radio dado.
+    Sirve como prefiltro indexable antes de aplicar Haversine.
+
+    Args:
+        latitud: Latitud del centro
+        longitud: Longitud del centro
+        radio_km: Radio en kilómetros
+
+    Returns:
+        Tuple: (lat_min, lat_max, lon_min, lon_max)
+    """
+    delta_lat = math.degrees(radio_km / RADIO_TIERRA_KM)
+
+    lat_min = max(latitud - delta_lat, -90.0)
+    lat_max = min(latitud + delta_lat, 90.0)
+
+    # Cerca de los polos el círculo cubre todas las longitudes
+    if lat_min <= -90.0 or lat_max >= 90.0:
+        return lat_min, lat_max, -180.0, 180.0
+
+    delta_lon = math.degrees(
+        math.asin(min(1.0, math.sin(radio_km / RADIO_TIERRA_KM) / math.cos(math.radians(latitud))))
+    )
+
+    lon_min = longitud - delta_lon
+    lon_max = longitud + delta_lon
+
+    # Si cruza el antimeridiano no se restringe la longitud
+    if lon_min < -180.0 or lon_max > 180.0:
+        return lat_min, lat_max, -180.0, 180.0
+
+    return lat_min, lat_max, lon_min, lon_max
+
+
+@lru_cache(maxsize=TAMANO_CACHE_NORMALIZACION)
 def normalizar_texto(texto: str) -> str:
+    """
+    Pasa el texto a minúsculas y le quita los acentos (á -> a, ñ -> n, ü -> u).
+    Memoizado con LRU acotado: los textos buscados (localidades, títulos) se repiten mucho.
+
+    Args:
+        texto: Texto a normalizar
+
+    Returns:
+        str: Texto normalizado
+    """
+    # Camino rápido: sin caracteres no ASCII no hay acentos que quitar
+    if texto.isascii():
+        return texto.lower()
+
     # Convertir a minúsculas
     texto = texto.lower()
 
@@ -49,6 +175,26 @@ def normalizar_texto(texto: str) -> str:
     return texto_sin_acentos
 
 
+def normalizar_textos(textos: Iterable[str]) -> List[str]:
+    """
+    Normaliza muchos textos de una vez, normalizando una sola vez cada valor distinto
+
+    Args:
+        textos: Textos a normalizar
+
+    Returns:
+        List[str]: Textos normalizados, en el mismo orden
+    """
+    normalizados: Dict[str, str] = {}
+    resultado = []
+    for texto in textos:
+        normalizado = normalizados.get(texto)
+        if normalizado is None:
+            normalizado = normalizados[texto] = normalizar_texto(texto)
+        resultado.append(normalizado)
+    return resultado
+
+
 def convertir_a_fecha_local(fecha_hora: datetime) -> datetime:
     if fecha_hora.tzinfo:
         tz_argentina = timezone(timedelta(hours=-3))
@@ -0,0 +1,43 @@
+"""Utilidades de ETags para GET condicionales (If-None-Match)"""
+from typing import Any, Optional
+
+HEADER_ETAG = "ETag"
+
+
+def generar_etag(*partes: Any) -> str:
+    """
+    Arma un ETag fuerte a partir de lo que identifica la representación
+
+    Args:
+        partes: Recurso, ID y versiones (p.ej. "partido", 12, 7)
+
+    Returns:
+        str: ETag entre comillas, p.ej. "partido-12-7"
+    """
+    return '"' + "-".join(str(parte) for parte in partes) + '"'
+
+
+def etag_coincide(if_none_match: Optional[str], etag: str) -> bool:
+    """
+    Indica si el header If-None-Match incluye el ETag (comparación débil,
+    como pide la RFC 9110 para If-None-Match)
+
+    Args:
+        if_none_match: Valor del header (lista separada por comas o "*")
+        etag: ETag actual del recurso
+
+    Returns:
+        bool: True si el cliente ya tiene la representación actual
+    """
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+
+    for candidato in if_none_match.split(","):
+        candidato = candidato.strip()
+        if candidato.startswith("W/"):
+            candidato = candidato[2:]
+        if candidato == etag:
+            return True
+    return False
@@ -0,0 +1,229 @@
+"""Utilidades de geohash e índice espacial en memoria"""
+import threading
+import time
+from typing import Dict, Iterable, Optional, Set, Tuple
+
+from app.utils.date_utils import calcular_bounding_box, calcular_distancias
+
+_BASE32 = "0123456789bcdefghjkmnpqrstuvwxyz"
+
+
+def codificar_geohash(latitud: float, longitud: float, precision: int) -> str:
+    """
+    Codifica una coordenada como geohash
+
+    Args:
+        latitud: Latitud del punto
+        longitud: Longitud del punto
+        precision: Cantidad de caracteres del geohash
+
+    Returns:
+        str: Geohash del punto
+    """
+    lat_rango = [-90.0, 90.0]
+    lon_rango = [-180.0, 180.0]
+    geohash = []
+    bits = 0
+    bit = 0
+    es_longitud = True
+
+    while len(geohash) < precision:
+        rango, valor = (lon_rango, longitud) if es_longitud else (lat_rango, latitud)
+        medio = (rango[0] + rango[1]) / 2
+        if valor >= medio:
+            bits = (bits << 1) | 1
+            rango[0] = medio
+        else:
+            bits <<= 1
+            rango[1] = medio
+
+        es_longitud = not es_longitud
+        bit += 1
+        if bit == 5:
+            geohash.append(_BASE32[bits])
+            bits = 0
+            bit = 0
+
+    return "".join(geohash)
+
+
+def tamano_celda(precision: int) -> Tuple[float, float]:
+    """
+    Devuelve el tamaño en grados (alto, ancho) de una celda de geohash
+
+    Args:
+        precision: Cantidad de caracteres del geohash
+
+    Returns:
+        Tuple: (grados de latitud, grados de longitud)
+    """
+    bits_totales = precision * 5
+    bits_lon = (bits_totales + 1) // 2
+    bits_lat = bits_totales // 2
+    return 180.0 / (2 ** bits_lat), 360.0 / (2 ** bits_lon)
+
+
+def limites_celda(geohash: str) -> Tuple[float, float, float, float]:
+    """
+    Decodifica los límites de una celda de geohash
+
+    Args:
+        geohash: Geohash de la celda
+
+    Returns:
+        Tuple: (lat_min, lat_max, lon_min, lon_max); la celda incluye los
+        mínimos y excluye los máximos, igual que codificar_geohash
+    """
+    lat_rango = [-90.0, 90.0]
+    lon_rango = [-180.0, 180.0]
+    es_longitud = True
+
+    for caracter in geohash:
+        bits = _BASE32.index(caracter)
+        for desplazamiento in range(4, -1, -1):
+            rango = lon_rango if es_longitud else lat_rango
+            medio = (rango[0] + rango[1]) / 2
+            if (bits >> desplazamiento) & 1:
+                rango[0] = medio
+            else:
+                rango[1] = medio
+            es_longitud = not es_longitud
+
+    return lat_rango[0], lat_rango[1], lon_rango[0], lon_rango[1]
+
+
+def celdas_en_radio(
+    latitud: float, longitud: float, radio_km: float, precision: int
+) -> Set[str]:
+    """
+    Obtiene los geohashes que cubren el círculo de radio dado
+
+    Args:
+        latitud: Latitud del centro
+        longitud: Longitud del centro
+        radio_km: Radio en kilómetros
+        precision: Cantidad de caracteres del geohash
+
+    Returns:
+        Set[str]: Geohashes que intersectan el bounding box del círculo
+    """
+    lat_min, lat_max, lon_min, lon_max = calcular_bounding_box(latitud, longitud, radio_km)
+    alto, ancho = tamano_celda(precision)
+
+    celdas = set()
+    lat = lat_min
+    while True:
+        lon = lon_min
+        while True:
+            celdas.add(codificar_geohash(lat, lon, precision))
+            if lon >= lon_max:
+                break
+            lon = min(lon + ancho, lon_max)
+        if lat >= lat_max:
+            break
+        lat = min(lat + alto, lat_max)
+
+    return celdas
+
+
+class IndiceGeohash:
+    """
+    Índice espacial en memoria agrupado por celdas de geohash.
+    Es thread-safe y se considera vencido pasado el TTL para forzar su recarga.
+    """
+
+    def __init__(self, precision: int, ttl_segundos: Optional[float] = None):
+        self.precision = precision
+        self.ttl_segundos = ttl_segundos
+        self._celdas: Dict[str, Set[int]] = {}
+        self._puntos: Dict[int, Tuple[float, float, str]] = {}
+        self._cargado_en: Optional[float] = None
+        self._lock = threading.Lock()
+
+    @property
+    def cargado(self) -> bool:
+        """Indica si el índice fue cargado y no está vencido"""
+        if self._cargado_en is None:
+            return False
+        if self.ttl_segundos is None:
+            return True
+        return time.monotonic() - self._cargado_en < self.ttl_segundos
+
+    def cargar(self, puntos: Iterable[Tuple[int, float, float]]) -> None:
+        """Reemplaza el contenido del índice con los puntos dados"""
+        celdas: Dict[str, Set[int]] = {}
+        registros: Dict[int, Tuple[float, float, str]] = {}
+        for punto_id, latitud, longitud in puntos:
+            celda = codificar_geohash(latitud, longitud, self.precision)
+            celdas.setdefault(celda, set()).add(punto_id)
+            registros[punto_id] = (latitud, longitud, celda)
+
+        with self._lock:
+            self._celdas = celdas
+            self._puntos = registros
+            self._cargado_en = time.monotonic()
+
+    def invalidar(self) -> None:
+        """Marca el índice como no cargado"""
+        with self._lock:
+            self._cargado_en = None
+
+    def contiene(self, punto_id: int) -> bool:
+        """Indica si el punto está indexado"""
+        return punto_id in self._puntos
+
+    def agregar(self, punto_id: int, latitud: float, longitud: float) -> None:
+        """Agrega o reubica un punto en el índice"""
+        celda = codificar_geohash(latitud, longitud, self.precision)
+        with self._lock:
+            self._quitar(punto_id)
+            self._celdas.setdefault(celda, set()).add(punto_id)
+            self._puntos[punto_id] = (latitud, longitud, celda)
+
+    def quitar(self, punto_id: int) -> None:
+        """Quita un punto del índice"""
+        with self._lock:
+            self._quitar(punto_id)
+
+    def buscar(self, latitud: float, longitud: float, radio_km: float) -> Dict[int, float]:
+        """
+        Busca los puntos dentro del radio recorriendo solo las celdas cercanas
+
+        Args:
+            latitud: Latitud del centro
+            longitud: Longitud del centro
+            radio_km: Radio en kilómetros
+
+        Returns:
+            Dict[int, float]: ID del punto -> distancia en km
+        """
+        with self._lock:
+            candidatos = [
+                (punto_id, self._puntos[punto_id])
+                for celda in celdas_en_radio(latitud, longitud, radio_km, self.precision)
+                for punto_id in self._celdas.get(celda, ())
+            ]
+
+        distancias, dentro = calcular_distancias(
+            latitud,
+            longitud,
+            [punto[0] for _, punto in candidatos],
+            [punto[1] for _, punto in candidatos],
+            radio_km,
+        )
+
+        return {
+            punto_id: distancia
+            for (punto_id, _), distancia, en_radio in zip(candidatos, distancias, dentro)
+            if en_radio
+        }
+
+    def _quitar(self, punto_id: int) -> None:
+        registro = self._puntos.pop(punto_id, None)
+        if registro is None:
+            return
+        celda = self._celdas.get(registro[2])
+        if celda is not None:
+            celda.discard(punto_id)
+            if not celda:
+                del self._celdas[registro[2]]
@@ -0,0 +1,51 @@
+"""Utilidades de paginación por cursor (keyset)"""
+import base64
+import json
+from typing import Any, Optional, Tuple
+
+from app.domain import error_messages as msg
+
+HEADER_SIGUIENTE_CURSOR = "X-Next-Cursor"
+
+
+def codificar_cursor(*valores: Any) -> str:
+    """
+    Codifica los valores de la última fila devuelta como cursor opaco
+
+    Args:
+        valores: Valores de las columnas de ordenamiento (p.ej. distancia, id)
+
+    Returns:
+        str: Cursor en base64 url-safe
+    """
+    contenido = json.dumps(list(valores), separators=(",", ":"), default=str)
+    return base64.urlsafe_b64encode(contenido.encode("utf-8")).decode("ascii").rstrip("=")
+
+
+def decodificar_cursor(cursor: Optional[str], cantidad: int) -> Optional[Tuple[Any, ...]]:
+    """
+    Decodifica un cursor generado por codificar_cursor
+
+    Args:
+        cursor: Cursor recibido (o None para la primera página)
+        cantidad: Cantidad de valores que debe contener
+
+    Returns:
+        Optional[Tuple]: Valores del cursor, o None si no se recibió
+
+    Raises:
+        ValueError: Si el cursor no es válido
+    """
+    if not cursor:
+        return None
+
+    try:
+        relleno = "=" * (-len(cursor) % 4)
+        valores = json.loads(base64.urlsafe_b64decode(cursor + relleno).decode("utf-8"))
+    except (ValueError, UnicodeDecodeError):
+        raise ValueError(msg.CURSOR_INVALIDO)
+
+    if not isinstance(valores, list) or len(valores) != cantidad:
+        raise ValueError(msg.CURSOR_INVALIDO)
+
+    return tuple(valores)
@@ -19,16 +19,20 @@ CREATE TABLE IF NOT EXISTS usuarios (
     latitud DECIMAL(10, 7) NOT NULL CHECK (latitud >= -90 AND latitud <= 90),
     longitud DECIMAL(10, 7) NOT NULL CHECK (longitud >= -180 AND longitud <= 180),
     ubicacion_texto VARCHAR(255) NOT NULL,
+    -- ubicacion_texto en minúsculas y sin acentos (normalizar_texto) para la búsqueda
+    ubicacion_normalizada VARCHAR(255) NOT NULL DEFAULT '',
     descripcion TEXT,
     genero ENUM('Masculino', 'Femenino', 'Otro') NOT NULL,
     posicion ENUM('Arquero', 'Defensa', 'Mediocampista', 'Delantero') NOT NULL,
     postulado BOOLEAN NOT NULL DEFAULT FALSE,
+    version INT UNSIGNED NOT NULL DEFAULT 1,
     created_at TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP,
     updated_at TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP ON UPDATE CURRENT_TIMESTAMP,
     INDEX idx_usuarios_postulado (postulado),
     INDEX idx_usuarios_genero (genero),
     INDEX idx_usuarios_posicion (posicion),
-    INDEX idx_usuarios_ubicacion (ubicacion_texto)
+    INDEX idx_usuarios_ubicacion (ubicacion_texto),
+    INDEX idx_usuarios_ubicacion_normalizada (ubicacion_normalizada)
 ) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_unicode_ci;
 
 -- ============================================
@@ -50,14 +54,23 @@ CREATE TABLE IF NOT EXISTS partidos (
     edad_minima INT NOT NULL CHECK (edad_minima >= 16 AND edad_minima <= 99),
     estado ENUM('Pendiente', 'Confirmado', 'Cancelado', 'Finalizado') NOT NULL DEFAULT 'Pendiente',
     contrasena VARCHAR(255) NULL,
+    -- Título en minúsculas y sin acentos (normalizar_texto) para la búsqueda
+    titulo_normalizado VARCHAR(100) NOT NULL DEFAULT '',
+    -- Contadores materializados de participaciones (ver app/jobs/reconciliar_contadores.py)
+    confirmados INT NOT NULL DEFAULT 0,
+    pendientes INT NOT NULL DEFAULT 0,
+    version INT UNSIGNED NOT NULL DEFAULT 1,
     created_at TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP,
     updated_at TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP ON UPDATE CURRENT_TIMESTAMP,
     CONSTRAINT fk_partido_organizador FOREIGN KEY (organizador_id) 
         REFERENCES usuarios(id) ON DELETE CASCADE,
     INDEX idx_partidos_fecha_hora (fecha_hora),
+    INDEX idx_partidos_fecha_tipo_futbol (fecha_hora, tipo_futbol),
+    INDEX idx_partidos_ubicacion (latitud, longitud, fecha_hora),
     INDEX idx_partidos_organizador (organizador_id),
     INDEX idx_partidos_tipo_futbol (tipo_futbol),
     INDEX idx_partidos_estado (estado),
+    INDEX idx_partidos_estado_fecha (estado, fecha_hora),
     INDEX idx_partidos_tipo_partido (tipo_partido)
 ) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_unicode_ci;
 
@@ -79,7 +92,9 @@ CREATE TABLE IF NOT EXISTS participaciones (
     CONSTRAINT uq_participacion_partido_jugador UNIQUE (partido_id, jugador_id),
     INDEX idx_participaciones_partido (partido_id),
     INDEX idx_participaciones_jugador (jugador_id),
-    INDEX idx_participaciones_estado (estado)
+    INDEX idx_participaciones_estado (estado),
+    INDEX idx_participaciones_partido_estado (partido_id, estado),
+    INDEX idx_participaciones_partido_jugador_estado (partido_id, jugador_id, estado)
 ) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_unicode_ci;
 
 -- ============================================
@@ -101,7 +116,8 @@ CREATE TABLE IF NOT EXISTS invitaciones (
     CONSTRAINT uq_invitacion_partido_jugador UNIQUE (partido_id, jugador_id),
     INDEX idx_invitaciones_partido (partido_id),
     INDEX idx_invitaciones_jugador (jugador_id),
-    INDEX idx_invitaciones_estado (estado)
+    INDEX idx_invitaciones_estado (estado),
+    INDEX idx_invitaciones_jugador_estado_fecha (jugador_id, estado, fecha_invitacion)
 ) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_unicode_ci;
 
 -- ============================================
@@ -129,26 +145,129 @@ CREATE TABLE IF NOT EXISTS calificaciones (
     INDEX idx_calificaciones_calificado (calificado_id)
 ) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_unicode_ci;
 
+-- ============================================
+-- TABLA: partidos_archivo
+-- ============================================
+-- Tablas frías: partidos viejos archivados con sus participaciones,
+-- invitaciones y calificaciones (ver app/jobs/ciclo_partidos.py). Sin claves
+-- foráneas.
+CREATE TABLE IF NOT EXISTS partidos_archivo (
+    id INT PRIMARY KEY,
+    titulo VARCHAR(100) NOT NULL,
+    dinero_por_persona INT NOT NULL,
+    descripcion TEXT,
+    fecha_hora DATETIME NOT NULL,
+    latitud DECIMAL(10, 7) NOT NULL,
+    longitud DECIMAL(10, 7) NOT NULL,
+    ubicacion_texto VARCHAR(255) NOT NULL,
+    capacidad_maxima INT NOT NULL,
+    organizador_id INT NOT NULL,
+    tipo_partido ENUM('Publico', 'Privado') NOT NULL,
+    tipo_futbol ENUM('Futbol 5', 'Futbol 7', 'Futbol 11') NOT NULL,
+    edad_minima INT NOT NULL,
+    estado ENUM('Pendiente', 'Confirmado', 'Cancelado', 'Finalizado') NOT NULL,
+    contrasena VARCHAR(255) NULL,
+    titulo_normalizado VARCHAR(100) NOT NULL DEFAULT '',
+    confirmados INT NOT NULL DEFAULT 0,
+    pendientes INT NOT NULL DEFAULT 0,
+    created_at TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP,
+    updated_at TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP,
+    archivado_at TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP,
+    INDEX idx_partidos_archivo_fecha_hora (fecha_hora),
+    INDEX idx_partidos_archivo_organizador_fecha (organizador_id, fecha_hora)
+) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_unicode_ci;
+
+-- ============================================
+-- TABLA: participaciones_archivo
+-- ============================================
+CREATE TABLE IF NOT EXISTS participaciones_archivo (
+    id INT PRIMARY KEY,
+    partido_id INT NOT NULL,
+    jugador_id INT NOT NULL,
+    estado ENUM('Pendiente', 'Confirmado', 'Rechazado', 'Cancelado') NOT NULL,
+    fecha_postulacion DATETIME NOT NULL,
+    created_at TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP,
+    updated_at TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP,
+    archivado_at TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP,
+    INDEX idx_participaciones_archivo_partido (partido_id),
+    INDEX idx_participaciones_archivo_jugador_estado (jugador_id, estado)
+) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_unicode_ci;
+
+-- ============================================
+-- TABLA: calificaciones_archivo
+-- ============================================
+CREATE TABLE IF NOT EXISTS calificaciones_archivo (
+    id INT PRIMARY KEY,
+    partido_id INT NOT NULL,
+    calificador_id INT NOT NULL,
+    calificado_id INT NOT NULL,
+    puntuacion INT NOT NULL,
+    comentario TEXT,
+    created_at TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP,
+    archivado_at TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP,
+    INDEX idx_calificaciones_archivo_partido (partido_id),
+    INDEX idx_calificaciones_archivo_calificado (calificado_id)
+) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_unicode_ci;
+
+-- ============================================
+-- TABLA: invitaciones_archivo
+-- ============================================
+CREATE TABLE IF NOT EXISTS invitaciones_archivo (
+    id INT PRIMARY KEY,
+    partido_id INT NOT NULL,
+    jugador_id INT NOT NULL,
+    estado ENUM('Pendiente', 'Aceptada', 'Rechazada') NOT NULL,
+    fecha_invitacion DATETIME NOT NULL,
+    fecha_respuesta DATETIME NULL,
+    created_at TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP,
+    updated_at TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP,
+    archivado_at TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP,
+    INDEX idx_invitaciones_archivo_partido (partido_id),
+    INDEX idx_invitaciones_archivo_jugador (jugador_id)
+) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_unicode_ci;
+
+-- ============================================
+-- TABLA: schema_migrations
+-- ============================================
+-- Migraciones de migraciones/ ya incluidas en este script.
+-- Al agregar una migración, reflejar el cambio arriba y registrarla acá.
+CREATE TABLE IF NOT EXISTS schema_migrations (
+    version VARCHAR(20) PRIMARY KEY,
+    nombre VARCHAR(255) NOT NULL,
+    aplicada_en TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP
+) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_unicode_ci;
+
+INSERT INTO schema_migrations (version, nombre) VALUES
+('001', 'indice_ubicacion_partidos'),
+('002', 'contadores_participantes'),
+('003', 'indices_compuestos'),
+('004', 'titulo_normalizado'),
+('005', 'ubicacion_normalizada_usuarios'),
+('006', 'archivo_partidos'),
+('007', 'version_partidos_usuarios'),
+('008', 'invitaciones_archivo');
 
 -- ============================================
 -- DATOS DE EJEMPLO
 -- ============================================
 
-INSERT INTO usuarios (nombre, fecha_nacimiento, latitud, longitud, ubicacion_texto, descripcion, genero, posicion, postulado) VALUES
-('Juan Pérez', '1996-05-15', -34.7050, -58.5648, 'Morón, Buenos Aires', 'Jugador amateur, me gusta el fútbol desde chico', 'Masculino', 'Mediocampista', false),
-('María González', '1999-08-22', -34.6764, -58.5640, 'Castelar, Buenos Aires', 'Delantero, juego hace 10 años', 'Femenino', 'Delantero', true),
-('Carlos Rodríguez', '1992-03-10', -34.6590, -58.6227, 'Ituzaingó, Buenos Aires', 'Arquero experimentado', 'Masculino', 'Arquero', true),
-('Laura Martínez', '2001-11-30', -34.7100, -58.5700, 'Morón, Buenos Aires', 'Defensora rápida', 'Femenino', 'Defensa', true),
-('Alex Torres', '1997-07-18', -34.6800, -58.5800, 'Castelar, Buenos Aires', 'Juego en cualquier posición', 'Otro', 'Mediocampista', false);
+INSERT INTO usuarios (nombre, fecha_nacimiento, latitud, longitud, ubicacion_texto, ubicacion_normalizada, descripcion, genero, posicion, postulado) VALUES
+('Juan Pérez', '1996-05-15', -34.7050, -58.5648, 'Morón, Buenos Aires', 'moron, buenos aires', 'Jugador amateur, me gusta el fútbol desde chico', 'Masculino', 'Mediocampista', false),
+('María González', '1999-08-22', -34.6764, -58.5640, 'Castelar, Buenos Aires', 'castelar, buenos aires', 'Delantero, juego hace 10 años', 'Femenino', 'Delantero', true),
+('Carlos Rodríguez', '1992-03-10', -34.6590, -58.6227, 'Ituzaingó, Buenos Aires', 'ituzaingo, buenos aires', 'Arquero experimentado', 'Masculino', 'Arquero', true),
+('Laura Martínez', '2001-11-30', -34.7100, -58.5700, 'Morón, Buenos Aires', 'moron, buenos aires', 'Defensora rápida', 'Femenino', 'Defensa', true),
+('Alex Torres', '1997-07-18', -34.6800, -58.5800, 'Castelar, Buenos Aires', 'castelar, buenos aires', 'Juego en cualquier posición', 'Otro', 'Mediocampista', false);
 
 -- Ejemplo de partido
-INSERT INTO partidos (titulo, dinero_por_persona, descripcion, fecha_hora, latitud, longitud, ubicacion_texto, capacidad_maxima, organizador_id, tipo_partido, tipo_futbol, edad_minima, estado)
-VALUES ('Futbol 5 - Sábado tarde', 5000, 'Partido tranquilo para pasar el rato', DATE_ADD(NOW(), INTERVAL 2 DAY), -34.7050, -58.5648, 'Complejo La Cancha, Morón', 10, 1, 'Publico', 'Futbol 5', 18, 'Pendiente');
+INSERT INTO partidos (titulo, dinero_por_persona, descripcion, fecha_hora, latitud, longitud, ubicacion_texto, capacidad_maxima, organizador_id, tipo_partido, tipo_futbol, edad_minima, estado, titulo_normalizado)
+VALUES ('Futbol 5 - Sábado tarde', 5000, 'Partido tranquilo para pasar el rato', DATE_ADD(NOW(), INTERVAL 2 DAY), -34.7050, -58.5648, 'Complejo La Cancha, Morón', 10, 1, 'Publico', 'Futbol 5', 18, 'Pendiente', 'futbol 5 - sabado tarde');
 
 -- Participación del organizador
 INSERT INTO participaciones (partido_id, jugador_id, estado)
 VALUES (1, 1, 'Confirmado');
 
+UPDATE partidos SET confirmados = 1 WHERE id = 1;
+
 -- ============================================
 -- VERIFICACIÓN
 -- ============================================
@@ -0,0 +1,2 @@
+-- Prefiltro por bounding box de la búsqueda de partidos
+CREATE INDEX idx_partidos_ubicacion ON partidos (latitud, longitud, fecha_hora);
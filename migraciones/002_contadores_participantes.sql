@@ -0,0 +1,18 @@
+-- Contadores materializados de participaciones en partidos
+ALTER TABLE partidos
+    ADD COLUMN confirmados INT NOT NULL DEFAULT 0 AFTER contrasena,
+    ADD COLUMN pendientes INT NOT NULL DEFAULT 0 AFTER confirmados;
+
+-- Carga inicial desde participaciones
+UPDATE partidos p
+LEFT JOIN (
+    SELECT
+        partido_id,
+        SUM(estado = 'Confirmado') as confirmados,
+        SUM(estado = 'Pendiente') as pendientes
+    FROM participaciones
+    GROUP BY partido_id
+) c ON c.partido_id = p.id
+SET
+    p.confirmados = COALESCE(c.confirmados, 0),
+    p.pendientes = COALESCE(c.pendientes, 0);
@@ -0,0 +1,13 @@
+-- Índices compuestos para las consultas más frecuentes
+
+-- Participaciones de un partido por estado (detalle, conteos)
+CREATE INDEX idx_participaciones_partido_estado ON participaciones (partido_id, estado);
+
+-- Participación activa de un jugador en un partido
+CREATE INDEX idx_participaciones_partido_jugador_estado ON participaciones (partido_id, jugador_id, estado);
+
+-- Invitaciones de un jugador por estado, ordenadas por fecha (paginación)
+CREATE INDEX idx_invitaciones_jugador_estado_fecha ON invitaciones (jugador_id, estado, fecha_invitacion);
+
+-- Búsqueda de partidos por rango de fechas y tipo de fútbol
+CREATE INDEX idx_partidos_fecha_tipo_futbol ON partidos (fecha_hora, tipo_futbol);
@@ -0,0 +1,4 @@
+-- Título sin tildes ni mayúsculas, sobre el que filtra la búsqueda por título.
+-- Después de aplicarla, cargar los datos con: python -m app.jobs.indexar_titulos
+ALTER TABLE partidos
+    ADD COLUMN titulo_normalizado VARCHAR(100) NOT NULL DEFAULT '' AFTER contrasena;
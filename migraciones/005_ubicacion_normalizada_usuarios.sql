@@ -0,0 +1,5 @@
+-- Ubicación pre-normalizada para la búsqueda de jugadores sin funciones por fila.
+-- Después de aplicarla, cargar los datos con: python -m app.jobs.normalizar_ubicaciones
+ALTER TABLE usuarios
+    ADD COLUMN ubicacion_normalizada VARCHAR(255) NOT NULL DEFAULT '' AFTER ubicacion_texto,
+    ADD INDEX idx_usuarios_ubicacion_normalizada (ubicacion_normalizada);
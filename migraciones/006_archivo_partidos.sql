@@ -0,0 +1,58 @@
+-- Ciclo de vida de partidos: índice para encontrar los vencidos por estado y
+-- tablas frías donde se archivan los partidos viejos con sus participaciones y
+-- calificaciones (ver app/jobs/ciclo_partidos.py). Las tablas de archivo no
+-- tienen claves foráneas: las filas calientes se borran al archivar.
+ALTER TABLE partidos
+    ADD INDEX idx_partidos_estado_fecha (estado, fecha_hora);
+
+CREATE TABLE IF NOT EXISTS partidos_archivo (
+    id INT PRIMARY KEY,
+    titulo VARCHAR(100) NOT NULL,
+    dinero_por_persona INT NOT NULL,
+    descripcion TEXT,
+    fecha_hora DATETIME NOT NULL,
+    latitud DECIMAL(10, 7) NOT NULL,
+    longitud DECIMAL(10, 7) NOT NULL,
+    ubicacion_texto VARCHAR(255) NOT NULL,
+    capacidad_maxima INT NOT NULL,
+    organizador_id INT NOT NULL,
+    tipo_partido ENUM('Publico', 'Privado') NOT NULL,
+    tipo_futbol ENUM('Futbol 5', 'Futbol 7', 'Futbol 11') NOT NULL,
+    edad_minima INT NOT NULL,
+    estado ENUM('Pendiente', 'Confirmado', 'Cancelado', 'Finalizado') NOT NULL,
+    contrasena VARCHAR(255) NULL,
+    titulo_normalizado VARCHAR(100) NOT NULL DEFAULT '',
+    confirmados INT NOT NULL DEFAULT 0,
+    pendientes INT NOT NULL DEFAULT 0,
+    created_at TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP,
+    updated_at TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP,
+    archivado_at TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP,
+    INDEX idx_partidos_archivo_fecha_hora (fecha_hora),
+    INDEX idx_partidos_archivo_organizador_fecha (organizador_id, fecha_hora)
+) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_unicode_ci;
+
+CREATE TABLE IF NOT EXISTS participaciones_archivo (
+    id INT PRIMARY KEY,
+    partido_id INT NOT NULL,
+    jugador_id INT NOT NULL,
+    estado ENUM('Pendiente', 'Confirmado', 'Rechazado', 'Cancelado') NOT NULL,
+    fecha_postulacion DATETIME NOT NULL,
+    created_at TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP,
+    updated_at TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP,
+    archivado_at TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP,
+    INDEX idx_participaciones_archivo_partido (partido_id),
+    INDEX idx_participaciones_archivo_jugador_estado (jugador_id, estado)
+) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_unicode_ci;
+
+CREATE TABLE IF NOT EXISTS calificaciones_archivo (
+    id INT PRIMARY KEY,
+    partido_id INT NOT NULL,
+    calificador_id INT NOT NULL,
+    calificado_id INT NOT NULL,
+    puntuacion INT NOT NULL,
+    comentario TEXT,
+    created_at TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP,
+    archivado_at TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP,
+    INDEX idx_calificaciones_archivo_partido (partido_id),
+    INDEX idx_calificaciones_archivo_calificado (calificado_id)
+) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_unicode_ci;
@@ -0,0 +1,8 @@
+-- Versión de fila para ETags: los repositorios la incrementan en cada escritura
+-- que cambia el detalle del partido o el perfil del usuario, y los GET
+-- condicionales (If-None-Match) la consultan por clave primaria.
+ALTER TABLE partidos
+    ADD COLUMN version INT UNSIGNED NOT NULL DEFAULT 1 AFTER pendientes;
+
+ALTER TABLE usuarios
+    ADD COLUMN version INT UNSIGNED NOT NULL DEFAULT 1 AFTER postulado;
@@ -0,0 +1,16 @@
+-- Archivo de invitaciones: al archivar un partido sus invitaciones se copian
+-- acá antes de borrarlo (en la tabla caliente caen en cascada). Como el
+-- resto de las tablas de archivo, no tiene claves foráneas.
+CREATE TABLE IF NOT EXISTS invitaciones_archivo (
+    id INT PRIMARY KEY,
+    partido_id INT NOT NULL,
+    jugador_id INT NOT NULL,
+    estado ENUM('Pendiente', 'Aceptada', 'Rechazada') NOT NULL,
+    fecha_invitacion DATETIME NOT NULL,
+    fecha_respuesta DATETIME NULL,
+    created_at TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP,
+    updated_at TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP,
+    archivado_at TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP,
+    INDEX idx_invitaciones_archivo_partido (partido_id),
+    INDEX idx_invitaciones_archivo_jugador (jugador_id)
+) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_unicode_ci;
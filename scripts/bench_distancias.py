@@ -0,0 +1,62 @@
+"""Micro-benchmark de calcular_distancia vs calcular_distancias (lote)
+
+Uso:
+    python -m scripts.bench_distancias
+"""
+import random
+import timeit
+
+from app.utils import date_utils
+from app.utils.date_utils import calcular_distancia, calcular_distancias
+
+ORIGEN = (-34.6532, -58.6198)  # Morón, Buenos Aires
+RADIO_KM = 10.0
+TAMANOS = (1_000, 10_000, 100_000)
+
+
+def _generar_puntos(cantidad: int):
+    random.seed(cantidad)
+    latitudes = [ORIGEN[0] + random.uniform(-0.5, 0.5) for _ in range(cantidad)]
+    longitudes = [ORIGEN[1] + random.uniform(-0.5, 0.5) for _ in range(cantidad)]
+    return latitudes, longitudes
+
+
+def _escalar(latitudes, longitudes):
+    return [
+        calcular_distancia(ORIGEN[0], ORIGEN[1], lat, lon) <= RADIO_KM
+        for lat, lon in zip(latitudes, longitudes)
+    ]
+
+
+def _medir(funcion, repeticiones: int) -> float:
+    """Devuelve el mejor tiempo por llamada en milisegundos"""
+    tiempos = timeit.repeat(funcion, number=1, repeat=repeticiones)
+    return min(tiempos) * 1000
+
+
+def main():
+    print(f"NumPy disponible: {date_utils.np is not None}")
+    print(f"{'candidatos':>10} | {'escalar (ms)':>12} | {'lote (ms)':>10} | {'lote python (ms)':>16}")
+    print("-" * 60)
+
+    for cantidad in TAMANOS:
+        latitudes, longitudes = _generar_puntos(cantidad)
+        repeticiones = 5 if cantidad < 100_000 else 3
+
+        escalar = _medir(lambda: _escalar(latitudes, longitudes), repeticiones)
+        lote = _medir(
+            lambda: calcular_distancias(ORIGEN[0], ORIGEN[1], latitudes, longitudes, RADIO_KM),
+            repeticiones,
+        )
+        lote_python = _medir(
+            lambda: date_utils._calcular_distancias_python(
+                ORIGEN[0], ORIGEN[1], latitudes, longitudes, RADIO_KM
+            ),
+            repeticiones,
+        )
+
+        print(f"{cantidad:>10} | {escalar:>12.2f} | {lote:>10.2f} | {lote_python:>16.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,78 @@
+"""Micro-benchmark de normalizar_texto: versión original vs memoizada vs lote
+
+Uso:
+    python -m scripts.bench_normalizar
+"""
+import random
+import timeit
+import unicodedata
+
+from app.utils.date_utils import normalizar_texto, normalizar_textos
+
+# Localidades típicas (con y sin acentos), como llegan en perfiles y búsquedas
+LOCALIDADES = [
+    "Morón, Buenos Aires",
+    "Castelar, Buenos Aires",
+    "Ituzaingó, Buenos Aires",
+    "Haedo",
+    "Ramos Mejía",
+    "San Martín",
+    "Villa Luzuriaga",
+    "Núñez, CABA",
+    "Palermo, CABA",
+    "Caballito",
+    "Córdoba",
+    "San Miguel de Tucumán",
+    "Neuquén",
+    "Río Gallegos",
+    "Mar del Plata",
+    "Bahía Blanca",
+    "Güemes, Salta",
+    "Lomas de Zamora",
+    "Ezeiza",
+    "Florencio Varela",
+]
+CANTIDAD = 100_000
+
+
+def _normalizar_original(texto: str) -> str:
+    """normalizar_texto previo al cache y al camino rápido ASCII"""
+    texto_nfd = unicodedata.normalize('NFD', texto.lower())
+    return ''.join(char for char in texto_nfd if unicodedata.category(char) != 'Mn')
+
+
+def _medir(funcion, repeticiones: int = 5) -> float:
+    """Devuelve el mejor tiempo en milisegundos"""
+    return min(timeit.repeat(funcion, number=1, repeat=repeticiones)) * 1000
+
+
+def main():
+    random.seed(CANTIDAD)
+    textos = [random.choice(LOCALIDADES) for _ in range(CANTIDAD)]
+    ascii_ = [texto for texto in textos if texto.isascii()]
+    sin_cache = normalizar_texto.__wrapped__
+
+    assert [_normalizar_original(t) for t in LOCALIDADES] == normalizar_textos(LOCALIDADES)
+
+    normalizar_texto.cache_clear()
+    casos = [
+        ("original", lambda: [_normalizar_original(t) for t in textos]),
+        ("camino rápido ASCII, sin cache", lambda: [sin_cache(t) for t in textos]),
+        ("memoizada", lambda: [normalizar_texto(t) for t in textos]),
+        ("lote (normalizar_textos)", lambda: normalizar_textos(textos)),
+    ]
+
+    print(f"{CANTIDAD} textos, {len(LOCALIDADES)} localidades distintas ({len(ascii_)} ASCII)")
+    print(f"{'variante':>32} | {'tiempo (ms)':>11} | {'speedup':>7}")
+    print("-" * 58)
+    base = None
+    for nombre, funcion in casos:
+        tiempo = _medir(funcion)
+        base = base or tiempo
+        print(f"{nombre:>32} | {tiempo:>11.2f} | {base / tiempo:>6.1f}x")
+
+    print(f"\nCache: {normalizar_texto.cache_info()}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,191 @@
+"""Prueba de estrés del cupo: aprobaciones concurrentes sobre un mismo partido
+
+Crea un organizador, un partido con capacidad_maxima chica y muchos jugadores
+con postulaciones pendientes; después aprueba todas a la vez desde varios
+hilos (cada aprobación en su propia unidad de trabajo, como un request) y
+verifica que nunca haya más confirmados que capacidad_maxima, tanto en
+participaciones como en el contador materializado. Al final borra lo creado.
+
+Uso:
+    python -m scripts.stress_cupo [--url mysql+pymysql://...] [--hilos 32] [--jugadores 60]
+        [--capacidad 10] [--rondas 5]
+
+Sale con código 1 si en alguna ronda se excedió el cupo.
+"""
+import argparse
+import statistics
+import sys
+import time
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta
+
+from sqlalchemy import text
+
+import app.infra.database.database_service as db
+from app.domain.exceptions import PartidoCompletoException
+from app.domain.services.service_delegator import ServiceDelegator
+from app.infra.database.unit_of_work import UnitOfWork
+from app.utils.config import settings
+
+
+def _crear_escenario(database_client, marca: str, jugadores: int, capacidad: int):
+    """Crea organizador, partido y postulaciones pendientes; devuelve (partido_id, participacion_ids)"""
+    usuario = {
+        "fecha_nacimiento": "1995-01-01",
+        "latitud": -34.6037,
+        "longitud": -58.3816,
+        "ubicacion_texto": "Stress",
+        "ubicacion_normalizada": "stress",
+        "genero": "Otro",
+        "posicion": "Defensa",
+    }
+    sql_usuario = text(
+        """
+        INSERT INTO usuarios (
+            nombre, fecha_nacimiento, latitud, longitud, ubicacion_texto,
+            ubicacion_normalizada, genero, posicion
+        ) VALUES (
+            :nombre, :fecha_nacimiento, :latitud, :longitud, :ubicacion_texto,
+            :ubicacion_normalizada, :genero, :posicion
+        )
+        """
+    )
+
+    with database_client.get_session("tt") as sesion:
+        organizador_id = sesion.execute(sql_usuario, {**usuario, "nombre": f"{marca}-org"}).lastrowid
+        partido_id = sesion.execute(
+            text(
+                """
+                INSERT INTO partidos (
+                    titulo, dinero_por_persona, fecha_hora, latitud, longitud, ubicacion_texto,
+                    capacidad_maxima, organizador_id, tipo_partido, tipo_futbol, edad_minima
+                ) VALUES (
+                    :titulo, 0, :fecha_hora, :latitud, :longitud, :ubicacion_texto,
+                    :capacidad, :organizador_id, 'Publico', 'Futbol 5', 16
+                )
+                """
+            ),
+            {
+                **usuario,
+                "titulo": marca,
+                "fecha_hora": datetime.now() + timedelta(days=7),
+                "capacidad": capacidad,
+                "organizador_id": organizador_id,
+            },
+        ).lastrowid
+
+        participacion_ids = []
+        for numero in range(jugadores):
+            jugador_id = sesion.execute(sql_usuario, {**usuario, "nombre": f"{marca}-{numero}"}).lastrowid
+            participacion_ids.append(sesion.execute(
+                text(
+                    "INSERT INTO participaciones (partido_id, jugador_id, estado) "
+                    "VALUES (:partido_id, :jugador_id, 'Pendiente')"
+                ),
+                {"partido_id": partido_id, "jugador_id": jugador_id},
+            ).lastrowid)
+
+        sesion.execute(
+            text("UPDATE partidos SET pendientes = :pendientes WHERE id = :id"),
+            {"pendientes": jugadores, "id": partido_id},
+        )
+        sesion.commit()
+
+    return organizador_id, partido_id, participacion_ids
+
+
+def _contar(database_client, partido_id: int):
+    with database_client.get_session("tt") as sesion:
+        fila = sesion.execute(
+            text(
+                """
+                SELECT
+                    p.capacidad_maxima,
+                    p.confirmados,
+                    (SELECT COUNT(*) FROM participaciones pa
+                     WHERE pa.partido_id = p.id AND pa.estado = 'Confirmado') as confirmados_reales
+                FROM partidos p
+                WHERE p.id = :id
+                """
+            ),
+            {"id": partido_id},
+        ).fetchone()
+    return fila._mapping
+
+
+def _limpiar(database_client, marca: str) -> None:
+    """Borra los usuarios de la prueba (partido y participaciones caen en cascada)"""
+    with database_client.get_session("tt") as sesion:
+        sesion.execute(text("DELETE FROM usuarios WHERE nombre LIKE :marca"), {"marca": f"{marca}-%"})
+        sesion.commit()
+
+
+def ronda(database_client, partido_service, hilos: int, jugadores: int, capacidad: int) -> bool:
+    marca = f"stress-{uuid.uuid4().hex[:8]}"
+    organizador_id, partido_id, participacion_ids = _crear_escenario(database_client, marca, jugadores, capacidad)
+
+    def aprobar(participacion_id: int):
+        inicio = time.perf_counter()
+        try:
+            with UnitOfWork(database_client):
+                partido_service.gestionar_participacion(partido_id, participacion_id, organizador_id, "aprobar")
+            resultado = "aprobada"
+        except PartidoCompletoException:
+            resultado = "completo"
+        return resultado, time.perf_counter() - inicio
+
+    try:
+        inicio = time.perf_counter()
+        with ThreadPoolExecutor(max_workers=hilos) as executor:
+            resultados = list(executor.map(aprobar, participacion_ids))
+        total = time.perf_counter() - inicio
+
+        conteo = _contar(database_client, partido_id)
+    finally:
+        _limpiar(database_client, marca)
+
+    aprobadas = sum(1 for resultado, _ in resultados if resultado == "aprobada")
+    latencias = sorted(segundos * 1000 for _, segundos in resultados)
+    ok = (
+        aprobadas == conteo["confirmados_reales"] == conteo["confirmados"]
+        and conteo["confirmados"] <= conteo["capacidad_maxima"]
+    )
+
+    print(
+        f"{'OK ' if ok else 'ERR'} aprobadas={aprobadas} confirmados={conteo['confirmados']} "
+        f"reales={conteo['confirmados_reales']} capacidad={conteo['capacidad_maxima']} | "
+        f"{len(resultados) / total:.0f} ops/s, p50={statistics.median(latencias):.1f} ms, "
+        f"p99={latencias[int(len(latencias) * 0.99) - 1]:.1f} ms"
+    )
+    return ok
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Estrés de aprobaciones concurrentes sobre un partido")
+    parser.add_argument("--url", default=settings.DATABASE_URL)
+    parser.add_argument("--hilos", type=int, default=32)
+    parser.add_argument("--jugadores", type=int, default=60)
+    parser.add_argument("--capacidad", type=int, default=10)
+    parser.add_argument("--rondas", type=int, default=5)
+    args = parser.parse_args()
+
+    database_client = db.DatabaseService.create(
+        impl=db.BIOMySqlConnection,
+        connections={"tt": args.url},
+        pool_size=args.hilos,
+        max_overflow=0,
+        echo=False,
+    )
+    partido_service = ServiceDelegator(database_client).get_partido_service()
+
+    fallas = sum(
+        not ronda(database_client, partido_service, args.hilos, args.jugadores, args.capacidad)
+        for _ in range(args.rondas)
+    )
+    print(f"\nRondas con cupo excedido o contadores inconsistentes: {fallas}/{args.rondas}")
+    return 1 if fallas else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
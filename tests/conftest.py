@@ -0,0 +1,226 @@
+"""Fixtures compartidas: base SQLite con el esquema mínimo de la aplicación"""
+import re
+from datetime import datetime
+
+import pytest
+from sqlalchemy import create_engine, event, text
+from sqlalchemy.orm import sessionmaker
+
+from app.infra.cache.cache import caches
+from app.infra.database.database_service import DatabaseConnection
+from app.infra.database.repositories.usuarios import indice_postulados
+
+# Esquema de crear-insert-db.sql reducido a lo que usan los repositorios
+ESQUEMA = [
+    """
+    CREATE TABLE usuarios (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        nombre VARCHAR(100) NOT NULL,
+        fecha_nacimiento DATE NOT NULL,
+        latitud DECIMAL(10, 7) NOT NULL,
+        longitud DECIMAL(10, 7) NOT NULL,
+        ubicacion_texto VARCHAR(255) NOT NULL,
+        ubicacion_normalizada VARCHAR(255) NOT NULL DEFAULT '',
+        descripcion TEXT,
+        genero VARCHAR(20) NOT NULL,
+        posicion VARCHAR(20) NOT NULL,
+        postulado BOOLEAN NOT NULL DEFAULT 0,
+        version INTEGER NOT NULL DEFAULT 1
+    )
+    """,
+    """
+    CREATE TABLE partidos (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        titulo VARCHAR(100) NOT NULL,
+        dinero_por_persona INTEGER NOT NULL,
+        descripcion TEXT,
+        fecha_hora DATETIME NOT NULL,
+        latitud DECIMAL(10, 7) NOT NULL,
+        longitud DECIMAL(10, 7) NOT NULL,
+        ubicacion_texto VARCHAR(255) NOT NULL,
+        capacidad_maxima INTEGER NOT NULL,
+        organizador_id INTEGER NOT NULL REFERENCES usuarios(id) ON DELETE CASCADE,
+        tipo_partido VARCHAR(20) NOT NULL,
+        tipo_futbol VARCHAR(20) NOT NULL,
+        edad_minima INTEGER NOT NULL,
+        estado VARCHAR(20) NOT NULL DEFAULT 'Pendiente',
+        contrasena VARCHAR(255),
+        titulo_normalizado VARCHAR(100) NOT NULL DEFAULT '',
+        confirmados INTEGER NOT NULL DEFAULT 0,
+        pendientes INTEGER NOT NULL DEFAULT 0,
+        version INTEGER NOT NULL DEFAULT 1,
+        created_at DATETIME NOT NULL DEFAULT CURRENT_TIMESTAMP,
+        updated_at DATETIME NOT NULL DEFAULT CURRENT_TIMESTAMP
+    )
+    """,
+    """
+    CREATE TABLE participaciones (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        partido_id INTEGER NOT NULL REFERENCES partidos(id) ON DELETE CASCADE,
+        jugador_id INTEGER NOT NULL REFERENCES usuarios(id) ON DELETE CASCADE,
+        estado VARCHAR(20) NOT NULL DEFAULT 'Pendiente',
+        fecha_postulacion DATETIME NOT NULL DEFAULT CURRENT_TIMESTAMP,
+        created_at DATETIME NOT NULL DEFAULT CURRENT_TIMESTAMP,
+        updated_at DATETIME NOT NULL DEFAULT CURRENT_TIMESTAMP,
+        UNIQUE (partido_id, jugador_id)
+    )
+    """,
+    """
+    CREATE TABLE invitaciones (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        partido_id INTEGER NOT NULL REFERENCES partidos(id) ON DELETE CASCADE,
+        jugador_id INTEGER NOT NULL REFERENCES usuarios(id) ON DELETE CASCADE,
+        estado VARCHAR(20) NOT NULL DEFAULT 'Pendiente',
+        fecha_invitacion DATETIME NOT NULL DEFAULT CURRENT_TIMESTAMP,
+        fecha_respuesta DATETIME,
+        created_at DATETIME NOT NULL DEFAULT CURRENT_TIMESTAMP,
+        updated_at DATETIME NOT NULL DEFAULT CURRENT_TIMESTAMP,
+        UNIQUE (partido_id, jugador_id)
+    )
+    """,
+    """
+    CREATE TABLE calificaciones (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        partido_id INTEGER NOT NULL REFERENCES partidos(id) ON DELETE CASCADE,
+        calificador_id INTEGER NOT NULL,
+        calificado_id INTEGER NOT NULL,
+        puntuacion INTEGER NOT NULL,
+        comentario TEXT,
+        created_at DATETIME NOT NULL DEFAULT CURRENT_TIMESTAMP
+    )
+    """,
+    """
+    CREATE TABLE partidos_archivo (
+        id INTEGER PRIMARY KEY,
+        titulo VARCHAR(100) NOT NULL,
+        dinero_por_persona INTEGER NOT NULL,
+        descripcion TEXT,
+        fecha_hora DATETIME NOT NULL,
+        latitud DECIMAL(10, 7) NOT NULL,
+        longitud DECIMAL(10, 7) NOT NULL,
+        ubicacion_texto VARCHAR(255) NOT NULL,
+        capacidad_maxima INTEGER NOT NULL,
+        organizador_id INTEGER NOT NULL,
+        tipo_partido VARCHAR(20) NOT NULL,
+        tipo_futbol VARCHAR(20) NOT NULL,
+        edad_minima INTEGER NOT NULL,
+        estado VARCHAR(20) NOT NULL,
+        contrasena VARCHAR(255),
+        titulo_normalizado VARCHAR(100) NOT NULL DEFAULT '',
+        confirmados INTEGER NOT NULL DEFAULT 0,
+        pendientes INTEGER NOT NULL DEFAULT 0,
+        created_at DATETIME NOT NULL,
+        updated_at DATETIME NOT NULL,
+        archivado_at DATETIME NOT NULL DEFAULT CURRENT_TIMESTAMP
+    )
+    """,
+    """
+    CREATE TABLE participaciones_archivo (
+        id INTEGER PRIMARY KEY,
+        partido_id INTEGER NOT NULL,
+        jugador_id INTEGER NOT NULL,
+        estado VARCHAR(20) NOT NULL,
+        fecha_postulacion DATETIME NOT NULL,
+        created_at DATETIME NOT NULL,
+        updated_at DATETIME NOT NULL,
+        archivado_at DATETIME NOT NULL DEFAULT CURRENT_TIMESTAMP
+    )
+    """,
+    """
+    CREATE TABLE invitaciones_archivo (
+        id INTEGER PRIMARY KEY,
+        partido_id INTEGER NOT NULL,
+        jugador_id INTEGER NOT NULL,
+        estado VARCHAR(20) NOT NULL,
+        fecha_invitacion DATETIME NOT NULL,
+        fecha_respuesta DATETIME,
+        created_at DATETIME NOT NULL,
+        updated_at DATETIME NOT NULL,
+        archivado_at DATETIME NOT NULL DEFAULT CURRENT_TIMESTAMP
+    )
+    """,
+    """
+    CREATE TABLE calificaciones_archivo (
+        id INTEGER PRIMARY KEY,
+        partido_id INTEGER NOT NULL,
+        calificador_id INTEGER NOT NULL,
+        calificado_id INTEGER NOT NULL,
+        puntuacion INTEGER NOT NULL,
+        comentario TEXT,
+        created_at DATETIME NOT NULL,
+        archivado_at DATETIME NOT NULL DEFAULT CURRENT_TIMESTAMP
+    )
+    """,
+]
+
+# SQLite bloquea la base entera: los FOR UPDATE sobran y se quitan
+_BLOQUEO_FILAS = re.compile(r"\s+FOR\s+UPDATE(\s+SKIP\s+LOCKED)?", re.IGNORECASE)
+
+
+class SqliteConnection(DatabaseConnection):
+    """Conexión síncrona a un archivo SQLite con las funciones de MySQL que usan los repositorios"""
+
+    def __init__(self, ruta: str):
+        engine = create_engine(
+            f"sqlite:///{ruta}",
+            connect_args={"check_same_thread": False, "timeout": 30},
+        )
+
+        @event.listens_for(engine, "connect")
+        def configurar(conexion, _):
+            conexion.isolation_level = None  # las transacciones las abre "begin"
+            conexion.create_function("NOW", 0, lambda: datetime.now().isoformat(" "))
+            conexion.execute("PRAGMA foreign_keys = ON")
+
+        @event.listens_for(engine, "begin")
+        def empezar(conexion):
+            # Toma el lock de escritura al empezar, como haría el lock de fila en MySQL
+            conexion.exec_driver_sql("BEGIN IMMEDIATE")
+
+        @event.listens_for(engine, "before_cursor_execute", retval=True)
+        def adaptar(conexion, cursor, sql, params, context, executemany):
+            return _BLOQUEO_FILAS.sub("", sql), params
+
+        self.engines = {"tt": engine}
+        self.sessions = {"tt": sessionmaker(engine, autocommit=False, expire_on_commit=False)}
+
+    def get_session(self, key):
+        return self.sessions[key]()
+
+    def get_engine(self, key):
+        return self.engines[key]
+
+
+class ConReplicaAtrasada(SqliteConnection):
+    """Conexión con una réplica que no debe usarse (falla si se le pide una sesión)"""
+
+    def get_read_session(self, key):
+        raise AssertionError("se leyó de una réplica un dato que debe venir del primario")
+
+    def replicas_disponibles(self, key) -> int:
+        return 1
+
+
+def crear_esquema(cliente: SqliteConnection) -> SqliteConnection:
+    """Crea las tablas de ESQUEMA en la base del cliente"""
+    with cliente.get_engine("tt").begin() as conexion:
+        for sentencia in ESQUEMA:
+            conexion.execute(text(sentencia))
+    return cliente
+
+
+@pytest.fixture
+def database_client(tmp_path):
+    cliente = crear_esquema(SqliteConnection(str(tmp_path / "mefaltauno.db")))
+    yield cliente
+    cliente.get_engine("tt").dispose()
+
+
+@pytest.fixture(autouse=True)
+def limpiar_caches():
+    """Vacía los caches y el índice de postulados compartidos para que no se filtren datos entre tests"""
+    for cache in caches:
+        cache.backend = type(cache.backend)()
+        cache.hits = cache.misses = 0
+    indice_postulados.invalidar()
+    yield
@@ -0,0 +1,51 @@
+"""Datos de prueba para los tests de repositorios y servicios"""
+from datetime import date, datetime, timedelta
+
+from sqlalchemy import text
+
+
+def crear_usuario(database_client, nombre: str = "Jugador", **datos) -> int:
+    """Inserta un usuario y devuelve su ID"""
+    fila = {
+        "nombre": nombre,
+        "fecha_nacimiento": date(1995, 1, 1),
+        "latitud": -34.6037,
+        "longitud": -58.3816,
+        "ubicacion_texto": "Palermo",
+        "genero": "Otro",
+        "posicion": "Defensa",
+        **datos,
+    }
+    with database_client.get_session("tt") as sesion:
+        usuario_id = sesion.execute(
+            text(
+                """
+                INSERT INTO usuarios (nombre, fecha_nacimiento, latitud, longitud, ubicacion_texto, genero, posicion)
+                VALUES (:nombre, :fecha_nacimiento, :latitud, :longitud, :ubicacion_texto, :genero, :posicion)
+                """
+            ),
+            fila,
+        ).lastrowid
+        sesion.commit()
+    return usuario_id
+
+
+def datos_partido(organizador_id: int, **datos) -> dict:
+    """Datos válidos para PartidoRepository.crear"""
+    return {
+        "titulo": "Partido de prueba",
+        "dinero_por_persona": 0,
+        "descripcion": None,
+        "fecha_hora": datetime.now() + timedelta(days=3),
+        "latitud": -34.6037,
+        "longitud": -58.3816,
+        "ubicacion_texto": "Palermo",
+        "capacidad_maxima": 10,
+        "organizador_id": organizador_id,
+        "tipo_partido": "Publico",
+        "tipo_futbol": "Futbol 5",
+        "edad_minima": 16,
+        "estado": "Pendiente",
+        "contrasena": None,
+        **datos,
+    }
@@ -0,0 +1,180 @@
+"""Cache read-through: TTL, desalojo LRU e invalidación"""
+from types import SimpleNamespace
+
+import pytest
+from sqlalchemy import text
+
+from app.infra.cache import cache_service
+from app.infra.cache.cache_service import InMemoryCacheBackend, ReadThroughCache
+from app.infra.database.repositories.usuarios import UsuarioRepository
+from app.infra.database.unit_of_work import UnitOfWork
+from tests.datos import crear_usuario
+
+
+@pytest.fixture
+def reloj(monkeypatch):
+    """Reemplaza time.monotonic del módulo de cache por un reloj manual"""
+    reloj = SimpleNamespace(ahora=1000.0)
+    monkeypatch.setattr(cache_service, "time", SimpleNamespace(monotonic=lambda: reloj.ahora))
+    return reloj
+
+
+class Cargador:
+    """Loader que cuenta las llamadas y devuelve el valor configurado"""
+
+    def __init__(self, valor):
+        self.valor = valor
+        self.llamadas = 0
+
+    def __call__(self):
+        self.llamadas += 1
+        return self.valor
+
+
+# ============================================
+# InMemoryCacheBackend
+# ============================================
+
+def test_backend_expira_por_ttl(reloj):
+    backend = InMemoryCacheBackend()
+    backend.set("clave", {"valor": 1}, ttl=10)
+
+    reloj.ahora += 9.9
+    assert backend.get("clave") == {"valor": 1}
+
+    reloj.ahora += 0.1
+    assert backend.get("clave") is None
+
+
+def test_backend_desaloja_la_menos_usada():
+    backend = InMemoryCacheBackend(max_entries=2)
+    backend.set("a", 1, ttl=60)
+    backend.set("b", 2, ttl=60)
+
+    backend.get("a")  # "b" pasa a ser la menos usada
+    backend.set("c", 3, ttl=60)
+
+    assert backend.get("a") == 1
+    assert backend.get("b") is None
+    assert backend.get("c") == 3
+
+
+def test_backend_devuelve_copias():
+    backend = InMemoryCacheBackend()
+    backend.set("usuario", {"nombre": "Ana"}, ttl=60)
+
+    backend.get("usuario")["nombre"] = "Otro"
+
+    assert backend.get("usuario") == {"nombre": "Ana"}
+
+
+# ============================================
+# ReadThroughCache
+# ============================================
+
+def test_read_through_carga_una_vez_hasta_expirar(reloj):
+    cache = ReadThroughCache("prueba", InMemoryCacheBackend(), ttl=30)
+    cargar = Cargador({"id": 7})
+
+    assert cache.obtener(7, cargar) == {"id": 7}
+    assert cache.obtener(7, cargar) == {"id": 7}
+    assert cargar.llamadas == 1
+
+    reloj.ahora += 30
+    cache.obtener(7, cargar)
+
+    assert cargar.llamadas == 2
+    assert cache.estadisticas() == {"cache": "prueba", "hits": 1, "misses": 2, "hit_rate": 0.3333}
+
+
+def test_read_through_invalidar_fuerza_recarga():
+    cache = ReadThroughCache("prueba", InMemoryCacheBackend(), ttl=30)
+    cache.obtener(7, Cargador("viejo"))
+
+    cache.invalidar(7)
+
+    assert cache.obtener(7, Cargador("nuevo")) == "nuevo"
+
+
+def test_read_through_no_cachea_none():
+    cache = ReadThroughCache("prueba", InMemoryCacheBackend(), ttl=30)
+    cargar = Cargador(None)
+
+    assert cache.obtener(7, cargar) is None
+    assert cache.obtener(7, cargar) is None
+    assert cargar.llamadas == 2
+
+
+def test_caches_con_backend_compartido_no_se_pisan():
+    backend = InMemoryCacheBackend()
+    usuarios = ReadThroughCache("usuarios", backend, ttl=30)
+    partidos = ReadThroughCache("partidos", backend, ttl=30)
+    usuarios.obtener(1, Cargador("usuario"))
+
+    partidos.invalidar(1)
+
+    assert partidos.obtener(1, Cargador("partido")) == "partido"
+    assert usuarios.obtener(1, Cargador("otro")) == "usuario"
+
+
+# ============================================
+# Perfil de usuario (cache_usuarios)
+# ============================================
+
+@pytest.fixture
+def usuario_repo(database_client, monkeypatch):
+    """
+    Repositorio de usuarios cuyo loader lee solo el nombre (la consulta real
+    usa TIMESTAMPDIFF/CURDATE de MySQL) y cuenta los accesos a la base
+    """
+    repo = UsuarioRepository(database_client)
+    repo.lecturas = 0
+
+    def obtener_por_id_db(usuario_id):
+        repo.lecturas += 1
+        with repo._sesion() as db:
+            fila = db.execute(
+                text("SELECT id, nombre FROM usuarios WHERE id = :id"), {"id": usuario_id}
+            ).fetchone()
+        return dict(fila._mapping) if fila else None
+
+    monkeypatch.setattr(repo, "_obtener_por_id_db", obtener_por_id_db)
+    return repo
+
+
+def _perfil(nombre: str) -> dict:
+    return {
+        "nombre": nombre,
+        "fecha_nacimiento": "1995-01-01",
+        "latitud": -34.6037,
+        "longitud": -58.3816,
+        "ubicacion_texto": "Palermo",
+        "descripcion": None,
+        "genero": "Otro",
+        "posicion": "Defensa",
+    }
+
+
+def test_actualizar_invalida_el_perfil_cacheado(database_client, usuario_repo):
+    usuario_id = crear_usuario(database_client, "Ana")
+    assert usuario_repo.obtener_por_id(usuario_id)["nombre"] == "Ana"
+    assert usuario_repo.obtener_por_id(usuario_id)["nombre"] == "Ana"
+    assert usuario_repo.lecturas == 1
+
+    usuario_repo.actualizar(usuario_id, _perfil("Ana María"))
+
+    assert usuario_repo.obtener_por_id(usuario_id)["nombre"] == "Ana María"
+    assert usuario_repo.lecturas == 2
+
+
+def test_rollback_invalida_el_perfil_leido_en_la_transaccion(database_client, usuario_repo):
+    usuario_id = crear_usuario(database_client, "Ana")
+
+    with pytest.raises(RuntimeError):
+        with UnitOfWork(database_client):
+            usuario_repo.actualizar(usuario_id, _perfil("Sin confirmar"))
+            # La lectura dentro de la transacción cachea el valor sin confirmar
+            assert usuario_repo.obtener_por_id(usuario_id)["nombre"] == "Sin confirmar"
+            raise RuntimeError("se revierte")
+
+    assert usuario_repo.obtener_por_id(usuario_id)["nombre"] == "Ana"
@@ -0,0 +1,84 @@
+"""Archivado de partidos terminados en las tablas frías"""
+from datetime import datetime, timedelta
+
+from sqlalchemy import text
+
+from app.infra.database.ciclo_partidos import CicloPartidos
+from app.infra.database.repositories.partidos import PartidoRepository
+from tests.datos import crear_usuario, datos_partido
+
+TABLAS = ("partidos", "participaciones", "invitaciones", "calificaciones")
+
+
+def _contar(database_client, tabla: str) -> int:
+    with database_client.get_session("tt") as sesion:
+        return sesion.execute(text(f"SELECT COUNT(*) FROM {tabla}")).scalar()
+
+
+def _crear_partido_jugado(database_client, partido_repo, organizador_id: int, jugador_id: int, hace_dias: int) -> int:
+    """Partido Finalizado hace hace_dias con una participación, una invitación y una calificación"""
+    partido_id = partido_repo.crear(datos_partido(
+        organizador_id,
+        estado="Finalizado",
+        fecha_hora=datetime.now() - timedelta(days=hace_dias),
+    ))["id"]
+    with database_client.get_session("tt") as sesion:
+        sesion.execute(
+            text("INSERT INTO participaciones (partido_id, jugador_id, estado) VALUES (:p, :j, 'Confirmado')"),
+            {"p": partido_id, "j": jugador_id},
+        )
+        sesion.execute(
+            text(
+                """
+                INSERT INTO invitaciones (partido_id, jugador_id, estado, fecha_respuesta)
+                VALUES (:p, :j, 'Aceptada', CURRENT_TIMESTAMP)
+                """
+            ),
+            {"p": partido_id, "j": jugador_id},
+        )
+        sesion.execute(
+            text(
+                """
+                INSERT INTO calificaciones (partido_id, calificador_id, calificado_id, puntuacion)
+                VALUES (:p, :o, :j, 5)
+                """
+            ),
+            {"p": partido_id, "o": organizador_id, "j": jugador_id},
+        )
+        sesion.commit()
+    return partido_id
+
+
+def test_archivar_copia_las_invitaciones_antes_de_borrar(database_client):
+    partido_repo = PartidoRepository(database_client)
+    organizador_id = crear_usuario(database_client, "Organizador")
+    jugador_id = crear_usuario(database_client, "Invitado")
+    viejo = _crear_partido_jugado(database_client, partido_repo, organizador_id, jugador_id, hace_dias=40)
+    _crear_partido_jugado(database_client, partido_repo, organizador_id, jugador_id, hace_dias=5)
+
+    archivadas = partido_repo.archivar(datetime.now() - timedelta(days=30))
+
+    assert archivadas == {"partidos": 1, "participaciones": 1, "invitaciones": 1, "calificaciones": 1}
+    for tabla in TABLAS:
+        assert _contar(database_client, f"{tabla}_archivo") == 1
+        assert _contar(database_client, tabla) == 1
+
+    with database_client.get_session("tt") as sesion:
+        invitacion = sesion.execute(
+            text("SELECT partido_id, jugador_id, estado, fecha_respuesta FROM invitaciones_archivo")
+        ).fetchone()
+    assert (invitacion.partido_id, invitacion.jugador_id, invitacion.estado) == (viejo, jugador_id, "Aceptada")
+    assert invitacion.fecha_respuesta is not None
+
+
+def test_ciclo_acumula_las_invitaciones_archivadas(database_client):
+    partido_repo = PartidoRepository(database_client)
+    organizador_id = crear_usuario(database_client, "Organizador")
+    jugador_id = crear_usuario(database_client, "Invitado")
+    for _ in range(3):
+        _crear_partido_jugado(database_client, partido_repo, organizador_id, jugador_id, hace_dias=40)
+
+    archivadas = CicloPartidos(partido_repo, lote=2).archivar(datetime.now() - timedelta(days=30))
+
+    assert archivadas == {"partidos": 3, "participaciones": 3, "invitaciones": 3, "calificaciones": 3}
+    assert _contar(database_client, "invitaciones") == 0
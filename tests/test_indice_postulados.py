@@ -0,0 +1,43 @@
+"""Índice en memoria de jugadores postulados (indice_postulados)"""
+import pytest
+from sqlalchemy import text
+
+from app.infra.database.repositories.usuarios import UsuarioRepository, indice_postulados
+from tests.conftest import ConReplicaAtrasada, crear_esquema
+from tests.datos import crear_usuario
+
+
+@pytest.fixture
+def database_client(tmp_path):
+    cliente = crear_esquema(ConReplicaAtrasada(str(tmp_path / "mefaltauno.db")))
+    yield cliente
+    cliente.get_engine("tt").dispose()
+
+
+def _postular(database_client, usuario_id: int) -> None:
+    with database_client.get_session("tt") as sesion:
+        sesion.execute(text("UPDATE usuarios SET postulado = 1 WHERE id = :id"), {"id": usuario_id})
+        sesion.commit()
+
+
+def test_indice_se_recarga_del_primario(database_client):
+    usuario_repo = UsuarioRepository(database_client)
+    postulado_id = crear_usuario(database_client, "Postulado")
+    crear_usuario(database_client, "Sin postular")
+    _postular(database_client, postulado_id)
+
+    cercanos = usuario_repo.buscar_postulados_cercanos(-34.6037, -58.3816, 5)
+
+    assert list(cercanos) == [postulado_id]
+    assert indice_postulados.cargado
+
+
+def test_indice_vencido_ve_las_postulaciones_nuevas(database_client):
+    usuario_repo = UsuarioRepository(database_client)
+    usuario_id = crear_usuario(database_client)
+    assert usuario_repo.buscar_postulados_cercanos(-34.6037, -58.3816, 5) == {}
+
+    _postular(database_client, usuario_id)
+    indice_postulados.invalidar()
+
+    assert list(usuario_repo.buscar_postulados_cercanos(-34.6037, -58.3816, 5)) == [usuario_id]
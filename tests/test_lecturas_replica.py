@@ -0,0 +1,88 @@
+"""Vistas propias de un usuario: read-your-writes entre requests con réplicas"""
+from datetime import datetime, timedelta
+from types import SimpleNamespace
+
+import pytest
+
+from app.infra.cache import cache_service
+from app.infra.cache.cache import cache_escrituras_usuario
+from app.infra.database.repositories.participaciones import ParticipacionRepository
+from app.infra.database.repositories.partidos import PartidoRepository
+from tests.conftest import SqliteConnection, crear_esquema
+from tests.datos import crear_usuario, datos_partido
+
+
+class ConReplicaSinReplicar(SqliteConnection):
+    """Conexión cuya réplica es otra base con el esquema pero sin los cambios del primario"""
+
+    def __init__(self, ruta: str, ruta_replica: str):
+        super().__init__(ruta)
+        self.replica = crear_esquema(SqliteConnection(ruta_replica))
+
+    def get_read_session(self, key):
+        session = self.replica.get_session(key)
+        session.info["replica"] = (key, 0)
+        return session
+
+    def replicas_disponibles(self, key) -> int:
+        return 1
+
+
+@pytest.fixture
+def database_client(tmp_path):
+    cliente = crear_esquema(
+        ConReplicaSinReplicar(str(tmp_path / "primario.db"), str(tmp_path / "replica.db"))
+    )
+    yield cliente
+    cliente.get_engine("tt").dispose()
+    cliente.replica.get_engine("tt").dispose()
+
+
+def _calendario(partido_repo, usuario_id):
+    ahora = datetime.now()
+    return partido_repo.obtener_calendario(usuario_id, ahora, ahora + timedelta(days=7))
+
+
+def test_calendario_lee_del_primario_tras_una_aprobacion(database_client):
+    partido_repo = PartidoRepository(database_client)
+    participacion_repo = ParticipacionRepository(database_client)
+    organizador_id = crear_usuario(database_client, "Organizador")
+    jugador_id = crear_usuario(database_client, "Jugador")
+    partido_id = partido_repo.crear(datos_partido(organizador_id))["id"]
+    participacion_id = participacion_repo.crear({
+        "partido_id": partido_id,
+        "jugador_id": jugador_id,
+        "estado": "Pendiente",
+        "fecha_postulacion": datetime.now(),
+    })["id"]
+    cache_escrituras_usuario.invalidar(jugador_id)
+
+    # Sin escrituras recientes el calendario sale de la réplica (atrasada)
+    assert _calendario(partido_repo, jugador_id) == []
+
+    # El organizador lo aprueba en su request; el siguiente request del jugador ve el partido
+    participacion_repo.actualizar(participacion_id, {"estado": "Confirmado"})
+
+    assert [p["id"] for p in _calendario(partido_repo, jugador_id)] == [partido_id]
+
+
+def test_marca_de_escritura_vence_con_el_retraso_de_la_replica(database_client, monkeypatch):
+    reloj = SimpleNamespace(ahora=1000.0)
+    monkeypatch.setattr(cache_service, "time", SimpleNamespace(monotonic=lambda: reloj.ahora))
+
+    partido_repo = PartidoRepository(database_client)
+    participacion_repo = ParticipacionRepository(database_client)
+    organizador_id = crear_usuario(database_client, "Organizador")
+    partido_id = partido_repo.crear(datos_partido(organizador_id))["id"]
+    participacion_repo.crear({
+        "partido_id": partido_id,
+        "jugador_id": organizador_id,
+        "estado": "Confirmado",
+        "fecha_postulacion": datetime.now(),
+    })
+    assert [p["id"] for p in _calendario(partido_repo, organizador_id)] == [partido_id]
+
+    # Pasado el retraso máximo la marca vence y se vuelve a leer de la réplica
+    reloj.ahora += cache_escrituras_usuario.ttl
+
+    assert _calendario(partido_repo, organizador_id) == []
@@ -0,0 +1,130 @@
+"""Reserva de cupo concurrente: los confirmados nunca superan la capacidad del partido"""
+import threading
+from datetime import datetime
+
+from sqlalchemy import text
+
+from app.domain.exceptions import PartidoCompletoException
+from app.infra.database.repositories.participaciones import ParticipacionRepository
+from app.infra.database.repositories.partidos import PartidoRepository
+from tests.datos import crear_usuario, datos_partido
+
+CAPACIDAD = 3
+
+
+def _en_paralelo(tareas):
+    """Lanza las tareas a la vez y devuelve (exitos, errores)"""
+    barrera = threading.Barrier(len(tareas))
+    exitos, errores = [], []
+    candado = threading.Lock()
+
+    def correr(tarea):
+        barrera.wait()
+        try:
+            tarea()
+        except Exception as exc:  # noqa: BLE001 - se verifica el tipo en el test
+            with candado:
+                errores.append(exc)
+        else:
+            with candado:
+                exitos.append(tarea)
+
+    hilos = [threading.Thread(target=correr, args=(tarea,)) for tarea in tareas]
+    for hilo in hilos:
+        hilo.start()
+    for hilo in hilos:
+        hilo.join()
+    return exitos, errores
+
+
+def _estado_partido(database_client, partido_id: int):
+    """Devuelve (contador confirmados, confirmados reales, contador pendientes, pendientes reales)"""
+    with database_client.get_session("tt") as sesion:
+        return sesion.execute(
+            text(
+                """
+                SELECT
+                    p.confirmados,
+                    (SELECT COUNT(*) FROM participaciones WHERE partido_id = p.id AND estado = 'Confirmado'),
+                    p.pendientes,
+                    (SELECT COUNT(*) FROM participaciones WHERE partido_id = p.id AND estado = 'Pendiente')
+                FROM partidos p
+                WHERE p.id = :id
+                """
+            ),
+            {"id": partido_id},
+        ).fetchone()
+
+
+def test_crear_y_actualizar_concurrentes_respetan_la_capacidad(database_client):
+    partido_repo = PartidoRepository(database_client)
+    participacion_repo = ParticipacionRepository(database_client)
+
+    organizador_id = crear_usuario(database_client, "Organizador")
+    partido_id = partido_repo.crear(datos_partido(organizador_id, capacidad_maxima=CAPACIDAD))["id"]
+
+    # Postulaciones pendientes que luego se intentan confirmar todas a la vez
+    pendientes = [
+        participacion_repo.crear({
+            "partido_id": partido_id,
+            "jugador_id": crear_usuario(database_client, f"Pendiente {numero}"),
+            "estado": "Pendiente",
+            "fecha_postulacion": datetime.now(),
+        })["id"]
+        for numero in range(6)
+    ]
+    nuevos = [crear_usuario(database_client, f"Nuevo {numero}") for numero in range(6)]
+
+    tareas = [
+        (lambda pid=participacion_id: participacion_repo.actualizar(pid, {"estado": "Confirmado"}))
+        for participacion_id in pendientes
+    ] + [
+        (lambda jid=jugador_id: participacion_repo.crear({
+            "partido_id": partido_id,
+            "jugador_id": jid,
+            "estado": "Confirmado",
+            "fecha_postulacion": datetime.now(),
+        }))
+        for jugador_id in nuevos
+    ]
+
+    exitos, errores = _en_paralelo(tareas)
+
+    assert len(exitos) == CAPACIDAD
+    assert len(errores) == len(tareas) - CAPACIDAD
+    assert all(isinstance(error, PartidoCompletoException) for error in errores), errores
+
+    confirmados, confirmados_reales, pendientes_contador, pendientes_reales = _estado_partido(
+        database_client, partido_id
+    )
+    assert confirmados == confirmados_reales == CAPACIDAD
+    assert pendientes_contador == pendientes_reales
+
+
+def test_postulacion_pendiente_rechazada_con_partido_completo(database_client):
+    partido_repo = PartidoRepository(database_client)
+    participacion_repo = ParticipacionRepository(database_client)
+
+    organizador_id = crear_usuario(database_client, "Organizador")
+    partido_id = partido_repo.crear(datos_partido(organizador_id, capacidad_maxima=1))["id"]
+    participacion_repo.crear({
+        "partido_id": partido_id,
+        "jugador_id": crear_usuario(database_client),
+        "estado": "Confirmado",
+        "fecha_postulacion": datetime.now(),
+    })
+
+    exitos, errores = _en_paralelo([
+        (lambda jid=jugador_id: participacion_repo.crear({
+            "partido_id": partido_id,
+            "jugador_id": jid,
+            "estado": "Pendiente",
+            "fecha_postulacion": datetime.now(),
+        }))
+        for jugador_id in [crear_usuario(database_client, f"Tarde {numero}") for numero in range(4)]
+    ])
+
+    assert not exitos
+    assert len(errores) == 4
+    assert all(isinstance(error, PartidoCompletoException) for error in errores), errores
+    assert tuple(_estado_partido(database_client, partido_id)) == (1, 1, 0, 0)
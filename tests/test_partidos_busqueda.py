@@ -0,0 +1,58 @@
+"""Búsqueda de partidos por distancia paginada con cursor"""
+from datetime import datetime
+
+from app.domain.services.service_delegator import ServiceDelegator
+from app.infra.cache.cache import cache_usuarios
+from tests.datos import crear_usuario, datos_partido
+
+LATITUD = -34.6037
+LONGITUD = -58.3816
+
+
+def test_paginas_por_distancia_sin_los_partidos_propios(database_client):
+    partido_service = ServiceDelegator(database_client).get_partido_service()
+    organizador_id = crear_usuario(database_client, "Organizador")
+    usuario_id = crear_usuario(database_client, "Buscador")
+    cache_usuarios.obtener(usuario_id, lambda: {"id": usuario_id, "latitud": LATITUD, "longitud": LONGITUD})
+
+    # Partidos cada ~550 m hacia el sur; el usuario ya participa en el 1.º y el 3.º
+    partidos = [
+        partido_service.partido_repo.crear(
+            datos_partido(organizador_id, titulo=f"Partido {numero}", latitud=LATITUD - numero * 0.005)
+        )["id"]
+        for numero in range(7)
+    ]
+    for partido_id in (partidos[0], partidos[2]):
+        partido_service.participacion_repo.crear({
+            "partido_id": partido_id,
+            "jugador_id": usuario_id,
+            "estado": "Pendiente",
+            "fecha_postulacion": datetime.now(),
+        })
+
+    # SQLite devuelve los DATETIME como texto; MySQL como datetime
+    obtener_por_celdas = partido_service.partido_repo.obtener_por_celdas
+    partido_service.partido_repo.obtener_por_celdas = lambda celdas: [
+        {**partido, "fecha_hora": datetime.fromisoformat(partido["fecha_hora"])}
+        for partido in obtener_por_celdas(celdas)
+    ]
+
+    consultados = []
+    obtener_partidos_activos = partido_service.participacion_repo.obtener_partidos_activos
+
+    def espiar(jugador_id, partido_ids):
+        consultados.append(len(partido_ids))
+        return obtener_partidos_activos(jugador_id, partido_ids)
+
+    partido_service.participacion_repo.obtener_partidos_activos = espiar
+
+    encontrados, cursor = [], None
+    while True:
+        pagina, cursor = partido_service.buscar(usuario_id, cursor=cursor, limite=2)
+        encontrados.extend(partido["id"] for partido in pagina)
+        if cursor is None:
+            break
+
+    assert encontrados == [partidos[1]] + partidos[3:]
+    # Cada página revisa solo los más cercanos que necesita, no todo el radio
+    assert max(consultados) <= 3
@@ -0,0 +1,116 @@
+"""Snapshot de búsqueda por celda de geohash (cache_partidos_celda)"""
+from datetime import datetime
+
+import pytest
+
+from app.infra.cache.cache import cache_partidos_celda
+from app.infra.database.repositories.participaciones import ParticipacionRepository
+from app.infra.database.repositories.partidos import PartidoRepository, celdas_partido
+from app.infra.database.unit_of_work import UnitOfWork
+from tests.conftest import ConReplicaAtrasada, crear_esquema
+from tests.datos import crear_usuario, datos_partido
+
+
+@pytest.fixture
+def database_client(tmp_path):
+    cliente = crear_esquema(ConReplicaAtrasada(str(tmp_path / "mefaltauno.db")))
+    yield cliente
+    cliente.get_engine("tt").dispose()
+
+
+@pytest.fixture
+def partido_repo(database_client):
+    return PartidoRepository(database_client)
+
+
+def test_snapshot_se_carga_del_primario(database_client, partido_repo):
+    organizador_id = crear_usuario(database_client)
+    partido = partido_repo.crear(datos_partido(organizador_id))
+    celdas = celdas_partido(partido["latitud"], partido["longitud"])
+
+    encontrados = partido_repo.obtener_por_celdas(celdas)
+
+    assert [p["id"] for p in encontrados] == [partido["id"]] * len(celdas)
+    assert cache_partidos_celda.misses == len(celdas)
+
+
+def test_snapshot_se_invalida_al_modificar_el_partido(database_client, partido_repo):
+    organizador_id = crear_usuario(database_client)
+    partido = partido_repo.crear(datos_partido(organizador_id, titulo="Antes"))
+    celda = min(celdas_partido(partido["latitud"], partido["longitud"]), key=len)
+
+    assert [p["titulo"] for p in partido_repo.obtener_por_celdas([celda])] == ["Antes"]
+    assert [p["titulo"] for p in partido_repo.obtener_por_celdas([celda])] == ["Antes"]
+    assert cache_partidos_celda.hits == 1
+
+    partido_repo.actualizar(partido["id"], {**partido, "titulo": "Después"})
+
+    assert [p["titulo"] for p in partido_repo.obtener_por_celdas([celda])] == ["Después"]
+
+
+def _postular(participacion_repo, partido_id: int, jugador_id: int, estado: str) -> int:
+    return participacion_repo.crear({
+        "partido_id": partido_id,
+        "jugador_id": jugador_id,
+        "estado": estado,
+        "fecha_postulacion": datetime.now(),
+    })["id"]
+
+
+def test_snapshot_se_actualiza_en_su_lugar_al_cambiar_confirmados(database_client, partido_repo):
+    participacion_repo = ParticipacionRepository(database_client)
+    organizador_id = crear_usuario(database_client, "Organizador")
+    partido = partido_repo.crear(datos_partido(organizador_id, capacidad_maxima=2))
+    otro = partido_repo.crear(datos_partido(organizador_id, titulo="Otro"))
+    celdas = celdas_partido(partido["latitud"], partido["longitud"])
+
+    def confirmados_cacheados():
+        return {
+            p["id"]: p["jugadores_confirmados"]
+            for p in partido_repo.obtener_por_celdas(celdas)
+        }
+
+    assert confirmados_cacheados() == {partido["id"]: 0, otro["id"]: 0}
+    cargas = cache_partidos_celda.misses
+
+    # Una aprobación actualiza el contador en las celdas cacheadas, sin recargarlas
+    pendiente_id = _postular(participacion_repo, partido["id"], crear_usuario(database_client), "Pendiente")
+    participacion_repo.actualizar(pendiente_id, {"estado": "Confirmado"})
+    assert confirmados_cacheados() == {partido["id"]: 1, otro["id"]: 0}
+
+    # Al llenarse el partido sale del snapshot, también sin recargar
+    confirmado_id = _postular(participacion_repo, partido["id"], crear_usuario(database_client), "Confirmado")
+    assert confirmados_cacheados() == {otro["id"]: 0}
+    assert cache_partidos_celda.misses == cargas
+
+    # Si vuelve a tener cupo no está en el snapshot: las celdas se recargan
+    participacion_repo.actualizar(confirmado_id, {"estado": "Cancelado"})
+    assert confirmados_cacheados() == {partido["id"]: 1, otro["id"]: 0}
+    assert cache_partidos_celda.misses == cargas + len(celdas)
+
+
+def test_snapshot_no_cambia_si_la_transaccion_se_revierte(database_client, partido_repo):
+    participacion_repo = ParticipacionRepository(database_client)
+    organizador_id = crear_usuario(database_client, "Organizador")
+    partido = partido_repo.crear(datos_partido(organizador_id))
+    celda = min(celdas_partido(partido["latitud"], partido["longitud"]), key=len)
+    partido_repo.obtener_por_celdas([celda])
+
+    with pytest.raises(RuntimeError):
+        with UnitOfWork(database_client):
+            _postular(participacion_repo, partido["id"], crear_usuario(database_client), "Confirmado")
+            raise RuntimeError("se revierte")
+
+    assert [p["jugadores_confirmados"] for p in partido_repo.obtener_por_celdas([celda])] == [0]
+
+
+def test_snapshot_se_invalida_al_eliminar_en_lote(database_client, partido_repo):
+    organizador_id = crear_usuario(database_client)
+    borrado = partido_repo.crear(datos_partido(organizador_id, titulo="Borrado"))
+    queda = partido_repo.crear(datos_partido(organizador_id, titulo="Queda"))
+    celda = min(celdas_partido(borrado["latitud"], borrado["longitud"]), key=len)
+    assert len(partido_repo.obtener_por_celdas([celda])) == 2
+
+    partido_repo.eliminar_lote([borrado["id"]], organizador_id=organizador_id)
+
+    assert [p["id"] for p in partido_repo.obtener_por_celdas([celda])] == [queda["id"]]
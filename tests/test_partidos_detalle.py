@@ -0,0 +1,82 @@
+"""Cantidad de sentencias SQL por vista de detalle de partido"""
+from contextlib import contextmanager
+from typing import Iterator, List
+
+import pytest
+from sqlalchemy import event, text
+
+from app.domain.exceptions import PartidoNoEncontradoException
+from app.domain.services.service_delegator import ServiceDelegator
+from app.infra.cache.cache import cache_usuarios
+from tests.datos import crear_usuario, datos_partido
+
+
+@contextmanager
+def contar_sentencias(database_client) -> Iterator[List[str]]:
+    """Registra las sentencias ejecutadas sobre el engine mientras dura el bloque"""
+    sentencias: List[str] = []
+    engine = database_client.get_engine("tt")
+
+    def registrar(conexion, cursor, sql, params, context, executemany):
+        # El BEGIN IMMEDIATE de la fixture es control de transacción, no una consulta
+        if not sql.lstrip().upper().startswith("BEGIN"):
+            sentencias.append(sql)
+
+    event.listen(engine, "before_cursor_execute", registrar)
+    try:
+        yield sentencias
+    finally:
+        event.remove(engine, "before_cursor_execute", registrar)
+
+
+def _preparar_partido(database_client, jugadores: int):
+    """Crea un partido con jugadores confirmados y pendientes; devuelve (servicio, partido_id, usuario_id)"""
+    partido_service = ServiceDelegator(database_client).get_partido_service()
+    organizador_id = crear_usuario(database_client, "Organizador")
+    partido = partido_service.partido_repo.crear(datos_partido(organizador_id, capacidad_maxima=22))
+
+    with database_client.get_session("tt") as sesion:
+        for numero in range(jugadores):
+            jugador_id = sesion.execute(
+                text(
+                    """
+                    INSERT INTO usuarios (nombre, fecha_nacimiento, latitud, longitud, ubicacion_texto, genero, posicion)
+                    VALUES (:nombre, '1995-01-01', 0, 0, 'x', 'Otro', 'Defensa')
+                    """
+                ),
+                {"nombre": f"Jugador {numero}"},
+            ).lastrowid
+            sesion.execute(
+                text("INSERT INTO participaciones (partido_id, jugador_id, estado) VALUES (:p, :j, :e)"),
+                {"p": partido["id"], "j": jugador_id, "e": "Confirmado" if numero % 2 else "Pendiente"},
+            )
+        sesion.commit()
+
+    # El usuario que consulta ya está en cache_usuarios, como en un request típico
+    cache_usuarios.obtener(organizador_id, lambda: {"id": organizador_id})
+    return partido_service, partido["id"], organizador_id
+
+
+@pytest.mark.parametrize("jugadores", [0, 1, 15])
+def test_detalle_ejecuta_dos_sentencias(database_client, jugadores):
+    partido_service, partido_id, usuario_id = _preparar_partido(database_client, jugadores)
+
+    with contar_sentencias(database_client) as sentencias:
+        detalle = partido_service.obtener_detalle(partido_id, usuario_id)
+
+    # Partido + organizador en una, participantes en otra, sin importar cuántos sean
+    assert len(sentencias) == 2, sentencias
+    assert len(detalle["participantes"]) == jugadores
+    assert detalle["jugadores_confirmados"] == jugadores // 2
+    assert detalle["jugadores_pendientes"] == jugadores - jugadores // 2
+    assert detalle["organizador_nombre"] == "Organizador"
+
+
+def test_detalle_partido_inexistente_ejecuta_una_sentencia(database_client):
+    partido_service, _, usuario_id = _preparar_partido(database_client, 0)
+
+    with contar_sentencias(database_client) as sentencias:
+        with pytest.raises(PartidoNoEncontradoException):
+            partido_service.obtener_detalle(999, usuario_id)
+
+    assert len(sentencias) == 1
@@ -0,0 +1,27 @@
+"""Repositorios asíncronos sobre aiosqlite (AioSqliteConnection + AsyncRepository)"""
+import asyncio
+
+from app.infra.database.database_service import AioSqliteConnection
+from app.infra.database.repositories.asincronos import AsyncPartidoRepository
+from app.infra.database.repositories.partidos import PartidoRepository
+from tests.datos import crear_usuario, datos_partido
+
+
+def test_crear_y_obtener_partido_con_driver_asincrono(database_client, tmp_path):
+    organizador_id = crear_usuario(database_client)
+    cliente_asincrono = AioSqliteConnection({"tt": str(tmp_path / "mefaltauno.db")})
+    partido_repo = AsyncPartidoRepository(cliente_asincrono)
+
+    async def crear_y_obtener():
+        try:
+            partido = await partido_repo.crear(datos_partido(organizador_id, titulo="Asincrónico"))
+            return partido, await partido_repo.obtener_por_id(partido["id"])
+        finally:
+            await cliente_asincrono.get_engine("tt").dispose()
+
+    partido, obtenido = asyncio.run(crear_y_obtener())
+
+    assert obtenido["titulo"] == "Asincrónico"
+    assert obtenido["organizador_id"] == organizador_id
+    # La unidad de trabajo de la llamada confirmó: se ve desde otra conexión
+    assert PartidoRepository(database_client).obtener_por_id(partido["id"])["titulo"] == "Asincrónico"
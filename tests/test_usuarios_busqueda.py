@@ -0,0 +1,14 @@
+"""Validación del cursor en la búsqueda de jugadores disponibles"""
+import pytest
+
+from app.domain import error_messages as msg
+from app.domain.services.service_delegator import ServiceDelegator
+from app.utils.paginacion import codificar_cursor
+
+
+@pytest.mark.parametrize("valores", [("lejos", 3), (1.5, "siete"), (None, 3), ([1], 2)])
+def test_cursor_con_valores_invalidos(database_client, valores):
+    usuario_service = ServiceDelegator(database_client).get_usuario_service()
+
+    with pytest.raises(ValueError, match=msg.CURSOR_INVALIDO):
+        usuario_service.buscar_jugadores_disponibles(1, cursor=codificar_cursor(*valores))